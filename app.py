@@ -4,24 +4,48 @@ Main Flask application for the CONTRA Data-Driven Art Generator & Visual Storyte
 
 import os
 import logging
+import functools
+import hashlib
+import hmac
+import json
 import time
 import re
-from flask import Flask, Blueprint, request, jsonify, render_template, send_from_directory, abort
+import traceback
+from flask import Flask, Blueprint, Response, request, jsonify, render_template, send_from_directory, abort, stream_with_context
 from flask_cors import CORS
-from werkzeug.exceptions import HTTPException
-import json
+from pydantic import ValidationError
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import HTTPException, NotFound
+from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
-from config import FlaskConfig, BASE_DIR, APIConfig, ContentConfig, IMAGE_CACHE_DIR
-from models.data_model import GenerationResult, TopicData, WikipediaData, DBpediaData, NewsArticle, Image, Narrative, Visualization
-from core.data_fetcher import data_fetcher
-from core.narrative_generator import narrative_generator
-from core.image_generator import image_generator
-from core.visualizer import visualizer
-from utils.validators import validate_input, validate_topic
-from utils.helpers import format_time_elapsed
+from config import FlaskConfig, BASE_DIR, APIConfig, CacheConfig, ContentConfig, IMAGE_CACHE_DIR, DATA_CACHE_DIR
+from models.data_model import GenerationResult, TopicData, WikipediaData, DBpediaData, NewsArticle, Image, Narrative, Visualization, EMPTY_DBPEDIA
+from utils.validators import validate_input, validate_topic, sanitize_conversation_history, clamp_temperature, GenerateRequest
+from utils.helpers import format_time_elapsed, topic_file_prefix
+from utils.cache import LRUCache
 from utils.api_status import get_all_api_statuses
+from utils.metrics import fetch_latency, generation_latency
 from utils.text_formatter import correct_spelling, format_title
 
+try:
+    import orjson
+except ImportError:
+    # Fall back to Flask's stdlib-based JSON encoding
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    # Responses are sent uncompressed
+    Compress = None
+
+try:
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+except ImportError:
+    # Latencies are only reported through /api/health
+    generate_latest = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,112 +58,303 @@ if stability_key:
 else:
     logger.warning("No Stability API Key found in environment")
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses and parses request bodies with orjson when it is installed."""
+    
+    sort_keys = False
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        # Hand orjson's UTF-8 bytes straight to the response body
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype
+        )
+
+# The core services pull in heavy dependencies (plotly, PIL, API clients), so they
+# are imported on first use instead of when the app module is loaded
+@functools.lru_cache(maxsize=None)
+def _get_data_fetcher():
+    """Return the data fetcher singleton, importing it on first use."""
+    from core.data_fetcher import data_fetcher
+    return data_fetcher
+
+@functools.lru_cache(maxsize=None)
+def _get_narrative_generator():
+    """Return the narrative generator singleton, importing it on first use."""
+    from core.narrative_generator import narrative_generator
+    return narrative_generator
+
+@functools.lru_cache(maxsize=None)
+def _get_image_generator():
+    """Return the image generator singleton, importing it on first use."""
+    from core.image_generator import image_generator
+    return image_generator
+
+@functools.lru_cache(maxsize=None)
+def _get_visualizer():
+    """Return the visualizer singleton, importing it on first use."""
+    from core.visualizer import visualizer
+    return visualizer
+
+# Shared pool for /generate background steps, bounding how many run at once across requests
+_PIPELINE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=FlaskConfig.PIPELINE_MAX_WORKERS,
+    thread_name_prefix='generate'
+)
+
+# Recent /conversation answers keyed by topic, question, tone, temperature and history
+_conversation_cache = LRUCache(
+    maxsize=CacheConfig.MAX_DATA_CACHE_SIZE,
+    timeout=CacheConfig.CACHE_TIMEOUT
+)
+
+def _conversation_cache_key(
+    topic: str,
+    question: str,
+    tone: str,
+    temperature: float,
+    conversation_history: list
+) -> bytes:
+    """Build the response cache key for a conversation request."""
+    history = json.dumps(conversation_history, sort_keys=True)
+    payload = f"{topic}|{question}|{tone}|{round(temperature, 2)}|{history}"
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
 # Create API blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# URLs under the API blueprint get JSON errors even when no API route matched
+_API_PREFIX = api_bp.url_prefix + '/'
+
 # Create static file blueprint for serving generated images
 images_bp = Blueprint('images', __name__, url_prefix='/images')
 
+# Characters replaced when deriving a topic identifier from a topic string
+_TOPIC_SANITIZE = re.compile(r'[^a-zA-Z0-9]')
+
+@functools.lru_cache(maxsize=4096)
+def _topic_prefix(topic_id: str) -> str:
+    """Return the image filename prefix for a topic_id, ignoring the timestamp suffix."""
+    return topic_file_prefix(topic_id)
+
+# Static assets directory
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+
+# Static image assets served by the images blueprint
+STATIC_IMG_DIR = os.path.join(STATIC_DIR, 'img')
+FALLBACK_PATH = os.path.join(STATIC_IMG_DIR, 'fallback.jpg')
+PLACEHOLDER_PATH = os.path.join(STATIC_IMG_DIR, 'image_placeholder.png')
+_STATIC_IMAGE_NAMES = frozenset({'fallback.jpg', 'image_placeholder.png'})
+_FALLBACK_BYTES: Optional[bytes] = None
+_FALLBACK_ETAG = ""
+_HAS_PLACEHOLDER = False
+
+def _refresh_static_assets():
+    """Reload the fallback image and re-check the placeholder (called after they are created)."""
+    global _FALLBACK_BYTES, _FALLBACK_ETAG, _HAS_PLACEHOLDER
+    try:
+        with open(FALLBACK_PATH, 'rb') as f:
+            _FALLBACK_BYTES = f.read()
+        _FALLBACK_ETAG = hashlib.blake2b(_FALLBACK_BYTES, digest_size=16).hexdigest()
+    except OSError:
+        _FALLBACK_BYTES = None
+    _HAS_PLACEHOLDER = os.path.exists(PLACEHOLDER_PATH)
+
+_refresh_static_assets()
+
+def _serve_fallback() -> Response:
+    """Serve the fallback image from memory."""
+    response = Response(_FALLBACK_BYTES, mimetype='image/jpeg')
+    response.set_etag(_FALLBACK_ETAG)
+    return response.make_conditional(request)
+
+def _send_cached_image(filename: str):
+    """Send an image from the cache directory, falling back when it is missing."""
+    try:
+        response = send_from_directory(
+            IMAGE_CACHE_DIR, filename, conditional=True, max_age=CacheConfig.IMAGE_HTTP_MAX_AGE
+        )
+    except NotFound:
+        logger.warning(f"Requested image not found: {filename}")
+        # Return fallback image instead of 404
+        if _FALLBACK_BYTES is not None:
+            return _serve_fallback()
+        return jsonify({
+            "success": False,
+            "error": "Image not found",
+            "details": f"The requested image {filename} does not exist"
+        }), 404
+    
+    # Regenerating with overwrite_cache reuses the same filename, so clients
+    # revalidate against the ETag once max-age runs out
+    response.headers['Cache-Control'] = f"public, max-age={CacheConfig.IMAGE_HTTP_MAX_AGE}"
+    return response
+
 @images_bp.route('/<path:filename>')
 def serve_image(filename):
     """Serve generated images from cache directory."""
     try:
         # Get the topic ID from the query string if provided
         topic_id = request.args.get('topic_id', '')
-        logger.info(f"Serving image {filename} with topic_id: {topic_id}")
-        
-        # Check for fallback image first
-        if filename == 'fallback.jpg':
-            fallback_path = os.path.join(BASE_DIR, 'static', 'img', 'fallback.jpg')
-            if os.path.exists(fallback_path):
-                logger.info("Serving fallback image from static/img")
-                return send_from_directory(os.path.join(BASE_DIR, 'static', 'img'), 'fallback.jpg')
-        
-        # Check for image_placeholder.png
-        if filename == 'image_placeholder.png':
-            placeholder_path = os.path.join(BASE_DIR, 'static', 'img', 'image_placeholder.png')
-            if os.path.exists(placeholder_path):
-                return send_from_directory(os.path.join(BASE_DIR, 'static', 'img'), 'image_placeholder.png')
-        
-        # Ensure the image cache directory exists
-        if not os.path.exists(IMAGE_CACHE_DIR):
-            os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
-            logger.warning(f"Created missing image cache directory: {IMAGE_CACHE_DIR}")
-            
-        # Check if the requested file exists
-        file_path = os.path.join(IMAGE_CACHE_DIR, filename)
-        logger.info(f"Looking for image at path: {file_path}")
-        
-        if not os.path.exists(file_path):
-            logger.warning(f"Requested image not found: {filename}")
-            # Return fallback image instead of 404
-            fallback_path = os.path.join(BASE_DIR, 'static', 'img', 'fallback.jpg')
-            if os.path.exists(fallback_path):
-                return send_from_directory(os.path.join(BASE_DIR, 'static', 'img'), 'fallback.jpg')
-            else:
-                # Return 404 - Image Not Found
-                return jsonify({
-                    "success": False,
-                    "error": "Image not found",
-                    "details": f"The requested image {filename} does not exist"
-                }), 404
+        logger.debug("Serving image %s with topic_id: %s", filename, topic_id)
         
-        # If topic_id is provided but empty, still serve the image (don't filter by topic)
-        if not topic_id:
-            logger.info(f"No topic_id provided, serving image directly: {filename}")
-            return send_from_directory(IMAGE_CACHE_DIR, filename)
+        # Hot path: a generated image from the cache directory
+        if filename not in _STATIC_IMAGE_NAMES:
+            # Generated images carry their topic prefix in the filename, so a
+            # mismatch is detected without reading the metadata sidecar
+            if topic_id and not filename.startswith(_topic_prefix(topic_id)):
+                # Mismatches are logged but the image is still served
+                logger.warning(f"Topic mismatch: {filename} vs {topic_id}")
+            return _send_cached_image(filename)
         
-        # If topic_id is provided, verify this image belongs to that topic
-        # Find the metadata file for this image
-        meta_filename = filename.replace('.png', '.json')
-        if not meta_filename.endswith('.json'):
-            meta_filename += '.json'
+        # Well-known static assets are checked once at startup
+        if filename == 'fallback.jpg' and _FALLBACK_BYTES is not None:
+            return _serve_fallback()
+        if filename == 'image_placeholder.png' and _HAS_PLACEHOLDER:
+            return send_from_directory(STATIC_IMG_DIR, filename)
         
-        meta_path = os.path.join(IMAGE_CACHE_DIR, meta_filename)
-        
-        # If metadata file doesn't exist, still serve the image
-        if not os.path.exists(meta_path):
-            logger.warning(f"Metadata file not found for {filename}, serving image anyway")
-            return send_from_directory(IMAGE_CACHE_DIR, filename)
-            
-        try:
-            with open(meta_path, 'r') as f:
-                metadata = json.load(f)
-            
-            # Check if the metadata contains topic_id and it matches
-            if 'topic_id' in metadata:
-                logger.info(f"Metadata topic_id: {metadata['topic_id']}, Requested topic_id: {topic_id}")
-                
-                # If the topic_id starts with the same prefix, consider it a match
-                # This handles the timestamp part of the topic_id which might differ
-                metadata_topic_prefix = metadata['topic_id'].split('_')[0:2]
-                requested_topic_prefix = topic_id.split('_')[0:2]
-                
-                if metadata_topic_prefix != requested_topic_prefix and topic_id != metadata['topic_id']:
-                    logger.warning(f"Topic mismatch: {metadata['topic_id']} vs {topic_id}")
-                    # Topic IDs don't match, but we'll still serve the image and log the warning
-                    # return send_from_directory(os.path.join(BASE_DIR, 'static', 'img'), 'fallback.jpg')
-            
-            # If we get here, either the topic matches or we're being lenient
-            return send_from_directory(IMAGE_CACHE_DIR, filename)
-                
-        except Exception as e:
-            logger.error(f"Error reading metadata for {filename}: {str(e)}")
-            # Continue serving the image even if metadata check fails
-            return send_from_directory(IMAGE_CACHE_DIR, filename)
-        
-        return send_from_directory(IMAGE_CACHE_DIR, filename)
+        return _send_cached_image(filename)
     except Exception as e:
         logger.error(f"Error serving image {filename}: {str(e)}")
         # Try to serve the fallback image
         try:
-            fallback_path = os.path.join(BASE_DIR, 'static', 'img', 'fallback.jpg')
-            if os.path.exists(fallback_path):
-                return send_from_directory(os.path.join(BASE_DIR, 'static', 'img'), 'fallback.jpg')
+            if _FALLBACK_BYTES is not None:
+                return _serve_fallback()
         except Exception:
             pass
         abort(404)
 
+@images_bp.after_request
+def apply_accel_redirect(response):
+    """Translate X-Sendfile into nginx's X-Accel-Redirect when a prefix is configured."""
+    sendfile_path = response.headers.get('X-Sendfile')
+    if sendfile_path and FlaskConfig.X_ACCEL_REDIRECT_PREFIX:
+        relative_path = os.path.relpath(sendfile_path, BASE_DIR).replace(os.sep, '/')
+        response.headers['X-Accel-Redirect'] = f"{FlaskConfig.X_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{relative_path}"
+        del response.headers['X-Sendfile']
+    return response
+
+def _generate_images_step(
+    topic_data: TopicData,
+    narrative_text: Optional[str],
+    variants: int,
+    tone: str,
+    temperature: float
+) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Run the image generation step of the /generate pipeline.
+    
+    Returns:
+        Tuple of (image_result, image_success)
+    """
+    image_result = None
+    image_success = False
+    try:
+        # Only request images if we have a valid narrative
+        if narrative_text and len(narrative_text.strip()) > 50:
+            # Use the proper parameters for image generation
+            image_result = _get_image_generator().generate_images(
+                topic_data=topic_data,
+                narrative_text=narrative_text,
+                num_variants=variants,
+                tone=tone,
+                temperature=temperature
+            )
+            
+            if image_result and image_result.get('success', False):
+                image_success = True
+                logger.info(f"Image generation successful: {len(image_result.get('images', []))} images created")
+                # Log more details about the images
+                if logger.isEnabledFor(logging.DEBUG):
+                    for i, img in enumerate(image_result.get('images', [])):
+                        logger.debug(f"Image {i+1}: {img.get('file_path', 'No path')} - URL: {img.get('url', 'No URL')}")
+            else:
+                logger.warning(f"Image generation failed: {image_result.get('error', 'Unknown error')}")
+                if image_result and "fallback" in image_result and image_result["fallback"]:
+                    logger.info(f"Using fallback image: {image_result.get('fallback_reason', 'Unknown reason')}")
+                    # Mark as success since we have a fallback
+                    image_success = True
+        else:
+            logger.warning("Skipping image generation due to insufficient narrative")
+    except Exception as e:
+        logger.exception(f"Image generation error: {str(e)}")
+    
+    return image_result, image_success
+
+def _generate_visualizations_step(topic_data: TopicData) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """
+    Run the visualization step of the /generate pipeline.
+    
+    Returns:
+        Tuple of (viz_result, viz_success)
+    """
+    viz_result = None
+    viz_success = False
+    try:
+        # Generate visualizations from the topic data
+        viz_result = _get_visualizer().create_visualizations(topic_data)
+        
+        if viz_result and viz_result.get('success', False):
+            viz_success = True
+            logger.info(f"Visualization generation successful")
+            # Log which visualizations were generated
+            if 'visualizations' in viz_result and logger.isEnabledFor(logging.DEBUG):
+                viz_data = viz_result['visualizations']
+                logger.debug(f"Timeline: {'Created' if viz_data.get('timeline') else 'None'}")
+                logger.debug(f"Category Bar: {'Created' if viz_data.get('category_bar') else 'None'}")
+                logger.debug(f"Concept Map: {'Created' if viz_data.get('concept_map') else 'None'}")
+        else:
+            logger.warning(f"Visualization generation failed: {viz_result.get('error', 'Unknown error')}")
+    except Exception as e:
+        logger.exception(f"Visualization generation error: {str(e)}")
+    
+    return viz_result, viz_success
+
+def _build_image(img: Dict[str, Any], default_topic_id: str) -> Image:
+    """
+    Convert an image result dict into an Image served through the images endpoint.
+    
+    Args:
+        img: Image entry from the image generator result
+        default_topic_id: Topic ID of the whole image result, used when the entry has none
+        
+    Returns:
+        Image with a URL that includes the topic_id
+    """
+    # Get topic_id from the image metadata or from the image result
+    topic_id = img.get('topic_id', default_topic_id)
+    
+    if 'file_path' in img:
+        # Use the images endpoint for both generated and fallback images
+        url = f"/images/{os.path.basename(img['file_path'])}?topic_id={topic_id}"
+    else:
+        # Provide a fallback URL if none exists
+        url = img.get('url') or f"/images/fallback.jpg?topic_id={topic_id}"
+    
+    return Image(
+        file_path=img.get('file_path', ''),
+        prompt=img.get('prompt', ''),
+        model_version=img.get('model_version', ''),
+        style=img.get('style', 'photorealistic'),
+        width=img.get('width', 512),
+        height=img.get('height', 512),
+        url=url,
+        topic_id=topic_id
+    )
+
 @api_bp.route('/generate', methods=['POST'])
 def generate():
     """
@@ -165,48 +380,29 @@ def generate():
                 "error": "Invalid request data"
             }), 400
             
-        # Required parameter
-        topic = data.get('topic', '').strip()
-        if not topic:
-            return jsonify({
-                "success": False,
-                "error": "Topic is required"
-            }), 400
-        
-        # Optional parameters with defaults
         try:
-            tone = data.get('tone', ContentConfig.DEFAULT_TONE)
-            variants = int(data.get('variants', ContentConfig.DEFAULT_NUM_VARIANTS))
-            max_length = int(data.get('max_length', ContentConfig.DEFAULT_MAX_LENGTH))
-            expertise_level = data.get('expertise_level', 'intermediate')
-            
-            # Validate expertise level
-            if expertise_level not in ['beginner', 'intermediate', 'advanced']:
-                logger.warning(f"Invalid expertise level: {expertise_level}, using default")
-                expertise_level = 'intermediate'
-            
-            # Handle temperature parameter safely
-            temp_value = data.get('temperature')
-            if temp_value is None:
-                temperature = ContentConfig.DEFAULT_TEMPERATURE
+            params = GenerateRequest.model_validate(data)
+        except ValidationError as e:
+            logger.error(f"Parameter validation error: {e}")
+            first_error = e.errors()[0]
+            if first_error['loc'] == ('topic',):
+                message = "Topic is required"
             else:
-                try:
-                    temperature = float(temp_value)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid temperature value: {temp_value}, using default")
-                    temperature = ContentConfig.DEFAULT_TEMPERATURE
-            
-            # Ensure temperature is within valid range
-            temperature = max(0.1, min(1.0, temperature))
-            
-            logger.info(f"Using parameters: tone={tone}, variants={variants}, max_length={max_length}, temperature={temperature}, expertise_level={expertise_level}")
-        except (ValueError, TypeError) as e:
-            logger.error(f"Parameter conversion error: {e}")
+                message = f"Invalid parameter value: {first_error['loc'][0]}: {first_error['msg']}"
             return jsonify({
                 "success": False,
-                "error": f"Invalid parameter value: {str(e)}"
+                "error": message
             }), 400
         
+        topic = params.topic
+        tone = params.tone
+        variants = params.variants
+        max_length = params.max_length
+        temperature = params.temperature
+        expertise_level = params.expertise_level
+        
+        logger.info(f"Using parameters: tone={tone}, variants={variants}, max_length={max_length}, temperature={temperature}, expertise_level={expertise_level}")
+        
         # Validate topic
         is_valid, error = validate_topic(topic)
         if not is_valid:
@@ -248,14 +444,14 @@ def generate():
         logger.info("Step 1: Gathering data...")
         data_result = None
         try:
-            data_result = data_fetcher.fetch_topic_data(topic)
+            data_result = _get_data_fetcher().fetch_topic_data(topic)
             
             if not data_result.get('success', False):
                 logger.error(f"Data retrieval failed: {data_result.get('error', 'Unknown error')}")
                 # Instead of returning an error, continue with whatever data we have
                 logger.warning("Continuing with partial or fallback data")
             
-            response_data["processing_time"]["data"] = data_result.get('processing_time', 'unknown')
+            response_data["processing_time"]["data"] = format_time_elapsed(data_result['processing_time_ms'] / 1000)
         except Exception as e:
             logger.exception(f"Data retrieval error: {str(e)}")
             # Create minimal data result to continue the process
@@ -267,7 +463,7 @@ def generate():
                         summary=f"Information about {topic} is currently unavailable. Please try again later.",
                         url=""
                     ),
-                    dbpedia=DBpediaData(),
+                    dbpedia=EMPTY_DBPEDIA,
                     news=[]
                 ),
                 "error": f"Failed to retrieve data: {str(e)}",
@@ -288,7 +484,7 @@ def generate():
                         topic_data = TopicData(
                             topic=topic,
                             wikipedia=topic_data.get('wikipedia', WikipediaData(summary="", url="")),
-                            dbpedia=topic_data.get('dbpedia', DBpediaData()),
+                            dbpedia=topic_data.get('dbpedia', EMPTY_DBPEDIA),
                             news=topic_data.get('news', [])
                         )
                         logger.info("Successfully converted dict to TopicData model")
@@ -301,7 +497,7 @@ def generate():
                                 summary=f"Information about {topic} is currently unavailable.",
                                 url=""
                             ),
-                            dbpedia=DBpediaData(),
+                            dbpedia=EMPTY_DBPEDIA,
                             news=[]
                         )
                 except Exception as conversion_error:
@@ -313,7 +509,7 @@ def generate():
                             summary=f"Information about {topic} is currently unavailable.",
                             url=""
                         ),
-                        dbpedia=DBpediaData(),
+                        dbpedia=EMPTY_DBPEDIA,
                         news=[]
                     )
             
@@ -330,15 +526,20 @@ def generate():
                     summary=f"Information about {topic} is currently unavailable.",
                     url=""
                 ),
-                dbpedia=DBpediaData(),
+                dbpedia=EMPTY_DBPEDIA,
                 news=[]
             )
         
+        # 4. Visualizations only depend on the topic data, so start them now
+        # and let them run while the narrative and images are generated
+        logger.info("Step 4: Generating visualizations in the background...")
+        viz_future = _PIPELINE_EXECUTOR.submit(_generate_visualizations_step, topic_data)
+        
         # 2. Generate narrative
         logger.info("Step 2: Generating narrative...")
         narrative_result = None
         try:
-            narrative_result = narrative_generator.generate_narrative(
+            narrative_result = _get_narrative_generator().generate_narrative(
                 topic_data=topic_data,
                 tone=tone,
                 max_tokens=max_length,
@@ -378,70 +579,20 @@ def generate():
             response_data["narrative"] = narrative_result["narrative"]
             response_data["processing_time"]["narrative"] = narrative_result.get('processing_time', 'unknown')
         
-        # 3. Generate images
+        # 3. Generate images (runs alongside the visualization step started above)
         logger.info("Step 3: Generating images...")
         narrative_text = narrative_result['narrative']['narrative'] if narrative_result and 'narrative' in narrative_result else None
         
-        image_result = None
-        image_success = False
-        try:
-            # Only request images if we have a valid narrative
-            if narrative_text and len(narrative_text.strip()) > 50:
-                # Use the proper parameters for image generation
-                image_result = image_generator.generate_images(
-                    topic_data=topic_data,
-                    narrative_text=narrative_text,
-                    num_variants=variants,
-                    tone=tone,
-                    temperature=temperature
-                )
-                
-                if image_result and image_result.get('success', False):
-                    image_success = True
-                    logger.info(f"Image generation successful: {len(image_result.get('images', []))} images created")
-                    # Log more details about the images
-                    for i, img in enumerate(image_result.get('images', [])):
-                        logger.info(f"Image {i+1}: {img.get('file_path', 'No path')} - URL: {img.get('url', 'No URL')}")
-                else:
-                    logger.warning(f"Image generation failed: {image_result.get('error', 'Unknown error')}")
-                    if image_result and "fallback" in image_result and image_result["fallback"]:
-                        logger.info(f"Using fallback image: {image_result.get('fallback_reason', 'Unknown reason')}")
-                        # Mark as success since we have a fallback
-                        image_success = True
-            else:
-                logger.warning("Skipping image generation due to insufficient narrative")
-        except Exception as e:
-            logger.exception(f"Image generation error: {str(e)}")
-        
-        # 4. Generate visualizations
-        logger.info("Step 4: Generating visualizations...")
-        viz_result = None
-        viz_success = False
-        try:
-            # Generate visualizations from the topic data
-            viz_result = visualizer.create_visualizations(topic_data)
-            
-            if viz_result and viz_result.get('success', False):
-                viz_success = True
-                logger.info(f"Visualization generation successful")
-                # Log which visualizations were generated
-                if 'visualizations' in viz_result:
-                    viz_data = viz_result['visualizations']
-                    logger.info(f"Timeline: {'Created' if viz_data.get('timeline') else 'None'}")
-                    logger.info(f"Category Bar: {'Created' if viz_data.get('category_bar') else 'None'}")
-                    logger.info(f"Concept Map: {'Created' if viz_data.get('concept_map') else 'None'}")
-            else:
-                logger.warning(f"Visualization generation failed: {viz_result.get('error', 'Unknown error')}")
-        except Exception as e:
-            logger.exception(f"Visualization generation error: {str(e)}")
+        image_result, image_success = _generate_images_step(
+            topic_data, narrative_text, variants, tone, temperature
+        )
+        viz_result, viz_success = viz_future.result()
         
         # Calculate elapsed time
         elapsed_time = time.time() - pipeline_start
         
         # Create the complete result
         try:
-            from models.data_model import GenerationResult, Narrative
-            
             # First create the narrative object
             narrative_data = narrative_result['narrative']
             narrative = Narrative(
@@ -461,49 +612,14 @@ def generate():
             
             # Add images if successful
             if image_result and image_success and 'images' in image_result:
-                # Set images URLs relative to server
-                images = []
+                # Log the clean topic identifier for the current topic
+                if logger.isEnabledFor(logging.DEBUG):
+                    current_topic_id = _TOPIC_SANITIZE.sub('_', topic.lower())
+                    logger.debug(f"Current topic ID prefix: topic_{current_topic_id}")
                 
-                # Generate a clean topic identifier for the current topic
-                current_topic_id = re.sub(r'[^a-zA-Z0-9]', '_', topic.lower())
-                current_topic_id = f"topic_{current_topic_id}"
-                logger.info(f"Current topic ID prefix: {current_topic_id}")
-                
-                for img in image_result['images']:
-                    # Get topic_id from the image metadata or from the image result
-                    topic_id = img.get('topic_id', image_result.get('topic_id', ''))
-                    
-                    if 'file_path' in img:
-                        # Extract just the filename from the path
-                        from pathlib import Path
-                        filename = Path(img['file_path']).name
-                        
-                        # Check if this is a fallback image or a generated image
-                        if 'fallback' in image_result and image_result['fallback']:
-                            # Use the images endpoint for fallback images
-                            img['url'] = f"/images/{filename}?topic_id={topic_id}"
-                        else:
-                            # Use the images endpoint for generated images - include topic_id
-                            img['url'] = f"/images/{filename}?topic_id={topic_id}"
-                    
-                    # Make sure the image has a valid URL
-                    if 'url' not in img:
-                        # Provide a fallback URL if none exists
-                        img['url'] = f"/images/fallback.jpg?topic_id={topic_id}"
-                    
-                    # Create proper Image objects instead of using dictionaries
-                    image_obj = Image(
-                        file_path=img.get('file_path', ''),
-                        prompt=img.get('prompt', ''),
-                        model_version=img.get('model_version', ''),
-                        style=img.get('style', 'photorealistic'),
-                        width=img.get('width', 512),
-                        height=img.get('height', 512),
-                        url=img.get('url', '/images/fallback.jpg'),  # URL with topic_id 
-                        topic_id=topic_id  # Store the topic_id in the image object
-                    )
-                    images.append(image_obj)
-                result.images = images
+                # Build Image objects with URLs relative to the server in one pass
+                default_topic_id = image_result.get('topic_id', '')
+                result.images = [_build_image(img, default_topic_id) for img in image_result['images']]
             
             # Add visualizations if available
             if viz_result and viz_success and 'visualizations' in viz_result:
@@ -520,17 +636,18 @@ def generate():
             result_dict = result.to_dict()
             logger.info(f"Generation successful for topic: {topic}")
             
-            # Log result size
-            import sys
-            import json
-            result_json = json.dumps(result_dict)
-            result_size = sys.getsizeof(result_json)
-            logger.info(f"Result size: {result_size} bytes")
+            # Follow-up questions share the conversation prompt prefix for this topic
+            if ContentConfig.WARM_CONVERSATION_PREFIX:
+                _PIPELINE_EXECUTOR.submit(_get_narrative_generator().warm_conversation_prefix, topic, topic_data, tone)
             
             response_data["result"] = result_dict
             response_data["processing_time"]["total"] = format_time_elapsed(elapsed_time)
             
-            return jsonify(response_data)
+            # Log result size from the already-encoded body instead of serializing twice
+            response = jsonify(response_data)
+            logger.info(f"Result size: {response.content_length} bytes")
+            
+            return response
         except Exception as e:
             logger.exception(f"Error serializing result: {e}")
             # Return a simplified result instead of failing
@@ -547,7 +664,6 @@ def generate():
         logger.exception(f"Unexpected error during generation: {str(e)}")
         
         # Get traceback
-        import traceback
         tb = traceback.format_exc()
         logger.error(f"Traceback: {tb}")
         
@@ -558,10 +674,77 @@ def generate():
         }), 500
 
 
+@api_bp.route('/generate/stream', methods=['POST'])
+def generate_stream():
+    """
+    Stream the narrative for a topic as server-sent events.
+    
+    Takes the same parameters as /api/generate. Each text chunk is sent as a
+    "data: {"text": ...}" event as soon as it is generated, followed by a
+    "done" event carrying the final narrative result. Images and
+    visualizations are not generated.
+    """
+    data = request.get_json(silent=True)
+    if not data or not isinstance(data, dict):
+        return jsonify({
+            "success": False,
+            "error": "Invalid request data"
+        }), 400
+    
+    try:
+        params = GenerateRequest.model_validate(data)
+    except ValidationError as e:
+        first_error = e.errors()[0]
+        return jsonify({
+            "success": False,
+            "error": f"Invalid parameter value: {first_error['loc'][0]}: {first_error['msg']}"
+        }), 400
+    
+    is_valid, error = validate_topic(params.topic)
+    if not is_valid:
+        return jsonify({
+            "success": False,
+            "error": error
+        }), 400
+    
+    topic = format_title(correct_spelling(params.topic))
+    
+    # Fetch topic data
+    data_result = _get_data_fetcher().fetch_topic_data(topic)
+    topic_data = data_result.get('data')
+    if not isinstance(topic_data, TopicData):
+        return jsonify({
+            "success": False,
+            "error": "Failed to fetch topic data"
+        }), 500
+    topic_data.topic = topic
+    
+    def events():
+        stream = _get_narrative_generator().generate_narrative_stream(
+            topic_data=topic_data,
+            tone=params.tone,
+            max_tokens=params.max_length,
+            temperature=params.temperature,
+            expertise_level=params.expertise_level
+        )
+        try:
+            while True:
+                yield f"data: {json.dumps({'text': next(stream)})}\n\n"
+        except StopIteration as done:
+            result = done.value
+        yield f"event: done\ndata: {json.dumps(result)}\n\n"
+    
+    response = Response(stream_with_context(events()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Keep nginx from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @api_bp.route('/styles', methods=['GET'])
 def get_styles():
     """Get available image generation styles."""
-    styles = image_generator.get_available_styles()
+    styles = _get_image_generator().get_available_styles()
     return jsonify({
         "success": True,
         "styles": styles
@@ -586,7 +769,7 @@ def get_related_topics():
             "error": error
         }), 400
     
-    related = data_fetcher.get_related_topics(topic)
+    related = _get_data_fetcher().get_related_topics(topic)
     return jsonify({
         "success": True,
         "topic": topic,
@@ -607,7 +790,7 @@ def analyze_sentiment():
     topic = data['topic']
     
     # Fetch topic data
-    data_result = data_fetcher.fetch_topic_data(topic)
+    data_result = _get_data_fetcher().fetch_topic_data(topic)
     if not data_result.get('success', False):
         return jsonify({
             "success": False,
@@ -615,7 +798,6 @@ def analyze_sentiment():
         }), 500
     
     # Get topic data from result
-    from models.data_model import TopicData
     topic_data = data_result.get('data')
     if not isinstance(topic_data, TopicData):
         return jsonify({
@@ -624,7 +806,7 @@ def analyze_sentiment():
         }), 500
 
     # Analyze sentiment
-    sentiment_result = narrative_generator.analyze_sentiment(topic_data)
+    sentiment_result = _get_narrative_generator().analyze_sentiment(topic_data)
     
     if not sentiment_result.get('success', False):
         return jsonify({
@@ -660,10 +842,10 @@ def generate_story():
         temperature = ContentConfig.DEFAULT_TEMPERATURE
     
     # Ensure temperature is in valid range
-    temperature = max(0.1, min(1.0, temperature))
+    temperature = clamp_temperature(temperature)
     
     # Fetch topic data
-    data_result = data_fetcher.fetch_topic_data(topic)
+    data_result = _get_data_fetcher().fetch_topic_data(topic)
     if not data_result.get('success', False):
         return jsonify({
             "success": False,
@@ -671,7 +853,6 @@ def generate_story():
         }), 500
     
     # Get topic data from result
-    from models.data_model import TopicData
     topic_data = data_result.get('data')
     if not isinstance(topic_data, TopicData):
         return jsonify({
@@ -680,7 +861,7 @@ def generate_story():
         }), 500
 
     # Generate creative story
-    story_result = narrative_generator.generate_creative_story(
+    story_result = _get_narrative_generator().generate_creative_story(
         topic_data=topic_data,
         style=style,
         genre=genre,
@@ -746,6 +927,8 @@ def conversation():
         # Optional parameters
         conversation_history = data.get('conversation_history', [])
         tone = data.get('tone', ContentConfig.DEFAULT_TONE)
+        if not isinstance(tone, str) or tone not in ContentConfig.VALID_TONES:
+            tone = ContentConfig.DEFAULT_TONE
         
         # Handle temperature parameter safely
         temp_value = data.get('temperature')
@@ -759,20 +942,28 @@ def conversation():
                 temperature = ContentConfig.DEFAULT_TEMPERATURE
         
         # Ensure temperature is within valid range
-        temperature = max(0.1, min(1.0, temperature))
+        temperature = clamp_temperature(temperature)
         
-        # Validate conversation history format
-        if not isinstance(conversation_history, list):
-            conversation_history = []
+        # Bound the history before it is used for the cache key and the prompt
+        conversation_history = sanitize_conversation_history(conversation_history)
         
         # Log request
         logger.info(f"Conversation request for topic: '{topic}', question: '{question}', tone: '{tone}'")
         
+        # Serve repeated questions from the response cache
+        cache_key = None
+        if CacheConfig.ENABLE_CACHE:
+            cache_key = _conversation_cache_key(topic, question, tone, temperature, conversation_history)
+            cached_response = _conversation_cache.get(cache_key)
+            if cached_response is not None:
+                logger.info(f"Conversation cache hit for topic: '{topic}'")
+                return jsonify(cached_response)
+        
         # Fetch topic data if we need additional context
         topic_data = None
         try:
             # Get topic data for context
-            data_result = data_fetcher.fetch_topic_data(topic)
+            data_result = _get_data_fetcher().fetch_topic_data(topic)
             if data_result.get('success', False):
                 topic_data = data_result.get('data')
         except Exception as e:
@@ -782,7 +973,7 @@ def conversation():
         # Generate the AI response
         try:
             # Use the narrative generator to create a conversation response
-            response_result = narrative_generator.generate_conversation_response(
+            response_result = _get_narrative_generator().generate_conversation_response(
                 topic=topic,
                 question=question,
                 conversation_history=conversation_history,
@@ -798,13 +989,16 @@ def conversation():
                 }), 500
             
             # Return the successful response
-            return jsonify({
+            response_data = {
                 "success": True,
                 "topic": topic,
                 "response": response_result.get('response', ''),
                 "references": response_result.get('references', []),
                 "processing_time": response_result.get('processing_time', '')
-            })
+            }
+            if cache_key is not None:
+                _conversation_cache.set(cache_key, response_data)
+            return jsonify(response_data)
             
         except Exception as e:
             logger.exception(f"Error generating conversation response: {e}")
@@ -822,39 +1016,52 @@ def conversation():
         }), 500
 
 
-@api_bp.route('/health', methods=['GET'])
-def health_check():
-    """API health check endpoint with detailed status information."""
-    version = "1.0.0"
-    api_status = get_all_api_statuses()
-    response = {
+@api_bp.route('/cache/invalidate', methods=['POST'])
+def invalidate_cache():
+    """
+    Clear the in-memory conversation response cache.
+    
+    Requires the X-Admin-Token header to match FlaskConfig.ADMIN_TOKEN;
+    the route is disabled when no token is configured.
+    """
+    if not FlaskConfig.ADMIN_TOKEN or not hmac.compare_digest(
+        request.headers.get('X-Admin-Token', '').encode(), FlaskConfig.ADMIN_TOKEN.encode()
+    ):
+        return jsonify({
+            "success": False,
+            "error": "Forbidden"
+        }), 403
+    
+    cleared = len(_conversation_cache)
+    _conversation_cache.clear()
+    logger.info(f"Cleared {cleared} cached conversation responses")
+    
+    return jsonify({
         "success": True,
-        "status": api_status["overall_status"],
-        "version": version,
-        "apis": api_status["services"],
-        "summary": api_status["summary"]
-    }
-    status_code = 200
-    if api_status["overall_status"] == "degraded":
-        status_code = 207  # Multi-Status
-    elif api_status["overall_status"] == "incomplete":
-        status_code = 424  # Failed Dependency
-    elif api_status["overall_status"] == "down":
-        status_code = 503  # Service Unavailable
-    return jsonify(response), status_code
+        "cleared": cleared
+    })
 
 
+@api_bp.route('/health', methods=['GET'])
 @api_bp.route('/status', methods=['GET'])
-def api_status():
-    """API status endpoint for compatibility with frontend checks (returns same as /api/health)."""
-    version = "1.0.0"
-    api_status = get_all_api_statuses()
+def health_check():
+    """
+    API health check endpoint with detailed status information.
+    
+    Also served at /api/status for compatibility with frontend checks.
+    Pass ?force=1 to bypass the cached probe results. Per-source upstream
+    fetch latencies are included for tuning the source timeouts, and
+    narrative generation latencies per backend show the local summarizer's share.
+    """
+    api_status = get_all_api_statuses(force=request.args.get('force') == '1')
     response = {
         "success": True,
         "status": api_status["overall_status"],
-        "version": version,
+        "version": "1.0.0",
         "apis": api_status["services"],
-        "summary": api_status["summary"]
+        "summary": api_status["summary"],
+        "fetch_latency": fetch_latency.snapshot(),
+        "generation_latency": generation_latency.snapshot()
     }
     status_code = 200
     if api_status["overall_status"] == "degraded":
@@ -866,6 +1073,18 @@ def api_status():
     return jsonify(response), status_code
 
 
+@api_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Prometheus scrape endpoint for the latency histograms.
+    
+    Only available when prometheus_client is installed.
+    """
+    if generate_latest is None:
+        abort(404)
+    return Response(generate_latest(), content_type=CONTENT_TYPE_LATEST)
+
+
 # Error handlers
 @api_bp.errorhandler(Exception)
 def handle_exception(e):
@@ -889,13 +1108,74 @@ def handle_exception(e):
     }), 500
 
 
+def index():
+    """Render the main application page."""
+    return render_template('index.html')
+
+
+def about():
+    """Render the about page."""
+    return render_template('about.html')
+
+
+def status_page():
+    """Render the status page."""
+    # Get API status information
+    api_status = get_all_api_statuses(force=request.args.get('force') == '1')
+    
+    return render_template(
+        'status.html',
+        status=api_status["overall_status"],
+        apis=api_status["services"],
+        summary=api_status["summary"]
+    )
+
+
+def ai_page():
+    return render_template('index.html')
+
+
+def not_found(e):
+    """Handle 404 errors for URLs that matched no route."""
+    if request.path.startswith(_API_PREFIX):
+        return jsonify({
+            "success": False,
+            "error": "Endpoint not found"
+        }), 404
+    return render_template('404.html'), 404
+
+
+def handle_app_exception(e):
+    """
+    Handle exceptions raised outside the API blueprint.
+    
+    Errors from API views are handled as JSON by the api_bp handler, so only
+    routing errors (e.g. 405 on an /api URL) need the prefix check here.
+    """
+    if isinstance(e, HTTPException):
+        if request.path.startswith(_API_PREFIX):
+            return handle_exception(e)
+        logger.exception(e)
+        return render_template('error.html', error=e), e.code
+    
+    logger.exception(e)
+    return render_template('error.html', error=e), 500
+
+
+def direct_static(filename):
+    """Serve static files directly."""
+    return send_from_directory(STATIC_DIR, filename, conditional=True, max_age=CacheConfig.STATIC_HTTP_MAX_AGE)
+
+
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Apply configuration
     app.config['SECRET_KEY'] = FlaskConfig.SECRET_KEY
     app.config['DEBUG'] = FlaskConfig.DEBUG
+    app.config['USE_X_SENDFILE'] = FlaskConfig.USE_X_SENDFILE
     
     # Ensure required directories exist
     ensure_directories()
@@ -903,95 +1183,84 @@ def create_app():
     # Enable CORS for all routes
     CORS(app)
     
+    # Compress text responses (large /generate and /conversation payloads)
+    if Compress is not None and FlaskConfig.ENABLE_COMPRESSION:
+        app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+        app.config['COMPRESS_LEVEL'] = FlaskConfig.COMPRESS_LEVEL
+        app.config['COMPRESS_MIN_SIZE'] = FlaskConfig.COMPRESS_MIN_SIZE
+        app.config['COMPRESS_ALGORITHM'] = 'gzip'
+        Compress(app)
+    
     # Register blueprints
     app.register_blueprint(api_bp)
     app.register_blueprint(images_bp)
     
     # Add direct route for static files - especially for images
-    @app.route('/direct-static/<path:filename>')
-    def direct_static(filename):
-        """Serve static files directly."""
-        return send_from_directory(os.path.join(BASE_DIR, 'static'), filename)
+    app.add_url_rule('/direct-static/<path:filename>', 'direct_static', direct_static)
     
-    # Root route
-    @app.route('/')
-    def index():
-        """Render the main application page."""
-        return render_template('index.html')
+    # Page routes and app-wide error handlers
+    app.add_url_rule('/', 'index', index)
+    app.add_url_rule('/about', 'about', about)
+    app.add_url_rule('/status', 'status', status_page)
+    app.add_url_rule('/AI', 'ai_page', ai_page)
+    app.register_error_handler(404, not_found)
+    app.register_error_handler(Exception, handle_app_exception)
+
+    return app
+
+def _create_placeholder_image(path: str):
+    """Draw the generic image placeholder and save it as a PNG at path."""
+    from PIL import Image, ImageDraw
+    img = Image.new('RGB', (512, 512), color=(40, 40, 40))
+    draw = ImageDraw.Draw(img)
     
-    @app.route('/about')
-    def about():
-        """Render the about page."""
-        return render_template('about.html')
+    # Draw a simple image icon
+    icon_size = 200
+    x_center, y_center = 256, 256
     
-    @app.route('/status')
-    def status():
-        """Render the status page."""
-        # Get API status information
-        api_status = get_all_api_statuses()
-        
-        return render_template(
-            'status.html',
-            status=api_status["overall_status"],
-            apis=api_status["services"],
-            summary=api_status["summary"]
-        )
+    # Draw frame
+    draw.rectangle(
+        (x_center - icon_size//2, y_center - icon_size//2, 
+         x_center + icon_size//2, y_center + icon_size//2),
+        outline=(200, 200, 200),
+        width=4
+    )
     
-    # Handle 404 errors
-    @app.errorhandler(404)
-    def not_found(e):
-        if request.path.startswith('/api/'):
-            # Return JSON for API routes
-            return jsonify({
-                "success": False,
-                "error": "Endpoint not found"
-            }), 404
-        # Return HTML for other routes
-        return render_template('404.html'), 404
+    # Draw mountain icon
+    points = [
+        (x_center - icon_size//2 + 20, y_center + icon_size//2 - 20),  # Bottom left
+        (x_center, y_center - icon_size//4),                         # Middle peak
+        (x_center + icon_size//4, y_center + icon_size//4),           # Small peak
+        (x_center + icon_size//2 - 20, y_center + icon_size//2 - 20)   # Bottom right
+    ]
+    draw.polygon(points, fill=(100, 100, 100))
     
-    # Register global error handler
-    @app.errorhandler(Exception)
-    def handle_exception(e):
-        """Handle all exceptions."""
-        logger.exception(e)
-        
-        # If it's an HTTP exception, use its error code
-        if isinstance(e, HTTPException):
-            if request.path.startswith('/api/'):
-                # Return JSON for API routes
-                response = jsonify({
-                    "success": False,
-                    "error": e.description
-                })
-                response.status_code = e.code
-                return response
-            # Return HTML for other routes
-            return render_template('error.html', error=e), e.code
-        
-        # Otherwise return a 500 error
-        if request.path.startswith('/api/'):
-            # Return JSON for API routes
-            return jsonify({
-                "success": False,
-                "error": "Server error",
-                "details": str(e)
-            }), 500
-        # Return HTML for other routes
-        return render_template('error.html', error=e), 500
-
-    @app.route('/AI')
-    def ai_page():
-        return render_template('index.html')
+    # Draw sun
+    sun_radius = 30
+    draw.ellipse(
+        (x_center - icon_size//4 - sun_radius, y_center - icon_size//4 - sun_radius,
+         x_center - icon_size//4 + sun_radius, y_center - icon_size//4 + sun_radius),
+        fill=(180, 180, 100)
+    )
+    
+    # The image is mostly flat color, so fast deflate costs little in size
+    img.save(path, "PNG", compress_level=1)
 
-    return app
+# Set once ensure_directories() has completed in this process
+_dirs_ready = False
 
 def ensure_directories():
     """Ensure all required directories exist and create fallback images."""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    
     try:
         # Ensure directories exist
         directories = [
-            os.path.join(BASE_DIR, 'static/img'),
-            IMAGE_CACHE_DIR
+            STATIC_IMG_DIR,
+            IMAGE_CACHE_DIR,
+            DATA_CACHE_DIR
         ]
         
         for directory in directories:
@@ -999,52 +1268,24 @@ def ensure_directories():
                 os.makedirs(directory, exist_ok=True)
                 logger.info(f"Created directory: {directory}")
         
+        # Both images ship in static/img, so these branches only run on a broken checkout
         # Create fallback image if it doesn't exist
-        from services.stable_diffusion import stable_diffusion_client
-        stable_diffusion_client._ensure_fallback_image()
+        if _FALLBACK_BYTES is None:
+            from services.stable_diffusion import stable_diffusion_client
+            stable_diffusion_client._ensure_fallback_image()
         
         # Create placeholder image
-        placeholder_path = os.path.join(BASE_DIR, 'static/img/image_placeholder.png')
-        if not os.path.exists(placeholder_path):
-            from PIL import Image, ImageDraw
-            img = Image.new('RGB', (512, 512), color=(40, 40, 40))
-            draw = ImageDraw.Draw(img)
-            
-            # Draw a simple image icon
-            icon_size = 200
-            x_center, y_center = 256, 256
-            
-            # Draw frame
-            draw.rectangle(
-                (x_center - icon_size//2, y_center - icon_size//2, 
-                 x_center + icon_size//2, y_center + icon_size//2),
-                outline=(200, 200, 200),
-                width=4
-            )
-            
-            # Draw mountain icon
-            points = [
-                (x_center - icon_size//2 + 20, y_center + icon_size//2 - 20),  # Bottom left
-                (x_center, y_center - icon_size//4),                         # Middle peak
-                (x_center + icon_size//4, y_center + icon_size//4),           # Small peak
-                (x_center + icon_size//2 - 20, y_center + icon_size//2 - 20)   # Bottom right
-            ]
-            draw.polygon(points, fill=(100, 100, 100))
-            
-            # Draw sun
-            sun_radius = 30
-            draw.ellipse(
-                (x_center - icon_size//4 - sun_radius, y_center - icon_size//4 - sun_radius,
-                 x_center - icon_size//4 + sun_radius, y_center - icon_size//4 + sun_radius),
-                fill=(180, 180, 100)
-            )
-            
-            img.save(placeholder_path, "PNG")
-            logger.info(f"Created placeholder image at {placeholder_path}")
+        if not _HAS_PLACEHOLDER:
+            _create_placeholder_image(PLACEHOLDER_PATH)
+            logger.info(f"Created placeholder image at {PLACEHOLDER_PATH}")
+        
+        _dirs_ready = True
             
     except Exception as e:
         logger.error(f"Error ensuring directories and files: {e}")
         # Continue even if there's an error - the application should still run
+    
+    _refresh_static_assets()
 
 
 if __name__ == '__main__':
@@ -22,10 +22,7 @@ BASE_DIR = Path(__file__).resolve().parent
 CACHE_DIR = BASE_DIR / "cache"
 IMAGE_CACHE_DIR = CACHE_DIR / "images"
 DATA_CACHE_DIR = CACHE_DIR / "data"
-
-# Create cache directories if they don't exist
-IMAGE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
-DATA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# The cache directories are created by app.ensure_directories() and on first disk cache use
 
 # API Keys and endpoints
 class APIConfig:
@@ -33,12 +30,21 @@ class APIConfig:
     # Groq LLaMA API
     GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
     GROQ_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+    STYLE_ANALYSIS_TIMEOUT = float(os.getenv("STYLE_ANALYSIS_TIMEOUT", 3))  # Seconds to wait for LLaMA image style analysis
     
     # Stable Diffusion
     SD_MODEL_VERSION = os.getenv("SD_MODEL_VERSION", "stable-diffusion-3.5-large")
     STABILITY_API_KEY = os.getenv("STABILITY_API_KEY", "")
     # News API
     NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
+    
+    # Topic data sources (Wikipedia, DBpedia, news)
+    SOURCE_FETCH_WORKERS = int(os.getenv("SOURCE_FETCH_WORKERS", 12))  # Threads shared by all topic fetches
+    SOURCE_FETCH_TIMEOUT = float(os.getenv("SOURCE_FETCH_TIMEOUT", 10))  # Seconds to wait for all sources of a topic
+    SOURCE_CONNECT_TIMEOUT = float(os.getenv("SOURCE_CONNECT_TIMEOUT", 2))  # Per-request connect timeout
+    SOURCE_READ_TIMEOUT = float(os.getenv("SOURCE_READ_TIMEOUT", 5))  # Per-request read timeout
+    SOURCE_CIRCUIT_FAIL_MAX = int(os.getenv("SOURCE_CIRCUIT_FAIL_MAX", 5))  # Consecutive failures before skipping a source
+    SOURCE_CIRCUIT_RESET_TIMEOUT = float(os.getenv("SOURCE_CIRCUIT_RESET_TIMEOUT", 30))  # Seconds a source stays skipped
 
 # Flask application settings
 class FlaskConfig:
@@ -47,6 +53,18 @@ class FlaskConfig:
     DEBUG = os.getenv("FLASK_ENV", "development") == "development"
     TESTING = os.getenv("FLASK_TESTING", "0") == "1"
     PORT = int(os.getenv("PORT", 5000))
+    # Let a fronting web server (Apache/lighttpd, or nginx via X-Accel-Redirect) stream files
+    USE_X_SENDFILE = os.getenv("USE_X_SENDFILE", "0") == "1"
+    # nginx internal location aliased to BASE_DIR, e.g. "/protected" (empty disables the rewrite)
+    X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX", "")
+    # Worker threads shared by all /generate requests for the image and visualization steps
+    PIPELINE_MAX_WORKERS = int(os.getenv("PIPELINE_MAX_WORKERS", 8))
+    # Token required by admin routes such as /api/cache/invalidate (empty disables them)
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+    # Response compression (requires Flask-Compress)
+    ENABLE_COMPRESSION = os.getenv("ENABLE_COMPRESSION", "1") == "1"
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", 4))
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 1024))  # Bytes
 
 # Cache settings
 class CacheConfig:
@@ -55,6 +73,12 @@ class CacheConfig:
     CACHE_TIMEOUT = int(os.getenv("CACHE_TIMEOUT", 3600))  # 1 hour default
     MAX_IMAGE_CACHE_SIZE = int(os.getenv("MAX_IMAGE_CACHE_SIZE", 100))  # Number of images
     MAX_DATA_CACHE_SIZE = int(os.getenv("MAX_DATA_CACHE_SIZE", 1000))  # Number of items
+    IMAGE_HTTP_MAX_AGE = int(os.getenv("IMAGE_HTTP_MAX_AGE", 3600))  # Browser/CDN lifetime of generated images before revalidation
+    STATIC_HTTP_MAX_AGE = int(os.getenv("STATIC_HTTP_MAX_AGE", 86400))  # Browser lifetime of /direct-static files
+    API_STATUS_TTL = int(os.getenv("API_STATUS_TTL", 20))  # Seconds to reuse external API health probes
+    WIKIPEDIA_CACHE_TTL = int(os.getenv("WIKIPEDIA_CACHE_TTL", 86400))  # In-process Wikipedia result lifetime
+    DBPEDIA_CACHE_TTL = int(os.getenv("DBPEDIA_CACHE_TTL", 86400))  # In-process DBpedia result lifetime
+    NEWS_CACHE_TTL = int(os.getenv("NEWS_CACHE_TTL", 900))  # News result lifetime, in process and on disk
 
 # Content generation settings
 class ContentConfig:
@@ -65,16 +89,31 @@ class ContentConfig:
     DEFAULT_NUM_VARIANTS = int(os.getenv("DEFAULT_NUM_VARIANTS", 1))
     
     # Narrative generation
-    DEFAULT_MAX_LENGTH = int(os.getenv("DEFAULT_MAX_LENGTH", 1024))
+    DEFAULT_MAX_LENGTH = int(os.getenv("DEFAULT_MAX_LENGTH", 600))
     DEFAULT_TEMPERATURE = float(os.getenv("DEFAULT_TEMPERATURE", 0.7))
     DEFAULT_TOP_P = float(os.getenv("DEFAULT_TOP_P", 0.9))
     DEFAULT_TONE = os.getenv("DEFAULT_TONE", "informative")
-    VALID_TONES = ["informative", "dramatic", "poetic", "humorous", "technical", "simple"]
+    VALID_TONES = frozenset({"informative", "dramatic", "poetic", "humorous", "technical", "simple"})
+    
+    # transformers summarization model that serves low-temperature narratives locally; empty always uses Groq
+    LOCAL_SUMMARIZER_MODEL = os.getenv("LOCAL_SUMMARIZER_MODEL", "")
+    # Narratives below this temperature (and not for advanced readers) may use the local summarizer
+    LOCAL_SUMMARIZER_MAX_TEMPERATURE = float(os.getenv("LOCAL_SUMMARIZER_MAX_TEMPERATURE", 0.3))
+    # Narratives with at least this many max_tokens use two concurrent Groq calls (bullets and body); 0 disables
+    NARRATIVE_SPLIT_MIN_TOKENS = int(os.getenv("NARRATIVE_SPLIT_MIN_TOKENS", 400))
+    # Threads running the bullet-point calls of split narratives
+    NARRATIVE_SPLIT_WORKERS = int(os.getenv("NARRATIVE_SPLIT_WORKERS", 8))
     
     # Conversation settings
     CONVERSATION_MAX_TOKENS = int(os.getenv("CONVERSATION_MAX_TOKENS", 800))
     CONVERSATION_TEMPERATURE = float(os.getenv("CONVERSATION_TEMPERATURE", 0.7))
     CONVERSATION_MAX_HISTORY = int(os.getenv("CONVERSATION_MAX_HISTORY", 10))
+    # Approximate tokens of recent history quoted verbatim; older messages are summarized
+    CONVERSATION_HISTORY_TOKEN_BUDGET = int(os.getenv("CONVERSATION_HISTORY_TOKEN_BUDGET", 1500))
+    # sentence-transformers model used to drop near-duplicate history messages; empty compares normalized text only
+    HISTORY_DEDUP_MODEL = os.getenv("HISTORY_DEDUP_MODEL", "")
+    # Prime the LLM provider's prompt cache for follow-up questions after /generate (costs one small request)
+    WARM_CONVERSATION_PREFIX = os.getenv("WARM_CONVERSATION_PREFIX", "0") == "1"
     
     # Visualization
     DEFAULT_VIZ_THEME = os.getenv("DEFAULT_VIZ_THEME", "plotly_dark")
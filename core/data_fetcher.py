@@ -2,19 +2,59 @@
 Data fetcher for retrieving and normalizing contextual data.
 """
 
+import asyncio
+import itertools
 import logging
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
 
-from models.data_model import TopicData, WikipediaData, DBpediaData, NewsArticle
+from config import APIConfig, CacheConfig
+from models.data_model import TopicData, WikipediaData, DBpediaData, NewsArticle, EMPTY_DBPEDIA, EMPTY_NEWS
 from services.wikipedia_service import wikipedia_service
 from services.dbpedia_service import dbpedia_service
 from services.news_service import news_service
-from utils.helpers import format_time_elapsed, iso_now
+from utils.cache import LRUCache, disk_cache_counts
+from utils.circuit_breaker import CircuitBreaker
+from utils.helpers import iso_now
+from utils.metrics import fetch_latency
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Successful source responses keyed by normalized topic, with per-source lifetimes
+_wikipedia_cache = LRUCache(maxsize=CacheConfig.MAX_DATA_CACHE_SIZE, timeout=CacheConfig.WIKIPEDIA_CACHE_TTL)
+_dbpedia_cache = LRUCache(maxsize=CacheConfig.MAX_DATA_CACHE_SIZE, timeout=CacheConfig.DBPEDIA_CACHE_TTL)
+_news_cache = LRUCache(maxsize=CacheConfig.MAX_DATA_CACHE_SIZE, timeout=CacheConfig.NEWS_CACHE_TTL)
+
+# Wikipedia summary used when no real summary is available
+_ERROR_SUMMARY_TMPL = "Information about {topic} is not available at this time."
+
+# Per-source breakers that skip an upstream after repeated failures or timeouts
+_breakers = {
+    source: CircuitBreaker(
+        source,
+        fail_max=APIConfig.SOURCE_CIRCUIT_FAIL_MAX,
+        reset_timeout=APIConfig.SOURCE_CIRCUIT_RESET_TIMEOUT
+    )
+    for source in ("Wikipedia", "DBpedia", "News")
+}
+
+
+def _canonicalize(topic: str) -> str:
+    """
+    Normalize whitespace in a topic so spelling variants share caches.
+    
+    Args:
+        topic: Topic keyword as entered
+        
+    Returns:
+        Topic with surrounding whitespace removed and inner runs collapsed
+    """
+    return " ".join(topic.split())
+
+
 class DataFetcher:
     """
     Coordinates fetching data from multiple sources and normalizes the results.
@@ -23,39 +63,178 @@ class DataFetcher:
     def __init__(self):
         """Initialize services."""
         # Services are initialized as singletons in their respective modules
-        pass
+        # Source fetches in progress, shared with concurrent callers for the same topic
+        self._inflight: Dict[Tuple[LRUCache, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # The source clients are blocking, so fetches run on a shared pool
+        self._pool = ThreadPoolExecutor(
+            max_workers=APIConfig.SOURCE_FETCH_WORKERS,
+            thread_name_prefix="datafetch"
+        )
+    
+    def close(self) -> None:
+        """Stop the fetch pool and close the source services' connections."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        wikipedia_service.close()
+        dbpedia_service.close()
     
-    def fetch_topic_data(self, topic: str) -> Dict[str, Any]:
+    def fetch_topic_data(self, topic: str, normalize: bool = True) -> Dict[str, Any]:
         """
         Fetch data for a topic from all available sources.
         
+        The three sources are fetched concurrently, so the total latency is that
+        of the slowest source (bounded by APIConfig.SOURCE_FETCH_TIMEOUT).
+        
+        Args:
+            topic: Topic keyword
+            normalize: Return the data as a TopicData; if False, return the raw
+                source responses for callers that only serialize them
+            
+        Returns:
+            Dictionary with all fetched data and metadata
+        """
+        start_time = time.perf_counter()
+        topic = _canonicalize(topic)
+        logger.info("Fetching data for topic: %s", topic)
+        
+        # 1-3. Get Wikipedia summary, DBpedia structured data and news articles
+        futures = [
+            self._pool.submit(self._fetch_wikipedia, topic),
+            self._pool.submit(self._fetch_dbpedia, topic),
+            self._pool.submit(self._fetch_news, topic)
+        ]
+        deadline = start_time + APIConfig.SOURCE_FETCH_TIMEOUT
+        results = []
+        for future, source in zip(futures, ("Wikipedia", "DBpedia", "News")):
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.perf_counter())))
+            except FutureTimeoutError:
+                results.append(self._timed_out_result(topic, source))
+        
+        return self._build_topic_result(topic, *results, start_time=start_time, normalize=normalize)
+    
+    async def afetch_topic_data(self, topic: str, normalize: bool = True) -> Dict[str, Any]:
+        """
+        Fetch data for a topic from all available sources without blocking the event loop.
+        
         Args:
             topic: Topic keyword
+            normalize: Return the data as a TopicData; if False, return the raw
+                source responses for callers that only serialize them
             
         Returns:
             Dictionary with all fetched data and metadata
         """
-        start_time = time.time()
-        logger.info(f"Fetching data for topic: {topic}")
+        start_time = time.perf_counter()
+        topic = _canonicalize(topic)
+        logger.info("Fetching data for topic: %s", topic)
         
+        loop = asyncio.get_running_loop()
+        sources = (
+            ("Wikipedia", self._fetch_wikipedia),
+            ("DBpedia", self._fetch_dbpedia),
+            ("News", self._fetch_news)
+        )
+        futures = [loop.run_in_executor(self._pool, fetch, topic) for _, fetch in sources]
+        done, _ = await asyncio.wait(futures, timeout=APIConfig.SOURCE_FETCH_TIMEOUT)
+        results = [
+            future.result() if future in done else self._timed_out_result(topic, source)
+            for future, (source, _) in zip(futures, sources)
+        ]
+        
+        return self._build_topic_result(topic, *results, start_time=start_time, normalize=normalize)
+    
+    def fetch_topic_data_batch(self, topics: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch data for several topics at once.
+        
+        Args:
+            topics: Topic keywords
+            
+        Returns:
+            fetch_topic_data results in the same order as topics
+        """
+        return asyncio.run(self.afetch_topic_data_batch(topics))
+    
+    async def afetch_topic_data_batch(self, topics: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch data for several topics concurrently.
+        
+        Every source fetch of every topic is queued on the shared pool, so the
+        batch runs up to APIConfig.SOURCE_FETCH_WORKERS requests in parallel.
+        
+        Args:
+            topics: Topic keywords
+            
+        Returns:
+            fetch_topic_data results in the same order as topics
+        """
+        return list(await asyncio.gather(*(self.afetch_topic_data(topic) for topic in topics)))
+    
+    def _timed_out_result(self, topic: str, source: str) -> Dict[str, Any]:
+        """
+        Build the response used for a source that missed the fetch deadline.
+        
+        The abandoned call is counted against the source's breaker by
+        _guarded_call once it finishes.
+        
+        Args:
+            topic: Topic keyword
+            source: Source name ("Wikipedia", "DBpedia" or "News")
+            
+        Returns:
+            Error response, or empty news data for the news source
+        """
+        logger.warning("%s fetch for '%s' timed out after %ss", source, topic, APIConfig.SOURCE_FETCH_TIMEOUT)
+        if source == "News":
+            return self._empty_news(topic)
+        return {"success": False, "error": f"{source} error: request timed out"}
+    
+    def _build_topic_result(
+        self,
+        topic: str,
+        wiki_data: Dict[str, Any],
+        dbpedia_data: Dict[str, Any],
+        news_data: Dict[str, Any],
+        start_time: float,
+        normalize: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Combine the source responses into the fetch_topic_data result.
+        
+        Args:
+            topic: Topic keyword
+            wiki_data: Wikipedia API response
+            dbpedia_data: DBpedia API response
+            news_data: News API response
+            start_time: time.perf_counter() at the start of the fetch
+            normalize: Build a TopicData rather than returning the raw responses
+            
+        Returns:
+            Dictionary with all fetched data and metadata
+        """
         # Track errors/failures
         errors = []
-        
-        # 1. Get Wikipedia summary
-        wiki_data = self._fetch_wikipedia(topic)
         if not wiki_data.get("success", False):
             errors.append(wiki_data.get("error", "Unknown Wikipedia error"))
-        
-        # 2. Get DBpedia structured data
-        dbpedia_data = self._fetch_dbpedia(topic)
         if not dbpedia_data.get("success", False):
             errors.append(dbpedia_data.get("error", "Unknown DBpedia error"))
-        
-        # 3. Get news articles
-        news_data = self._fetch_news(topic)
         if not news_data.get("success", False):
             errors.append(news_data.get("error", "Unknown news API error"))
         
+        if not normalize:
+            return {
+                "success": len(errors) == 0,
+                "topic": topic,
+                "data": {
+                    "wikipedia": wiki_data,
+                    "dbpedia": dbpedia_data,
+                    "news": news_data.get("articles", [])
+                },
+                "errors": errors if errors else None,
+                "processing_time_ms": round((time.perf_counter() - start_time) * 1000, 2)
+            }
+        
         # 4. Create a normalized topic data model
         try:
             topic_data = self._normalize_data(
@@ -66,51 +245,151 @@ class DataFetcher:
             )
             
             # 5. Return complete result
-            elapsed_time = time.time() - start_time
+            elapsed_ms = round((time.perf_counter() - start_time) * 1000, 2)
             
             return {
                 "success": len(errors) == 0,
                 "topic": topic,
                 "data": topic_data,  # Return the TopicData object directly
                 "errors": errors if errors else None,
-                "processing_time": format_time_elapsed(elapsed_time)
+                "processing_time_ms": elapsed_ms
             }
         except Exception as e:
-            logger.exception(f"Error in fetch_topic_data: {e}")
+            logger.exception("Error in fetch_topic_data")
             # Return a minimal success response with error info
-            elapsed_time = time.time() - start_time
+            elapsed_ms = round((time.perf_counter() - start_time) * 1000, 2)
             errors.append(f"Data normalization error: {str(e)}")
             
             # Create a minimal TopicData object with just Wikipedia data if available
-            if wiki_data.get("success", False) and "summary" in wiki_data:
-                from models.data_model import WikipediaData, DBpediaData
-                minimal_topic_data = TopicData(
-                    topic=topic,
-                    wikipedia=WikipediaData(
-                        summary=wiki_data.get("summary", f"Error fetching data for {topic}"),
-                        url=wiki_data.get("url", "")
-                    ),
-                    dbpedia=DBpediaData()
+            if wiki_data.get("success", False):
+                minimal_topic_data = self._build_error_topic_data(
+                    topic, wiki_data.get("summary"), wiki_data.get("url", "")
                 )
             else:
-                from models.data_model import WikipediaData, DBpediaData
-                minimal_topic_data = TopicData(
-                    topic=topic,
-                    wikipedia=WikipediaData(
-                        summary=f"Error fetching data for {topic}",
-                        url=""
-                    ),
-                    dbpedia=DBpediaData()
-                )
+                minimal_topic_data = self._build_error_topic_data(topic)
             
             return {
                 "success": False,
                 "topic": topic,
                 "data": minimal_topic_data,
                 "errors": errors,
-                "processing_time": format_time_elapsed(elapsed_time)
+                "processing_time_ms": elapsed_ms
             }
     
+    def _cached_fetch(
+        self,
+        cache: LRUCache,
+        topic: str,
+        fetch: Callable[[str], Dict[str, Any]],
+        breaker: Optional[CircuitBreaker] = None
+    ) -> Dict[str, Any]:
+        """
+        Return a source response from cache, calling fetch on a miss.
+        
+        Concurrent misses for the same source and topic share a single call to
+        fetch, so a burst of requests for one topic hits each upstream once.
+        
+        Args:
+            cache: Source-specific response cache
+            topic: Canonicalized topic keyword
+            fetch: Service call that fetches the response
+            breaker: Circuit breaker for the source; while open, fetch is skipped
+            
+        Returns:
+            Source response; only successful, available responses are cached
+        """
+        key = topic.casefold()
+        use_cache = CacheConfig.ENABLE_CACHE
+        if use_cache:
+            result = cache.get(key)
+            if result is not None:
+                return result
+        
+        inflight_key = (cache, key)
+        with self._inflight_lock:
+            future = self._inflight.get(inflight_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[inflight_key] = future
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            result = self._guarded_call(breaker, topic, fetch)
+            if use_cache and result.get("success", False) and not result.get("unavailable"):
+                cache.set(key, result)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[inflight_key]
+    
+    def _guarded_call(
+        self,
+        breaker: Optional[CircuitBreaker],
+        topic: str,
+        fetch: Callable[[str], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Call fetch through the source's circuit breaker, recording its latency.
+        
+        Responses replayed from the disk cache are not timed and do not count
+        toward the breaker. A call that outlives APIConfig.SOURCE_FETCH_TIMEOUT
+        counts as a failure even if it eventually succeeds.
+        
+        Args:
+            breaker: Circuit breaker for the source, or None
+            topic: Canonicalized topic keyword
+            fetch: Service call that fetches the response
+            
+        Returns:
+            Source response, or an unavailable error while the breaker is open
+        """
+        if breaker is None:
+            return fetch(topic)
+        
+        if not breaker.allow():
+            return {
+                "success": False,
+                "error": f"{breaker.name} is temporarily skipped after repeated failures",
+                "unavailable": True
+            }
+        
+        call_start = time.perf_counter()
+        hits_before, misses_before = disk_cache_counts()
+        try:
+            result = fetch(topic)
+        except Exception:
+            fetch_latency.observe(breaker.name, "error", time.perf_counter() - call_start)
+            breaker.record_failure()
+            raise
+        
+        # A response replayed from the disk cache says nothing about the upstream's
+        # health or latency
+        hits_after, misses_after = disk_cache_counts()
+        if hits_after > hits_before and misses_after == misses_before:
+            return result
+        
+        elapsed = time.perf_counter() - call_start
+        if elapsed >= APIConfig.SOURCE_FETCH_TIMEOUT:
+            # The caller has already given up on this response
+            fetch_latency.observe(breaker.name, "timeout", elapsed)
+            breaker.record_failure()
+            return result
+        
+        outcome = "success" if result.get("success", False) else "error"
+        fetch_latency.observe(breaker.name, outcome, elapsed)
+        if result.get("unavailable"):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return result
+    
     def _fetch_wikipedia(self, topic: str) -> Dict[str, Any]:
         """
         Fetch Wikipedia summary.
@@ -122,10 +401,12 @@ class DataFetcher:
             Wikipedia API response
         """
         try:
-            logger.info(f"Fetching Wikipedia data for: {topic}")
-            return wikipedia_service.get_summary(topic)
+            logger.info("Fetching Wikipedia data for: %s", topic)
+            return self._cached_fetch(
+                _wikipedia_cache, topic, wikipedia_service.get_summary_and_links, _breakers["Wikipedia"]
+            )
         except Exception as e:
-            logger.error(f"Wikipedia fetch error: {str(e)}")
+            logger.error("Wikipedia fetch error: %s", e)
             return {"success": False, "error": f"Wikipedia error: {str(e)}"}
     
     def _fetch_dbpedia(self, topic: str) -> Dict[str, Any]:
@@ -139,10 +420,10 @@ class DataFetcher:
             DBpedia SPARQL query response
         """
         try:
-            logger.info(f"Fetching DBpedia data for: {topic}")
-            return dbpedia_service.get_data(topic)
+            logger.info("Fetching DBpedia data for: %s", topic)
+            return self._cached_fetch(_dbpedia_cache, topic, dbpedia_service.get_data, _breakers["DBpedia"])
         except Exception as e:
-            logger.error(f"DBpedia fetch error: {str(e)}")
+            logger.error("DBpedia fetch error: %s", e)
             return {"success": False, "error": f"DBpedia error: {str(e)}"}
     
     def _fetch_news(self, topic: str) -> Dict[str, Any]:
@@ -156,31 +437,37 @@ class DataFetcher:
             News API response
         """
         try:
-            logger.info(f"Fetching news for: {topic}")
-            news_result = news_service.get_news(topic)
+            logger.info("Fetching news for: %s", topic)
+            news_result = self._cached_fetch(_news_cache, topic, news_service.get_news, _breakers["News"])
             
             # Even if news API returns an error, return an empty success response
             # to allow the application to continue
             if not news_result.get("success", False):
-                logger.warning(f"News API error: {news_result.get('error', 'Unknown error')}. Continuing with empty news data.")
-                return {
-                    "success": True,
-                    "topic": topic,
-                    "retrieved_at": iso_now(),
-                    "count": 0,
-                    "articles": []
-                }
+                logger.warning("News API error: %s. Continuing with empty news data.", news_result.get('error', 'Unknown error'))
+                return self._empty_news(topic)
             return news_result
         except Exception as e:
-            logger.error(f"News fetch error: {str(e)}")
+            logger.error("News fetch error: %s", e)
             # Return empty news data instead of error
-            return {
-                "success": True,
-                "topic": topic,
-                "retrieved_at": iso_now(),
-                "count": 0,
-                "articles": []
-            }
+            return self._empty_news(topic)
+    
+    def _empty_news(self, topic: str) -> Dict[str, Any]:
+        """
+        Build the empty news response used when news cannot be fetched.
+        
+        Args:
+            topic: Topic keyword
+            
+        Returns:
+            Successful news response with no articles
+        """
+        return {
+            "success": True,
+            "topic": topic,
+            "retrieved_at": iso_now(),
+            "count": 0,
+            "articles": []
+        }
     
     def _normalize_data(
         self,
@@ -201,54 +488,9 @@ class DataFetcher:
         Returns:
             Normalized TopicData instance
         """
-        # Create WikipediaData with safe defaults
-        try:
-            if wiki_data and wiki_data.get("success", False):
-                wikipedia = WikipediaData(
-                    summary=wiki_data.get("summary", ""),
-                    url=wiki_data.get("url", "")
-                )
-            else:
-                error_msg = wiki_data.get('error', 'Unknown error') if wiki_data else 'No Wikipedia data'
-                wikipedia = WikipediaData(
-                    summary=f"Information about {topic} is not available at this time.",
-                    url=""
-                )
-                logger.warning(f"Using fallback Wikipedia data: {error_msg}")
-        except Exception as e:
-            logger.exception(f"Error processing Wikipedia data: {e}")
-            wikipedia = WikipediaData(
-                summary=f"Information about {topic} is not available at this time.",
-                url=""
-            )
-        
-        # Create DBpediaData with safe defaults
-        try:
-            if dbpedia_data and dbpedia_data.get("success", False):
-                dbpedia = DBpediaData(
-                    abstract=dbpedia_data.get("abstract", ""),
-                    categories=dbpedia_data.get("categories", []),
-                    resource_uri=dbpedia_data.get("resource_uri", "")
-                )
-            else:
-                dbpedia = DBpediaData()
-                logger.warning(f"Using empty DBpedia data")
-        except Exception as e:
-            logger.exception(f"Error processing DBpedia data: {e}")
-            dbpedia = DBpediaData()
-        
-        # Create NewsArticle list with safe defaults
-        news_articles = []
-        try:
-            if news_data and news_data.get("success", False) and "articles" in news_data:
-                for article in news_data["articles"]:
-                    try:
-                        if article:
-                            news_articles.append(NewsArticle.from_raw(article))
-                    except Exception as article_err:
-                        logger.warning(f"Error processing news article: {article_err}")
-        except Exception as e:
-            logger.exception(f"Error processing news data: {e}")
+        wikipedia = self._normalize_wikipedia(topic, wiki_data)
+        dbpedia = self._normalize_dbpedia(dbpedia_data)
+        news_articles = self._normalize_news(news_data)
         
         # Create and return the TopicData
         try:
@@ -259,46 +501,137 @@ class DataFetcher:
                 news=news_articles
             )
         except Exception as e:
-            logger.exception(f"Error creating TopicData: {e}")
+            logger.exception("Error creating TopicData")
             # Return the most minimal valid TopicData object possible
-            return TopicData(
-                topic=topic,
-                wikipedia=WikipediaData(
-                    summary=f"Information about {topic} is not available at this time.",
-                    url=""
-                ),
-                dbpedia=DBpediaData(),
-                news=[]
+            return self._build_error_topic_data(topic)
+    
+    def _build_error_topic_data(self, topic: str, summary: Optional[str] = None, url: str = "") -> TopicData:
+        """
+        Build a minimal TopicData for when normalization fails.
+        
+        Args:
+            topic: Topic keyword
+            summary: Wikipedia summary to keep, if one was fetched
+            url: Wikipedia URL to keep
+            
+        Returns:
+            TopicData with no DBpedia data or news
+        """
+        return TopicData(
+            topic=topic,
+            wikipedia=WikipediaData(
+                summary=summary or _ERROR_SUMMARY_TMPL.format(topic=topic),
+                url=url
+            ),
+            dbpedia=EMPTY_DBPEDIA
+        )
+    
+    def _normalize_wikipedia(self, topic: str, wiki_data: Dict[str, Any]) -> WikipediaData:
+        """
+        Build WikipediaData from a Wikipedia response, with a placeholder summary on failure.
+        
+        Args:
+            topic: Topic keyword
+            wiki_data: Wikipedia API response
+            
+        Returns:
+            WikipediaData instance
+        """
+        if wiki_data and wiki_data.get("success", False):
+            return WikipediaData(
+                summary=wiki_data.get("summary", ""),
+                url=wiki_data.get("url", "")
+            )
+        
+        if logger.isEnabledFor(logging.WARNING):
+            error_msg = wiki_data.get('error', 'Unknown error') if wiki_data else 'No Wikipedia data'
+            logger.warning("Using fallback Wikipedia data: %s", error_msg)
+        return WikipediaData(
+            summary=_ERROR_SUMMARY_TMPL.format(topic=topic),
+            url=""
+        )
+    
+    def _normalize_dbpedia(self, dbpedia_data: Dict[str, Any]) -> DBpediaData:
+        """
+        Build DBpediaData from a DBpedia response, empty on failure.
+        
+        Args:
+            dbpedia_data: DBpedia API response
+            
+        Returns:
+            DBpediaData instance
+        """
+        if dbpedia_data and dbpedia_data.get("success", False):
+            return DBpediaData(
+                abstract=dbpedia_data.get("abstract", ""),
+                categories=dbpedia_data.get("categories", []),
+                resource_uri=dbpedia_data.get("resource_uri", "")
             )
+        
+        logger.warning("Using empty DBpedia data")
+        return EMPTY_DBPEDIA
+    
+    def _normalize_news(self, news_data: Dict[str, Any]) -> Sequence[NewsArticle]:
+        """
+        Convert the articles of a news response to NewsArticle objects.
+        
+        Args:
+            news_data: News API response
+            
+        Returns:
+            List of NewsArticle instances (empty on failure)
+        """
+        if not (news_data and news_data.get("success", False)):
+            return EMPTY_NEWS
+        
+        return [a for a in map(NewsArticle.from_raw, news_data.get("articles", ())) if a is not None]
     
-    def get_related_topics(self, topic: str, max_results: int = 5) -> List[str]:
+    def get_related_topics(
+        self,
+        topic: str,
+        max_results: int = 5,
+        dbpedia_data: Optional[Dict[str, Any]] = None,
+        topic_data: Optional[TopicData] = None
+    ) -> List[str]:
         """
         Get related topics for the given topic.
         
         Args:
             topic: Main topic
             max_results: Maximum number of related topics to return
+            dbpedia_data: DBpedia response already fetched for the topic
+            topic_data: Topic data already fetched for the topic
             
         Returns:
             List of related topic strings
         """
-        # Try to get related topics from Wikipedia
-        wiki_related = wikipedia_service.get_related_topics(topic)
+        topic = _canonicalize(topic)
+        
+        # Try to get related topics from Wikipedia, reusing the cached summary lookup
+        wiki_data = self._fetch_wikipedia(topic)
+        if "related_topics" in wiki_data:
+            wiki_related = wiki_data["related_topics"]
+        else:
+            wiki_related = wikipedia_service.get_related_topics(topic)
         
         # If DBpedia has a resource URI, also get related entities
         resource_uri = None
-        dbp_data = dbpedia_service.get_data(topic)
-        if dbp_data.get("success", False):
-            resource_uri = dbp_data.get("resource_uri")
+        if topic_data is not None:
+            resource_uri = topic_data.dbpedia.resource_uri
+        else:
+            if dbpedia_data is None:
+                dbpedia_data = self._fetch_dbpedia(topic)
+            if dbpedia_data.get("success", False):
+                resource_uri = dbpedia_data.get("resource_uri")
         
         dbp_related = []
         if resource_uri:
             related_entities = dbpedia_service.get_related_entities(resource_uri)
             dbp_related = [entity.get("label", "") for entity in related_entities if "label" in entity]
         
-        # Combine and deduplicate
-        all_related = list(set(wiki_related + dbp_related))
-        return all_related[:max_results]
+        # Combine and deduplicate, keeping source order
+        unique_related = dict.fromkeys(itertools.chain(wiki_related, dbp_related))
+        return list(itertools.islice(unique_related, max_results))
 
 
 # Create a singleton instance
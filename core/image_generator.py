@@ -2,19 +2,162 @@
 Image generator for creating images using Stable Diffusion.
 """
 
+import hashlib
+import itertools
 import logging
+import os
+import threading
 import time
 import re
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import Dict, List, Any, Optional, Tuple
 
-from models.data_model import TopicData, Image
+from models.data_model import TopicData, WikipediaData, EMPTY_DBPEDIA
+from services.groq_client import groq_client
 from services.stable_diffusion import stable_diffusion_client
-from config import ContentConfig
-from utils.helpers import format_time_elapsed, truncate_text, iso_now
+from config import APIConfig, CacheConfig, ContentConfig
+from utils.cache import LRUCache
+from utils.helpers import format_time_elapsed, truncate_text, iso_now, topic_file_prefix
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# LLaMA style/emotion choices keyed by topic, tone and prompt context
+_style_cache = LRUCache(
+    maxsize=CacheConfig.MAX_DATA_CACHE_SIZE,
+    timeout=CacheConfig.CACHE_TIMEOUT
+)
+
+
+def _has_stability_key() -> bool:
+    """Check whether the Stability AI client has a non-blank API key."""
+    api_key = stable_diffusion_client.api_key
+    return bool(api_key and api_key.strip())
+
+
+# Whether a Stability AI key is configured, checked once rather than per request
+_HAS_STABILITY_KEY = _has_stability_key()
+
+
+def refresh_credentials() -> None:
+    """Re-read the Stability AI key after it has been changed on the client."""
+    global _HAS_STABILITY_KEY
+    _HAS_STABILITY_KEY = _has_stability_key()
+
+
+# LLaMA prompt for choosing an image style and emotion
+_STYLE_PROMPT_TMPL = """
+        Based on the topic "{topic}" and the following context, determine the most appropriate art style and emotional tone for an image generation.
+        
+        CONTEXT:
+        {context}
+        
+        {tone_line}
+        
+        Choose from the following styles:
+        - photorealistic
+        - oil painting
+        - watercolor
+        - digital art
+        - pencil sketch
+        - pop art
+        - abstract art
+        - cinematic
+        - anime
+        - cartoon
+        - nature photography
+        - scientific illustration
+        - minimalist
+        - artistic
+        
+        Return ONLY a JSON object with two fields:
+        1. "style": The chosen art style
+        2. "emotion": A single word or short phrase describing the emotional tone (e.g., "serene", "energetic", "melancholic")
+        
+        The style and emotion should make sense together and be appropriate for the topic.
+        """
+
+# Styles LLaMA may choose from, as listed in _STYLE_PROMPT_TMPL
+_VALID_STYLES = frozenset({
+    "photorealistic", "oil painting", "watercolor", "digital art",
+    "pencil sketch", "pop art", "abstract art", "cinematic", "anime",
+    "cartoon", "nature photography", "scientific illustration",
+    "minimalist", "artistic"
+})
+
+# LLaMA prompt for expanding a topic into a Stable Diffusion prompt
+_ENHANCE_PROMPT_TMPL = """
+        Create a detailed Stable Diffusion prompt for an image about "{topic}".
+        
+        Context information: {context}
+        
+        Your prompt should:
+        1. Include specific visual details that would make an interesting image
+        2. Specify style, lighting, mood, and composition
+        3. Be formatted as a comma-separated list of descriptors
+        4. Be around 40-60 words in length
+        
+        Stable Diffusion Prompt:
+        """
+
+# Runs of characters not allowed in a topic_id
+_TOPIC_ID_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Fixed fields of the image entry served when generation is unavailable
+_FALLBACK_IMAGE_TEMPLATE = {
+    "file_path": "fallback.jpg",
+    "url": "/images/fallback.jpg",
+    "model_version": "fallback"
+}
+
+# Map narrative tones to appropriate image styles and emotions
+_TONE_STYLE_MAP = {
+    "dramatic": ("cinematic", "intense"),
+    "poetic": ("artistic", "contemplative"),
+    "humorous": ("cartoon", "playful"),
+    "technical": ("digital art", "precise"),
+    "simple": ("minimalist", "calm"),
+    "informative": ("realistic", "neutral")
+}
+
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """
+    Compile keywords into one pattern matching any of them as a substring.
+    
+    Args:
+        keywords: Lowercase keywords
+        
+    Returns:
+        Compiled alternation pattern
+    """
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Topic categories in priority order, with the (style, emotion) each maps to
+_STYLE_RULES = (
+    # Historical content tends to work better with traditional art styles
+    (_keyword_pattern(['ancient', 'medieval', 'history', 'historical', 'century', 'war', 'empire',
+                       'kingdom', 'dynasty', 'revolution', 'civilization']),
+     "oil painting", "nostalgic"),
+    # Scientific content tends to work better with precise or digital styles
+    (_keyword_pattern(['science', 'physics', 'chemistry', 'biology', 'mathematics',
+                       'quantum', 'molecular', 'scientific', 'theory', 'experiment']),
+     "scientific illustration", "curious"),
+    # Technological content tends to work better with digital or futuristic styles
+    (_keyword_pattern(['technology', 'computer', 'digital', 'internet', 'software', 'hardware',
+                       'algorithm', 'data', 'artificial intelligence', 'machine learning']),
+     "digital art", "futuristic"),
+    # Natural subjects tend to work better with photographic styles
+    (_keyword_pattern(['nature', 'animal', 'plant', 'forest', 'ocean', 'mountain', 'landscape',
+                       'wildlife', 'ecosystem', 'environment', 'biology']),
+     "nature photography", "serene"),
+    # Abstract concepts tend to work better with abstract or surrealist styles
+    (_keyword_pattern(['idea', 'concept', 'philosophy', 'abstract', 'theory', 'consciousness',
+                       'emotion', 'feeling', 'dream', 'perception', 'reality']),
+     "abstract art", "contemplative"),
+)
+
 class ImageGenerator:
     """
     Generates images using Stable Diffusion based on topic data.
@@ -23,7 +166,14 @@ class ImageGenerator:
     def __init__(self):
         """Initialize the image generator."""
         # StableDiffusionClient is initialized as a singleton in its module
-        pass
+        # Generations in progress, shared with concurrent identical requests
+        self._inflight: Dict[Tuple[Any, ...], Future] = {}
+        self._inflight_lock = threading.Lock()
+        # LLaMA style analysis runs here so a slow response can be abandoned
+        self._analysis_pool = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="styleanalysis"
+        )
     
     def generate_images(
         self,
@@ -57,16 +207,15 @@ class ImageGenerator:
         Returns:
             Dictionary with generated images and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Handle backward compatibility with topic and context parameters
         if not topic_data and topic:
             # Create a simple TopicData object from the topic string
-            from models.data_model import WikipediaData, DBpediaData
             topic_data = TopicData(
                 topic=topic,
                 wikipedia=WikipediaData(summary=context if context else "", url=""),
-                dbpedia=DBpediaData(),
+                dbpedia=EMPTY_DBPEDIA,
                 news=[]
             )
             logger.info(f"Created TopicData from topic string: {topic}")
@@ -87,8 +236,7 @@ class ImageGenerator:
         current_topic = topic_data.topic
         
         # Create a unique topic_id by sanitizing the topic name
-        topic_id = re.sub(r'[^a-zA-Z0-9]', '_', current_topic.lower())
-        topic_id = f"topic_{topic_id}_{int(time.time())}"
+        topic_id = f"topic_{_TOPIC_ID_RE.sub('_', current_topic.lower()).strip('_')}_{int(time.time())}"
         
         # Use defaults from config if not specified - default to 16:9 aspect ratio
         num_variants = num_variants or ContentConfig.DEFAULT_NUM_VARIANTS
@@ -96,31 +244,21 @@ class ImageGenerator:
         height = height or int(width * 9 / 16)  # Default to 16:9 ratio
         temperature = temperature or ContentConfig.DEFAULT_TEMPERATURE
         
-        # Build context text from Wikipedia and/or DBpedia
-        context_text = ""
-        if topic_data.wikipedia.summary:
-            context_text = topic_data.wikipedia.summary
-        elif topic_data.dbpedia.abstract:
-            context_text = topic_data.dbpedia.abstract
-        
-        # Include narrative text if provided (it might have better context)
-        if narrative_text:
-            context_text = narrative_text
+        # Build context text from the narrative if provided (it might have better
+        # context), otherwise from Wikipedia and/or DBpedia
+        context_text = narrative_text or topic_data.wikipedia.summary or topic_data.dbpedia.abstract or ""
         
         # Automatically determine style and emotion based on the topic, context and tone
-        style, emotion = self._analyze_topic_for_style_and_emotion(topic_data.topic, context_text, tone)
+        style, emotion = self._analyze_topic_for_style_and_emotion(current_topic, context_text, tone)
         
-        logger.info(f"Generating images for topic: {topic_data.topic} (tone={tone}, style={style}, emotion={emotion}, variants={num_variants}, temperature={temperature})")
+        logger.info(f"Generating images for topic: {current_topic} (tone={tone}, style={style}, emotion={emotion}, variants={num_variants}, temperature={temperature})")
         
         # Get news headlines
-        headlines = []
-        for article in topic_data.news[:3]:
-            if article.title:
-                headlines.append(article.title)
+        headlines = list(itertools.islice((article.title for article in topic_data.news if article.title), 3))
         
         # Build the prompt
         prompt = stable_diffusion_client.build_prompt(
-            topic=topic_data.topic,
+            topic=current_topic,
             context_text=context_text,
             style=style,
             emotion=emotion,
@@ -130,34 +268,16 @@ class ImageGenerator:
         )
         
         # Check if we have a valid Stability API key instead of checking for endpoint
-        if not stable_diffusion_client.api_key or stable_diffusion_client.api_key.strip() == "":
+        if not _HAS_STABILITY_KEY:
             logger.warning("No Stability AI API key configured. Using fallback image.")
-            # Create a fallback image result
-            return {
-                "success": True,
-                "images": [{
-                    "file_path": "fallback.jpg",
-                    "url": "/images/fallback.jpg",  # Use updated image path
-                    "prompt": prompt,
-                    "model_version": "fallback",
-                    "timestamp": iso_now(),
-                    "style": style,
-                    "width": width,
-                    "height": height,
-                    "topic_id": topic_id
-                }],
-                "prompt": prompt,
-                "style": style,
-                "emotion": emotion,
-                "processing_time": format_time_elapsed(time.time() - start_time),
-                "fallback": True,
-                "fallback_reason": "No Stability AI API key configured",
-                "topic_id": topic_id
-            }
+            return self._build_fallback_result(
+                prompt, style, emotion, width, height, topic_id, start_time,
+                "No Stability AI API key configured"
+            )
         
         # Generate images
         try:
-            result = stable_diffusion_client.generate_image(
+            result = self._generate_coalesced(
                 prompt=prompt,
                 width=width,
                 height=height,
@@ -166,74 +286,54 @@ class ImageGenerator:
                 topic_id=topic_id  # Pass the topic ID to avoid mixing images from different topics
             )
             
-            if not result or any(not r.get("success", False) for r in result):
-                # If any image generation failed
-                elapsed_time = time.time() - start_time
-                
-                # If all failed, check if we have any partial results
-                if all(not r.get("success", False) for r in result):
-                    # No successful images generated
-                    logger.error("All image generation attempts failed")
-                    # Return a fallback response
-                    return {
-                        "success": True,
-                        "images": [{
-                            "file_path": "fallback.jpg",
-                            "url": "/images/fallback.jpg",  # Use updated image path
-                            "prompt": prompt,
-                            "model_version": "fallback",
-                            "timestamp": iso_now(),
-                            "style": style,
-                            "width": width,
-                            "height": height,
-                            "topic_id": topic_id
-                        }],
-                        "prompt": prompt,
-                        "style": style,
-                        "emotion": emotion,
-                        "processing_time": format_time_elapsed(elapsed_time),
-                        "fallback": True,
-                        "fallback_reason": "Image generation failed",
-                        "details": result,
-                        "topic_id": topic_id
-                    }
-                else:
-                    # Some images were generated successfully
-                    return {
-                        "success": False,
-                        "error": "Failed to generate one or more images",
-                        "partial_results": result,
-                        "processing_time": format_time_elapsed(elapsed_time),
-                        "topic_id": topic_id
-                    }
+            successes = [r for r in result if r.get("success", False)]
+            
+            if not successes:
+                # No successful images generated
+                logger.error("All image generation attempts failed")
+                return self._build_fallback_result(
+                    prompt, style, emotion, width, height, topic_id, start_time,
+                    "Image generation failed", details=result
+                )
+            if len(successes) < len(result):
+                # Only some images were generated successfully
+                return {
+                    "success": False,
+                    "error": "Failed to generate one or more images",
+                    "partial_results": result,
+                    "processing_time": format_time_elapsed(time.perf_counter() - start_time),
+                    "topic_id": topic_id
+                }
             
-            # Create image models
+            # Build the image entries in Image.to_dict() form; the generation
+            # results may be shared with coalesced requests, so they are not modified
             images = []
-            for img_data in result:
-                if img_data.get("success", False):
-                    # Make sure URL is set
-                    if "url" not in img_data and "file_path" in img_data:
-                        from pathlib import Path
-                        filename = Path(img_data["file_path"]).name
-                        img_data["url"] = f"/images/{filename}"
-                        
-                    images.append(Image(
-                        file_path=img_data.get("file_path", ""),
-                        prompt=img_data.get("prompt", ""),
-                        model_version=img_data.get("model_version", ""),
-                        timestamp=img_data.get("timestamp", ""),
-                        style=style,
-                        width=img_data.get("width", width),
-                        height=img_data.get("height", height),
-                        url=img_data.get("url", "/static/img/fallback.jpg"),  # Ensure URL is set
-                        topic_id=topic_id
-                    ))
+            for img_data in successes:
+                # Make sure URL is set
+                url = img_data.get("url")
+                if url is None:
+                    if "file_path" in img_data:
+                        url = f"/images/{os.path.basename(img_data['file_path'])}"
+                    else:
+                        url = "/static/img/fallback.jpg"
+                
+                images.append({
+                    "file_path": img_data.get("file_path", ""),
+                    "prompt": img_data.get("prompt", ""),
+                    "model_version": img_data.get("model_version", ""),
+                    "timestamp": img_data.get("timestamp", ""),
+                    "style": style,
+                    "width": img_data.get("width", width),
+                    "height": img_data.get("height", height),
+                    "url": url,
+                    "topic_id": topic_id
+                })
             
             # Return the result
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
             return {
                 "success": True,
-                "images": [img.to_dict() for img in images],
+                "images": images,
                 "prompt": prompt,
                 "style": style,
                 "emotion": emotion,
@@ -243,30 +343,119 @@ class ImageGenerator:
         except Exception as e:
             # Handle any unexpected errors
             logger.exception(f"Unexpected error during image generation: {str(e)}")
-            elapsed_time = time.time() - start_time
+            return self._build_fallback_result(
+                prompt, style, emotion, width, height, topic_id, start_time,
+                f"Error: {str(e)}"
+            )
+    
+    def _generate_coalesced(
+        self,
+        prompt: str,
+        width: int,
+        height: int,
+        num_variants: int,
+        overwrite_cache: bool,
+        topic_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate images, sharing one Stability AI call between identical concurrent requests.
+        
+        Requests for the same prompt, size and variant count on the same topic
+        that arrive while a generation is running wait for its result instead of
+        paying for another generation.
+        
+        Args:
+            prompt: Text prompt for image generation
+            width: Image width in pixels
+            height: Image height in pixels
+            num_variants: Number of image variants to generate
+            overwrite_cache: Whether to overwrite cached images
+            topic_id: Identifier for the current topic
             
-            # Return a fallback image
-            return {
-                "success": True,
-                "images": [{
-                    "file_path": "fallback.jpg",
-                    "url": "/images/fallback.jpg",  # Use updated image path
-                    "prompt": prompt,
-                    "model_version": "fallback",
-                    "timestamp": iso_now(),
-                    "style": style,
-                    "width": width,
-                    "height": height,
-                    "topic_id": topic_id
-                }],
-                "prompt": prompt,
-                "style": style,
-                "emotion": emotion,
-                "processing_time": format_time_elapsed(elapsed_time),
-                "fallback": True,
-                "fallback_reason": f"Error: {str(e)}",
-                "topic_id": topic_id
-            }
+        Returns:
+            List of dictionaries with image metadata
+        """
+        key = (prompt, width, height, num_variants, overwrite_cache, topic_file_prefix(topic_id))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not leader:
+            logger.info(f"Joining in-progress image generation for topic_id: {topic_id}")
+            return future.result()
+        
+        try:
+            result = stable_diffusion_client.generate_image(
+                prompt=prompt,
+                width=width,
+                height=height,
+                num_variants=num_variants,
+                overwrite_cache=overwrite_cache,
+                topic_id=topic_id
+            )
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _build_fallback_result(
+        self,
+        prompt: str,
+        style: str,
+        emotion: Optional[str],
+        width: int,
+        height: int,
+        topic_id: str,
+        start_time: float,
+        reason: str,
+        details: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the generate_images result that serves the fallback image.
+        
+        Args:
+            prompt: Prompt the images would have been generated from
+            style: Selected art style
+            emotion: Selected emotion
+            width: Requested image width
+            height: Requested image height
+            topic_id: Topic identifier
+            start_time: time.perf_counter() at the start of generate_images
+            reason: Why the fallback image is used
+            details: Per-variant generation results, if any
+            
+        Returns:
+            Successful result flagged with "fallback"
+        """
+        result = {
+            "success": True,
+            "images": [dict(
+                _FALLBACK_IMAGE_TEMPLATE,
+                prompt=prompt,
+                timestamp=iso_now(),
+                style=style,
+                width=width,
+                height=height,
+                topic_id=topic_id
+            )],
+            "prompt": prompt,
+            "style": style,
+            "emotion": emotion,
+            "processing_time": format_time_elapsed(time.perf_counter() - start_time),
+            "fallback": True,
+            "fallback_reason": reason
+        }
+        if details is not None:
+            result["details"] = details
+        result["topic_id"] = topic_id
+        return result
     
     def _analyze_topic_for_style_and_emotion(self, topic: str, context_text: str, tone: Optional[str] = None) -> Tuple[str, Optional[str]]:
         """
@@ -280,13 +469,21 @@ class ImageGenerator:
         Returns:
             Tuple of (style, emotion)
         """
+        # A tone with a predefined style and emotion decides them without LLaMA
+        if tone:
+            tone_style = _TONE_STYLE_MAP.get(tone.lower())
+            if tone_style is not None:
+                return tone_style
+        
         # Use LLaMA if available, otherwise use rule-based approach
         try:
-            from services.groq_client import groq_client
-            
-            # Try to use LLaMA for more intelligent analysis
+            # Try to use LLaMA for more intelligent analysis, but don't hold up
+            # image generation for it; a late answer still fills the style cache
             if groq_client.api_key:
-                return self._analyze_with_llama(topic, context_text, tone)
+                future = self._analysis_pool.submit(self._analyze_with_llama, topic, context_text, tone)
+                return future.result(timeout=APIConfig.STYLE_ANALYSIS_TIMEOUT)
+        except FutureTimeoutError:
+            logger.warning(f"LLaMA style analysis took longer than {APIConfig.STYLE_ANALYSIS_TIMEOUT}s; using rule-based style")
         except Exception as e:
             logger.warning(f"Could not use LLaMA for style analysis: {e}")
         
@@ -305,39 +502,22 @@ class ImageGenerator:
         Returns:
             Tuple of (style, emotion)
         """
-        from services.groq_client import groq_client
+        # Only this excerpt reaches the model, so it is all the cache key needs
+        context_excerpt = truncate_text(context_text, 500)
+        cache_key = hashlib.blake2b(
+            f"{topic}|{tone}|{context_excerpt}".encode("utf-8"), digest_size=16
+        ).digest()
+        if CacheConfig.ENABLE_CACHE:
+            cached = _style_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
         # Create a prompt for LLaMA to determine style and emotion
-        prompt = f"""
-        Based on the topic "{topic}" and the following context, determine the most appropriate art style and emotional tone for an image generation.
-        
-        CONTEXT:
-        {truncate_text(context_text, 500)}
-        
-        {"NARRATIVE TONE: " + tone if tone else ""}
-        
-        Choose from the following styles:
-        - photorealistic
-        - oil painting
-        - watercolor
-        - digital art
-        - pencil sketch
-        - pop art
-        - abstract art
-        - cinematic
-        - anime
-        - cartoon
-        - nature photography
-        - scientific illustration
-        - minimalist
-        - artistic
-        
-        Return ONLY a JSON object with two fields:
-        1. "style": The chosen art style
-        2. "emotion": A single word or short phrase describing the emotional tone (e.g., "serene", "energetic", "melancholic")
-        
-        The style and emotion should make sense together and be appropriate for the topic.
-        """
+        prompt = _STYLE_PROMPT_TMPL.format(
+            topic=topic,
+            context=context_excerpt,
+            tone_line=f"NARRATIVE TONE: {tone}" if tone else ""
+        )
         
         try:
             # Get structured output from LLaMA
@@ -349,15 +529,12 @@ class ImageGenerator:
                 emotion = data.get("emotion", None)
                 
                 # Validate the style
-                valid_styles = ["photorealistic", "oil painting", "watercolor", "digital art", 
-                                "pencil sketch", "pop art", "abstract art", "cinematic", "anime", 
-                                "cartoon", "nature photography", "scientific illustration", 
-                                "minimalist", "artistic"]
-                
-                if style not in valid_styles:
+                if style not in _VALID_STYLES:
                     logger.warning(f"LLaMA returned invalid style: {style}. Using default.")
                     style = "photorealistic"
                 
+                if CacheConfig.ENABLE_CACHE:
+                    _style_cache.set(cache_key, (style, emotion))
                 return style, emotion
             else:
                 logger.warning("Failed to get valid style/emotion from LLaMA")
@@ -383,75 +560,23 @@ class ImageGenerator:
         """
         # Prioritize tone-based style selection if tone is provided
         if tone:
-            # Map narrative tones to appropriate image styles and emotions
-            tone_style_map = {
-                "dramatic": ("cinematic", "intense"),
-                "poetic": ("artistic", "contemplative"),
-                "humorous": ("cartoon", "playful"),
-                "technical": ("digital art", "precise"),
-                "simple": ("minimalist", "calm"),
-                "informative": ("realistic", "neutral")
-            }
-            
             # If tone is in our mapping, use the predefined style and emotion
-            if tone.lower() in tone_style_map:
-                return tone_style_map[tone.lower()]
+            tone_style = _TONE_STYLE_MAP.get(tone.lower())
+            if tone_style is not None:
+                return tone_style
         
         # If no tone provided or not in our mapping, continue with regular analysis
         
-        # Make text lowercase for easier matching
-        topic_lower = topic.lower()
-        context_lower = context_text.lower() if context_text else ""
-        
-        # Historical content tends to work better with traditional art styles
-        historical_keywords = ['ancient', 'medieval', 'history', 'historical', 'century', 'war', 'empire',
-                               'kingdom', 'dynasty', 'revolution', 'civilization']
-        
-        # Scientific content tends to work better with precise or digital styles
-        scientific_keywords = ['science', 'physics', 'chemistry', 'biology', 'mathematics',
-                               'quantum', 'molecular', 'scientific', 'theory', 'experiment']
-        
-        # Technological content tends to work better with digital or futuristic styles
-        tech_keywords = ['technology', 'computer', 'digital', 'internet', 'software', 'hardware',
-                         'algorithm', 'data', 'artificial intelligence', 'machine learning']
-        
-        # Natural subjects tend to work better with photographic styles
-        nature_keywords = ['nature', 'animal', 'plant', 'forest', 'ocean', 'mountain', 'landscape',
-                           'wildlife', 'ecosystem', 'environment', 'biology']
-        
-        # Abstract concepts tend to work better with abstract or surrealist styles
-        abstract_keywords = ['idea', 'concept', 'philosophy', 'abstract', 'theory', 'consciousness',
-                            'emotion', 'feeling', 'dream', 'perception', 'reality']
-        
-        # Determine if topic matches any of our categories
-        is_historical = any(keyword in topic_lower or keyword in context_lower for keyword in historical_keywords)
-        is_scientific = any(keyword in topic_lower or keyword in context_lower for keyword in scientific_keywords)
-        is_tech = any(keyword in topic_lower or keyword in context_lower for keyword in tech_keywords)
-        is_nature = any(keyword in topic_lower or keyword in context_lower for keyword in nature_keywords)
-        is_abstract = any(keyword in topic_lower or keyword in context_lower for keyword in abstract_keywords)
-        
-        # Choose a style based on the topic categorization
-        if is_historical:
-            style = "oil painting"
-            emotion = "nostalgic"
-        elif is_scientific:
-            style = "scientific illustration"
-            emotion = "curious"
-        elif is_tech:
-            style = "digital art"
-            emotion = "futuristic"
-        elif is_nature:
-            style = "nature photography"
-            emotion = "serene"
-        elif is_abstract:
-            style = "abstract art"
-            emotion = "contemplative"
-        else:
-            # Default to photorealistic as it tends to work well with many topics
-            style = "photorealistic"
-            emotion = None
-        
-        return style, emotion
+        # Lowercase once; the newline keeps keywords from matching across the two texts
+        haystack = f"{topic}\n{context_text or ''}".lower()
+        
+        # Choose a style based on the first matching topic category
+        for pattern, style, emotion in _STYLE_RULES:
+            if pattern.search(haystack):
+                return style, emotion
+        
+        # Default to photorealistic as it tends to work well with many topics
+        return "photorealistic", None
     
     def enhance_image_prompt(self, topic: str, context_text: str) -> str:
         """
@@ -467,22 +592,8 @@ class ImageGenerator:
         Returns:
             Enhanced prompt string
         """
-        from services.groq_client import groq_client
-        
         # Create prompt for LLaMA
-        llama_prompt = f"""
-        Create a detailed Stable Diffusion prompt for an image about "{topic}".
-        
-        Context information: {truncate_text(context_text, 300)}
-        
-        Your prompt should:
-        1. Include specific visual details that would make an interesting image
-        2. Specify style, lighting, mood, and composition
-        3. Be formatted as a comma-separated list of descriptors
-        4. Be around 40-60 words in length
-        
-        Stable Diffusion Prompt:
-        """
+        llama_prompt = _ENHANCE_PROMPT_TMPL.format(topic=topic, context=truncate_text(context_text, 300))
         
         # Generate enhanced prompt
         result = groq_client.generate_text(
@@ -497,12 +608,12 @@ class ImageGenerator:
         
         return result.get("text", "").strip()
     
-    def get_available_styles(self) -> List[Dict[str, str]]:
+    def get_available_styles(self) -> Tuple[Dict[str, str], ...]:
         """
         Get available artistic styles for image generation.
         
         Returns:
-            List of style dictionaries with name and description
+            Shared tuple of style dictionaries with name and description
         """
         return stable_diffusion_client.get_styles()
 
@@ -2,20 +2,485 @@
 Narrative generator for creating text narratives using the Groq LLaMA API.
 """
 
+import asyncio
+import copy
+import hashlib
 import logging
+import re
 import time
-import textwrap
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Generator, Iterable, Iterator, List, Any, Optional, Tuple
 
 from models.data_model import Narrative, TopicData
 from services.groq_client import groq_client
-from config import ContentConfig
+from config import CacheConfig, ContentConfig
+from utils.cache import LRUCache
+from utils.metrics import generation_latency
 from utils.helpers import format_time_elapsed, clean_text, truncate_text
+from utils.validators import clamp_temperature
 from utils.text_formatter import format_title, enhance_narrative, format_bullet_points, correct_spelling
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of (topic, tone) conversation prefixes remembered as warmed
+_MAX_WARMED_PREFIXES = 256
+
+# Successful narrative, story and sentiment results keyed by prompt and sampling settings
+_response_cache = LRUCache(
+    maxsize=CacheConfig.MAX_DATA_CACHE_SIZE,
+    timeout=CacheConfig.CACHE_TIMEOUT
+)
+
+# Narratives and stories sampled at or above this temperature are expected to vary, so they are not cached
+_CACHE_MAX_TEMPERATURE = 0.4
+
+# Maximum tokens for the summary of older conversation messages
+_HISTORY_SUMMARY_MAX_TOKENS = 200
+
+# Longest summary, in tokens, the local summarizer is asked for
+_LOCAL_SUMMARY_MAX_LENGTH = 200
+
+# History messages at least this similar to an earlier one from the same speaker are dropped
+_HISTORY_DUPLICATE_SIMILARITY = 0.95
+
+# Message embeddings keyed by content digest, so repeat turns are not re-embedded
+_embedding_cache = LRUCache(
+    maxsize=CacheConfig.MAX_DATA_CACHE_SIZE,
+    timeout=CacheConfig.CACHE_TIMEOUT
+)
+
+_NON_WORD_RUN = re.compile(r'\W+')
+
+
+def _message_key(msg: Dict[str, str]) -> Tuple[str, str]:
+    """
+    Key identifying a history message up to case, punctuation and spacing.
+    
+    Args:
+        msg: Conversation message with 'role' and 'content' keys
+        
+    Returns:
+        Tuple of (role, normalized content)
+    """
+    return msg.get('role', 'user'), _NON_WORD_RUN.sub(' ', msg.get('content', '').casefold()).strip()
+
+
+def _estimate_tokens(text: str) -> int:
+    """
+    Cheaply estimate the number of tokens in a text (about 4 characters per token).
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Approximate token count
+    """
+    return len(text) // 4 + 1
+
+
+def _format_history(messages: List[Dict[str, str]]) -> str:
+    """
+    Format conversation messages as prompt lines.
+    
+    Args:
+        messages: Conversation messages with 'role' and 'content' keys
+        
+    Returns:
+        One line per message, prefixed by its speaker
+    """
+    formatted_history = ""
+    for msg in messages:
+        role = msg.get('role', 'user')
+        content = msg.get('content', '')
+        if role == 'user':
+            formatted_history += f"User: {content}\n"
+        elif role == 'ai':
+            formatted_history += f"Assistant: {content}\n"
+        elif role == 'system':
+            formatted_history += f"# {content}\n"
+    return formatted_history
+
+
+# Split narratives (see ContentConfig.NARRATIVE_SPLIT_MIN_TOKENS) are generated as
+# two concurrent calls: a short one for the bullet points and one for the narrative body
+_BULLETS_MAX_TOKENS = 200
+_BULLETS_ONLY_SUFFIX = "\n\nFor this response, write ONLY item 1: the bullet-point summary, one point per line, with no other text."
+_BODY_ONLY_SUFFIX = "\n\nFor this response, write ONLY item 2: the narrative paragraphs, with no bullet points and no headings."
+
+# A bullet or numbered list line
+_BULLET_LINE = re.compile(r'^[ \t]*(?:[•*-]|\d+[.)])[ \t]+\S.*$', re.MULTILINE)
+
+
+def _bullet_lines(text: str) -> str:
+    """
+    Keep only the list lines of a bullet-point response, dropping any heading or preamble.
+    
+    Args:
+        text: Generated bullet-point summary
+        
+    Returns:
+        The bullet lines, or the whole text if it has none
+    """
+    return "\n".join(_BULLET_LINE.findall(text)) or text.strip()
+
+
+# Maximum number of topics sent in one batched narrative request
+_NARRATIVE_BATCH_SIZE = 5
+
+# Marker the model puts before each narrative in a batched response
+_BATCH_OUTPUT_MARKER = re.compile(r'^\s*===OUTPUT \d+===\s*$', re.MULTILINE)
+
+
+class DynamicBatcher:
+    """
+    Groups streamed tokens into chunks that grow geometrically.
+    
+    The first token is passed on alone so it reaches the client as soon as
+    possible; later chunks grow (1, 3, 9, 27, 50, ...) to cut per-chunk overhead.
+    """
+    
+    MIN_BATCH = 1
+    
+    def __init__(self, growth: int = 3, max_batch: int = 50):
+        """
+        Initialize the batcher.
+        
+        Args:
+            growth: Factor the chunk size grows by after each chunk
+            max_batch: Largest number of tokens in one chunk
+        """
+        self.current_batch = self.MIN_BATCH
+        self.growth = growth
+        self.max_batch = max_batch
+    
+    def batch(self, tokens: Iterable[str]) -> Iterator[str]:
+        """
+        Regroup a token stream into growing chunks.
+        
+        Args:
+            tokens: Streamed tokens
+            
+        Yields:
+            Concatenated chunks of tokens, in order
+        """
+        buffer = []
+        for token in tokens:
+            buffer.append(token)
+            if len(buffer) >= self.current_batch:
+                yield "".join(buffer)
+                buffer.clear()
+                self.current_batch = min(self.current_batch * self.growth, self.max_batch)
+        if buffer:
+            yield "".join(buffer)
+
+
+def _response_cache_key(kind: str, prompt: str, *params: Any) -> bytes:
+    """
+    Build the response cache key for a generation request.
+    
+    Args:
+        kind: Kind of generation ("narrative", "story" or "sentiment")
+        prompt: Prompt sent to the model
+        *params: Other settings that change the output
+        
+    Returns:
+        Digest identifying the request
+    """
+    key_text = "\x1f".join(map(str, (kind, prompt) + params))
+    return hashlib.blake2b(key_text.encode('utf-8'), digest_size=16).digest()
+
+
+# Fixed conversation instructions, placed first so every request shares this prefix
+_CONVERSATION_INSTRUCTIONS = """You are CONTRA AI, a friendly and helpful assistant specializing in educational content.
+
+Your goal is to provide accurate, helpful responses that ANYONE can easily understand, regardless of their education level.
+
+LANGUAGE REQUIREMENTS:
+1. Use simple, everyday words instead of complex vocabulary
+2. Use short sentences and paragraphs
+3. Explain all technical terms or jargon in plain language
+4. Use examples from daily life to illustrate complex concepts
+5. Keep your explanations straightforward and direct
+6. Aim for a 5th-grade reading level (10-11 year old child)
+7. Use active voice rather than passive voice
+8. Break down complex ideas into simpler parts
+
+IMPORTANT GUIDELINES:
+1. Stay on the topic given below
+2. Admit when you don't know something
+3. When citing facts, add a REFERENCES section with simple explanations of sources
+4. Keep responses brief (2-3 paragraphs) and easy to read
+5. Match your writing style to the requested tone while keeping language simple
+6. Use everyday examples to make your points clear
+
+READABILITY CHECKS:
+- Would a 10-11 year old child understand your response?
+- Have you avoided all specialized terminology?
+- Are your sentences short and direct?
+- Have you used concrete examples from everyday life?
+- Have you removed unnecessary words and phrases?
+"""
+
+# Tone-specific conversation instructions
+_CONVERSATION_TONE_INSTRUCTIONS = {
+    "dramatic": """
+For dramatic tone:
+- Use simple words to create emotional impact
+- Tell a story with everyday language
+- Focus on relatable human elements
+- Keep dramatic moments easy to understand
+- Use clear cause and effect relationships
+""",
+    "poetic": """
+For poetic tone:
+- Use simple but beautiful words
+- Use imagery based on everyday experiences
+- Create rhythm with short phrases
+- Use familiar metaphors everyone would understand
+- Express complex feelings with simple language
+""",
+    "humorous": """
+For humorous tone:
+- Use simple jokes and humor
+- Make comparisons to everyday situations
+- Keep humor friendly and easy to understand
+- Avoid complex wordplay or references
+- Use light, conversational language
+""",
+    "technical": """
+For technical tone:
+- Explain technical concepts using everyday language
+- Define all specialized terms immediately
+- Use simple step-by-step explanations
+- Compare technical concepts to familiar objects or situations
+- Avoid unnecessary jargon completely
+""",
+    "simple": """
+For simple tone:
+- Use the simplest words possible
+- Keep sentences very short and direct
+- Focus only on the most important information
+- Repeat key points using different simple words
+- Use very concrete examples
+""",
+    "informative": """
+For informative tone:
+- Present facts using common, everyday language
+- Explain complex ideas with simple cause and effect
+- Use real-life examples that anyone would understand
+- Break information into small, digestible chunks
+- Connect new information to things people already know
+""",
+}
+def _instruction_block(tone: str, expertise_level: str) -> str:
+    """
+    Build the fixed guideline section of the narrative prompt.
+    
+    Args:
+        tone: Lowercase narrative tone
+        expertise_level: Target audience expertise level
+        
+    Returns:
+        Guideline lines joined with newlines
+    """
+    parts = []
+    
+    # Common instructions for all narratives with expertise level considerations
+    parts.append("IMPORTANT GUIDELINES FOR ALL NARRATIVES:")
+    
+    # Expertise level specific instructions
+    if expertise_level == "beginner":
+        parts.append("BEGINNER LEVEL AUDIENCE GUIDELINES:")
+        parts.append("- Use extremely simple, everyday language that young students can understand")
+        parts.append("- Avoid technical jargon completely, or explain it immediately in very basic terms")
+        parts.append("- Use short, simple sentences and short paragraphs")
+        parts.append("- Include many concrete examples to illustrate abstract concepts")
+        parts.append("- Focus on basic fundamental concepts only")
+        parts.append("- Define all terms, even relatively common ones")
+        parts.append("- Write at approximately a 5th-6th grade reading level")
+        parts.append("- Use simple analogies to familiar everyday experiences")
+    elif expertise_level == "intermediate":
+        parts.append("INTERMEDIATE LEVEL AUDIENCE GUIDELINES:")
+        parts.append("- Use clear language accessible to high school or undergraduate students")
+        parts.append("- Explain necessary technical terms when first used")
+        parts.append("- Balance depth with accessibility")
+        parts.append("- Include some nuance and context, but maintain clarity")
+        parts.append("- Write at approximately a high school reading level")
+        parts.append("- Use moderately complex examples and applications")
+    elif expertise_level == "advanced":
+        parts.append("ADVANCED LEVEL AUDIENCE GUIDELINES:")
+        parts.append("- Use precise, field-appropriate language for an educated audience")
+        parts.append("- Technical terms can be used without extensive explanation")
+        parts.append("- Include depth, nuance and complexity where appropriate")
+        parts.append("- Discuss advanced concepts and their implications")
+        parts.append("- Write at a college or professional reading level")
+        parts.append("- Include sophisticated examples and applications")
+        parts.append("- Still avoid unnecessarily obscure vocabulary or jargon")
+    
+    # General instructions for all levels
+    parts.append("- Structure content with a clear introduction, main points, and conclusion")
+    parts.append("- Explain ideas as if talking to someone at the appropriate level of familiarity with the topic")
+    
+    # Add tone-specific instructions with much more detail
+    if tone == 'dramatic':
+        parts.append("DRAMATIC TONE SPECIFIC GUIDELINES:")
+        parts.append("- Create a narrative arc with rising tension and emotional resonance")
+        parts.append("- Use vivid descriptive language to create scenes readers can visualize")
+        parts.append("- Include emotional stakes and human elements that create connection")
+        parts.append("- Structure content like a story with a beginning, middle, and climactic end")
+        parts.append("- Use powerful, evocative words that create strong imagery and feelings")
+        if expertise_level == "beginner":
+            parts.append("- Keep dramatic language extremely simple and accessible while still being emotionally impactful")
+        elif expertise_level == "intermediate":
+            parts.append("- Balance dramatic elements with moderately sophisticated language and concepts")
+        else:
+            parts.append("- Create literary-quality dramatic narrative with sophisticated language and complex emotional themes")
+    
+    elif tone == 'poetic':
+        parts.append("POETIC TONE SPECIFIC GUIDELINES:")
+        parts.append("- Write in a genuine poetic style with rhythm, imagery, and metaphor")
+        parts.append("- Use beautiful, lyrical language that focuses on sensory details")
+        parts.append("- Include metaphors and similes that illuminate the topic in unexpected ways")
+        parts.append("- Create a flow of ideas that follows poetic rather than purely logical structure")
+        parts.append("- Incorporate literary techniques like alliteration, assonance, and consonance")
+        parts.append("- Use line breaks and stanza-like paragraph structures for rhythmic effect")
+        
+        if expertise_level == "beginner":
+            parts.append("- Create simple but beautiful poems with clear imagery children can understand")
+            parts.append("- Use rhyming patterns and familiar metaphors to maintain engagement")
+            parts.append("- Keep vocabulary simple while still being lyrical and beautiful")
+        elif expertise_level == "intermediate":
+            parts.append("- Create moderately complex poetry with accessible but rich imagery")
+            parts.append("- Balance poetic expression with clarity of educational content")
+            parts.append("- Use a mix of free verse and structured elements that engage young adults")
+        else:
+            parts.append("- Create sophisticated poetry that could appear in literary publications")
+            parts.append("- Use complex poetic devices, extended metaphors, and rich symbolism")
+            parts.append("- Incorporate poetic techniques from various traditions as appropriate")
+    
+    elif tone == 'humorous':
+        parts.append("HUMOROUS TONE SPECIFIC GUIDELINES:")
+        parts.append("- Make the content genuinely funny and entertaining while still being informative")
+        parts.append("- Include clever jokes, wordplay, and humorous observations throughout")
+        parts.append("- Reference recognizable current cultural trends and topics for relatable humor")
+        parts.append("- Use comedic devices like exaggeration, ironic contrasts, and surprising comparisons")
+        parts.append("- Include funny analogies that help explain complex concepts in an entertaining way")
+        parts.append("- Maintain a light, conversational tone that feels like witty banter")
+        parts.append("- Incorporate funny hypothetical scenarios to illustrate points")
+        parts.append("- Make references to current events, popular culture, or universal experiences that most people would find relatable")
+        
+        if expertise_level == "beginner":
+            parts.append("- Use simple, playful humor with puns and silly examples kids would enjoy")
+            parts.append("- Include funny imagery that helps visualize concepts (like talking animals or familiar characters)")
+            parts.append("- Use humor appropriate for younger audiences while avoiding purely adult references")
+        elif expertise_level == "intermediate":
+            parts.append("- Create moderately sophisticated humor with some cleverer wordplay and references")
+            parts.append("- Balance humor with clear educational content that teens and young adults would appreciate")
+            parts.append("- Include light satire and gentle parody to illuminate the topic")
+        else:
+            parts.append("- Use sophisticated wit, satire, and clever references for an educated audience")
+            parts.append("- Create multi-layered humor that works on different levels of understanding")
+            parts.append("- Include subtle jokes and references that reward the knowledgeable reader")
+    
+    elif tone == 'technical':
+        parts.append("TECHNICAL TONE SPECIFIC GUIDELINES:")
+        parts.append("- Use precise, accurate terminology and clear explanations of processes")
+        parts.append("- Structure content in a logical progression that builds on previous concepts")
+        parts.append("- Include specific details, measurable quantities, and technical specifications")
+        parts.append("- Maintain objectivity and precision in descriptions and explanations")
+        parts.append("- Use industry-standard formatting for technical concepts")
+        
+        if expertise_level == "beginner":
+            parts.append("- Use technical structure but explain every term in extremely simple language")
+            parts.append("- Include 'in other words' explanations after any necessary technical terms")
+            parts.append("- Use simple diagrams and step-by-step explanations as if teaching a technical concept for the first time")
+        elif expertise_level == "intermediate":
+            parts.append("- Balance technical accuracy with accessibility for someone learning the field")
+            parts.append("- Include brief definitions or context for moderately advanced terms")
+            parts.append("- Use examples that connect technical concepts to practical applications")
+        else:
+            parts.append("- Use field-appropriate technical language assuming domain knowledge")
+            parts.append("- Include advanced technical details, specifications, and sophisticated analysis")
+            parts.append("- Reference related technical concepts and their interactions in the field")
+    
+    elif tone == 'simple':
+        parts.append("SIMPLE TONE SPECIFIC GUIDELINES:")
+        parts.append("- Use extremely clear, straightforward language with minimal complexity")
+        parts.append("- Focus on core ideas without unnecessary details or tangents")
+        parts.append("- Use short sentences and paragraphs with one main idea per paragraph")
+        parts.append("- Explain concepts as if speaking to someone completely unfamiliar with the topic")
+        parts.append("- Use concrete examples from everyday life to illustrate abstract ideas")
+        
+        if expertise_level == "beginner":
+            parts.append("- Write as if explaining to very young students with no background knowledge")
+            parts.append("- Use extremely basic vocabulary and sentence structure")
+            parts.append("- Include fun, simple examples that children would understand and enjoy")
+        elif expertise_level == "intermediate":
+            parts.append("- Write clearly for a general audience with basic education but no specialized knowledge")
+            parts.append("- Use approachable language while covering moderately complex ideas")
+            parts.append("- Include relatable examples that teenagers and young adults would connect with")
+        else:
+            parts.append("- Explain sophisticated concepts in plain language without oversimplifying")
+            parts.append("- Maintain depth of insight while using accessible explanations")
+            parts.append("- Use the principle of 'explain like I'm five' but for complex topics")
+    
+    else:  # informative (default)
+        parts.append("INFORMATIVE TONE SPECIFIC GUIDELINES:")
+        parts.append("- Present balanced, objective information with well-structured arguments")
+        parts.append("- Include key facts, statistics, and evidence to support main points")
+        parts.append("- Organize content with clear sections covering different aspects of the topic")
+        parts.append("- Maintain a neutral, educational tone that prioritizes accuracy")
+        parts.append("- Include historical context and current understanding of the topic")
+        
+        if expertise_level == "beginner":
+            parts.append("- Present information at an elementary school level with simple explanations")
+            parts.append("- Include basic facts with extremely clear cause-and-effect relationships")
+            parts.append("- Focus only on the most fundamental aspects of the topic")
+        elif expertise_level == "intermediate":
+            parts.append("- Present information at a high school level with some nuance and context")
+            parts.append("- Balance breadth and depth appropriate for someone with general education")
+            parts.append("- Include some analysis beyond just facts while maintaining clarity")
+        else:
+            parts.append("- Present information at a college level with substantial depth and analysis")
+            parts.append("- Include nuanced perspectives, scholarly context, and sophisticated analysis")
+            parts.append("- Cover specialized aspects of the topic that would interest a knowledgeable audience")
+    
+    # Add instructions for creating bullet points
+    parts.append("\nCREATE A STRUCTURED NARRATIVE FOLLOWING THESE STEPS:")
+    parts.append("1. Start with 3-5 bullet points that highlight the key aspects of the topic")
+    parts.append("2. Follow with several paragraphs of narrative text that elaborate on these points")
+    parts.append("3. Ensure the content is appropriate for the specified expertise level and tone")
+    parts.append("4. Make the content engaging, accurate, and tailored to the unique requirements of the chosen tone")
+    
+    return "\n".join(parts)
+
+
+# Guideline sections for every supported tone and expertise level, built once
+_INSTRUCTION_BLOCKS = {
+    (tone, expertise_level): _instruction_block(tone, expertise_level)
+    for tone in ContentConfig.VALID_TONES
+    for expertise_level in ("beginner", "intermediate", "advanced")
+}
+
+# Output format instructions closing every narrative prompt
+_NARRATIVE_TASK_FOOTER = (
+    "\nYOUR TASK:\n"
+    "1. A concise bullet-point summary (3–5 points) using simple words that anyone could understand.\n"
+    "2. A detailed narrative in 2–4 paragraphs that is accessible to all readers regardless of education level.\n"
+    "3. Ensure all vocabulary is at approximately 5th-grade reading level.\n"
+    # Additional instructions for compelling yet simple narrative
+    "Make the narrative both compelling and easy to understand by:\n"
+    "- Starting with a simple, clear introduction of what the topic is\n"
+    "- Using concrete examples and comparisons to everyday things\n"
+    "- Explaining one idea at a time in a logical order\n"
+    "- Avoiding complicated sentences with multiple clauses\n"
+    "- Concluding with a straightforward summary of why this matters to everyday people"
+)
+
+
 class NarrativeGenerator:
     """
     Generates narratives and structured text content using LLaMA.
@@ -24,7 +489,21 @@ class NarrativeGenerator:
     def __init__(self):
         """Initialize the narrative generator."""
         # GroqClient is initialized as a singleton in its module
-        pass
+        # Recently warmed (topic, tone) conversation prefixes
+        self._warmed_prefixes: OrderedDict = OrderedDict()
+        self._warmed_lock = threading.Lock()
+        # Local summarization pipeline for low-temperature narratives, loaded on first use
+        self._summarizer = None
+        self._summarizer_failed = False
+        self._summarizer_lock = threading.Lock()
+        # Sentence embedder for history dedup, loaded on first use
+        self._embedder = None
+        self._embedder_failed = False
+        self._embedder_lock = threading.Lock()
+        # Runs the bullet-point half of split narrative generation, when enabled
+        self._split_pool = ThreadPoolExecutor(
+            max_workers=ContentConfig.NARRATIVE_SPLIT_WORKERS, thread_name_prefix="narrative"
+        ) if ContentConfig.NARRATIVE_SPLIT_MIN_TOKENS > 0 else None
     
     def generate_narrative(
         self,
@@ -71,14 +550,40 @@ class NarrativeGenerator:
         formatted_topic = format_title(topic_data.topic)
         logger.info(f"Generating narrative for topic: {formatted_topic} (tone={tone}, temperature={temperature}, expertise_level={expertise_level})")
         
-        # Build the prompt for LLaMA with expertise level
-        prompt = self._build_prompt(topic_data, tone, expertise_level)
+        # Low-creativity requests are a summary of the source text, which a local model can serve
+        if temperature < ContentConfig.LOCAL_SUMMARIZER_MAX_TEMPERATURE and expertise_level != "advanced":
+            local_response = self._generate_local_narrative(
+                topic_data, tone, max_tokens, temperature, expertise_level, start_time
+            )
+            if local_response is not None:
+                return local_response
         
-        # Call the LLaMA API via Groq
-        result = groq_client.generate_text(
-            prompt=prompt,
-            max_tokens=max_tokens,
-            temperature=temperature
+        # Build the prompt for LLaMA with expertise level
+        prompt = self._build_prompt(topic_data, tone, expertise_level, formatted_topic)
+        
+        # Reuse the result of an identical low-temperature request
+        use_cache = CacheConfig.ENABLE_CACHE and temperature < _CACHE_MAX_TEMPERATURE
+        cache_key = _response_cache_key("narrative", prompt, max_tokens, temperature)
+        if use_cache:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Narrative cache hit for topic: {formatted_topic}")
+                return dict(copy.deepcopy(cached), processing_time=format_time_elapsed(time.time() - start_time), cache_hit=True)
+        
+        # Call the LLaMA API via Groq; if enabled, long narratives are generated
+        # as two shorter concurrent calls, one for the bullets and one for the body
+        groq_start = time.perf_counter()
+        if self._split_pool is not None and max_tokens >= max(ContentConfig.NARRATIVE_SPLIT_MIN_TOKENS, 2 * _BULLETS_MAX_TOKENS):
+            result, bullets_result = self._generate_split(prompt, max_tokens, temperature)
+        else:
+            result = groq_client.generate_text(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            bullets_result = None
+        generation_latency.observe(
+            "groq", "success" if result.get("success", False) else "error", time.perf_counter() - groq_start
         )
         
         if not result.get("success", False):
@@ -89,12 +594,368 @@ class NarrativeGenerator:
                 "processing_time": format_time_elapsed(elapsed_time)
             }
         
-        # Extract the generated text
+        # Split into bullets and narrative sections
         generated_text = result.get("text", "")
+        if bullets_result is None:
+            bullets, narrative = groq_client.extract_bullet_points(generated_text)
+        else:
+            # The body call only wrote the narrative; bullets taken from its opening
+            # sentences would repeat it, so a failed bullets call leaves them empty
+            narrative = generated_text
+            bullets = _bullet_lines(bullets_result.get("text", "")) if bullets_result.get("success", False) else ""
+        
+        response = self._narrative_response(
+            bullets, narrative, prompt, result.get("model", ""),
+            topic_data, tone, temperature, expertise_level, start_time
+        )
+        if use_cache:
+            _response_cache.set(cache_key, copy.deepcopy(response))
+        return response
+    
+    def _generate_local_narrative(
+        self,
+        topic_data: TopicData,
+        tone: str,
+        max_tokens: int,
+        temperature: float,
+        expertise_level: str,
+        start_time: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Generate a narrative by summarizing the source text with the local model.
         
-        # Split into bullets and narrative sections
-        bullets, narrative = groq_client.extract_bullet_points(generated_text)
+        Args:
+            topic_data: Normalized topic data
+            tone: Narrative tone
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature used
+            expertise_level: Target audience expertise level
+            start_time: Time the request started
+            
+        Returns:
+            Narrative result, or None if the local model is unavailable, there is
+            no source text or summarization failed
+        """
+        source_text = " ".join(
+            text for text in (topic_data.wikipedia.summary, topic_data.dbpedia.abstract) if text
+        )
+        if not source_text:
+            return None
+        summarizer = self._get_summarizer()
+        if summarizer is None:
+            return None
+        
+        local_start = time.perf_counter()
+        try:
+            summary = summarizer(
+                source_text,
+                max_length=min(max_tokens, _LOCAL_SUMMARY_MAX_LENGTH),
+                truncation=True
+            )[0]["summary_text"].strip()
+        except Exception as e:
+            generation_latency.observe("local", "error", time.perf_counter() - local_start)
+            logger.warning(f"Local summarization failed, using Groq: {e}")
+            return None
+        generation_latency.observe("local", "success", time.perf_counter() - local_start)
+        
+        logger.info(f"Served narrative for topic: {topic_data.topic} with the local summarizer")
+        bullets, narrative = groq_client.extract_bullet_points(summary)
+        return self._narrative_response(
+            bullets, narrative, "", ContentConfig.LOCAL_SUMMARIZER_MODEL,
+            topic_data, tone, temperature, expertise_level, start_time
+        )
+    
+    def _get_summarizer(self):
+        """
+        Get the local summarization pipeline, loading it on first use.
+        
+        transformers (and torch) are only imported once a model is configured.
+        
+        Returns:
+            transformers summarization pipeline, or None if not configured or unavailable
+        """
+        if not ContentConfig.LOCAL_SUMMARIZER_MODEL:
+            return None
+        with self._summarizer_lock:
+            if self._summarizer is None and not self._summarizer_failed:
+                try:
+                    from transformers import pipeline as transformers_pipeline
+                    self._summarizer = transformers_pipeline("summarization", model=ContentConfig.LOCAL_SUMMARIZER_MODEL)
+                except Exception as e:
+                    logger.warning(f"Could not load local summarizer {ContentConfig.LOCAL_SUMMARIZER_MODEL}: {e}")
+                    self._summarizer_failed = True
+            return self._summarizer
+    
+    def generate_narrative_stream(
+        self,
+        topic_data: TopicData,
+        tone: str = None,
+        max_tokens: int = None,
+        temperature: float = None,
+        expertise_level: str = "intermediate"
+    ) -> Generator[str, None, Dict[str, Any]]:
+        """
+        Generate a narrative, yielding the raw text as it is generated.
+        
+        Tokens are grouped by a DynamicBatcher so the first one is sent at once
+        and later ones in larger chunks. Once the stream ends the full text is
+        post-processed like generate_narrative and, at low temperatures, cached so
+        a following generate_narrative call with the same settings reuses it.
         
+        Args:
+            topic_data: Normalized topic data from various sources
+            tone: Narrative tone (e.g., "informative", "dramatic")
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0.0-1.0)
+            expertise_level: Target audience expertise level (beginner, intermediate, advanced)
+            
+        Yields:
+            Chunks of generated text, in order
+            
+        Returns:
+            Dictionary with generated narrative and metadata, as the generator's return value
+        """
+        start_time = time.time()
+        
+        # Use defaults from config if not specified
+        tone = tone or ContentConfig.DEFAULT_TONE
+        max_tokens = max_tokens or ContentConfig.DEFAULT_MAX_LENGTH
+        temperature = temperature or ContentConfig.DEFAULT_TEMPERATURE
+        
+        # Validate expertise level
+        if expertise_level not in ["beginner", "intermediate", "advanced"]:
+            logger.warning(f"Invalid expertise level: {expertise_level}. Using default: intermediate")
+            expertise_level = "intermediate"
+        
+        # Correct potential misspellings in the topic
+        corrected_topic = correct_spelling(topic_data.topic)
+        if corrected_topic != topic_data.topic:
+            logger.info(f"Corrected topic from '{topic_data.topic}' to '{corrected_topic}'")
+            topic_data.topic = corrected_topic
+        
+        formatted_topic = format_title(topic_data.topic)
+        logger.info(f"Streaming narrative for topic: {formatted_topic} (tone={tone}, temperature={temperature}, expertise_level={expertise_level})")
+        
+        prompt = self._build_prompt(topic_data, tone, expertise_level, formatted_topic)
+        
+        chunks = []
+        try:
+            tokens = groq_client.generate_text_stream(
+                prompt=prompt,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+            for chunk in DynamicBatcher().batch(tokens):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(f"Error streaming narrative: {str(e)}")
+            return {
+                "success": False,
+                "error": f"Error streaming narrative: {str(e)}",
+                "processing_time": format_time_elapsed(time.time() - start_time)
+            }
+        
+        bullets, narrative = groq_client.extract_bullet_points("".join(chunks).strip())
+        response = self._narrative_response(
+            bullets, narrative, prompt, groq_client.model,
+            topic_data, tone, temperature, expertise_level, start_time
+        )
+        if CacheConfig.ENABLE_CACHE and temperature < _CACHE_MAX_TEMPERATURE:
+            _response_cache.set(_response_cache_key("narrative", prompt, max_tokens, temperature), copy.deepcopy(response))
+        return response
+    
+    def generate_narratives_batch(
+        self,
+        topic_datas: List[TopicData],
+        tone: str = None,
+        max_tokens: int = None,
+        temperature: float = None,
+        expertise_level: str = "intermediate"
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate narratives for several topics with one LLaMA call per batch.
+        
+        The shared instructions are sent once per batch, followed by each topic's
+        context under a ===TOPIC i=== marker; the model answers each topic under
+        a matching ===OUTPUT i=== marker. If a response cannot be split into one
+        narrative per topic, that batch falls back to generate_narrative per topic.
+        
+        Args:
+            topic_datas: Normalized topic data for each topic
+            tone: Narrative tone (e.g., "informative", "dramatic")
+            max_tokens: Maximum tokens to generate per narrative
+            temperature: Sampling temperature (0.0-1.0)
+            expertise_level: Target audience expertise level (beginner, intermediate, advanced)
+            
+        Returns:
+            List of narrative results in the same order as topic_datas, each shaped
+            like the result of generate_narrative
+        """
+        # Use defaults from config if not specified
+        tone = tone or ContentConfig.DEFAULT_TONE
+        max_tokens = max_tokens or ContentConfig.DEFAULT_MAX_LENGTH
+        temperature = temperature or ContentConfig.DEFAULT_TEMPERATURE
+        
+        # Validate expertise level
+        if expertise_level not in ["beginner", "intermediate", "advanced"]:
+            logger.warning(f"Invalid expertise level: {expertise_level}. Using default: intermediate")
+            expertise_level = "intermediate"
+        
+        instructions = self._prompt_instructions(tone, expertise_level)
+        results = []
+        for offset in range(0, len(topic_datas), _NARRATIVE_BATCH_SIZE):
+            batch = topic_datas[offset:offset + _NARRATIVE_BATCH_SIZE]
+            results.extend(self._generate_narrative_batch(
+                batch, instructions, tone, max_tokens, temperature, expertise_level
+            ))
+        return results
+    
+    def _generate_narrative_batch(
+        self,
+        batch: List[TopicData],
+        instructions: str,
+        tone: str,
+        max_tokens: int,
+        temperature: float,
+        expertise_level: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate narratives for one batch of topics with a single LLaMA call.
+        
+        Args:
+            batch: Normalized topic data for each topic in the batch
+            instructions: Shared instruction prefix for the tone and expertise level
+            tone: Narrative tone
+            max_tokens: Maximum tokens to generate per narrative
+            temperature: Sampling temperature (0.0-1.0)
+            expertise_level: Target audience expertise level
+            
+        Returns:
+            List of narrative results in batch order
+        """
+        start_time = time.time()
+        
+        # Correct potential misspellings in each topic
+        for topic_data in batch:
+            corrected_topic = correct_spelling(topic_data.topic)
+            if corrected_topic != topic_data.topic:
+                logger.info(f"Corrected topic from '{topic_data.topic}' to '{corrected_topic}'")
+                topic_data.topic = corrected_topic
+        
+        logger.info(f"Generating {len(batch)} narratives in one batch (tone={tone}, temperature={temperature}, expertise_level={expertise_level})")
+        
+        parts = [
+            instructions,
+            f"\nWrite {len(batch)} separate narratives, one for each topic below, following all of the "
+            f"instructions above for each one. Start each narrative with a line containing only "
+            f"===OUTPUT i===, where i is the number of its topic."
+        ]
+        for i, topic_data in enumerate(batch, 1):
+            parts.append(f"\n===TOPIC {i}===")
+            parts.append(self._topic_section(topic_data, tone, expertise_level))
+        prompt = "\n".join(parts)
+        
+        # Call the LLaMA API via Groq, with room for every narrative in the batch
+        result = groq_client.generate_text(
+            prompt=prompt,
+            max_tokens=max_tokens * len(batch),
+            temperature=temperature
+        )
+        
+        outputs = []
+        if result.get("success", False):
+            outputs = [text.strip() for text in _BATCH_OUTPUT_MARKER.split(result.get("text", ""))[1:]]
+        
+        if len(outputs) != len(batch):
+            logger.warning(
+                f"Batch response had {len(outputs)} narratives for {len(batch)} topics; "
+                f"generating them one at a time"
+            )
+            return [
+                self.generate_narrative(topic_data, tone, max_tokens, temperature, expertise_level)
+                for topic_data in batch
+            ]
+        
+        return [
+            self._narrative_response(
+                *groq_client.extract_bullet_points(text), prompt, result.get("model", ""),
+                topic_data, tone, temperature, expertise_level, start_time
+            )
+            for text, topic_data in zip(outputs, batch)
+        ]
+    
+    def _generate_split(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Generate the narrative body and the bullet-point summary as two concurrent calls.
+        
+        Both prompts extend the same narrative prompt, so they share its cached prefix.
+        If the pool is busy and the bullets call has not started by the time the
+        body is done, it runs on the calling thread instead of waiting in the queue.
+        
+        Args:
+            prompt: Narrative prompt
+            max_tokens: Total token budget; the bullets get _BULLETS_MAX_TOKENS of it
+            temperature: Sampling temperature (0.0-1.0)
+            
+        Returns:
+            Tuple of (body result, bullets result) from the Groq client
+        """
+        bullets_future = self._split_pool.submit(
+            groq_client.generate_text,
+            prompt=prompt + _BULLETS_ONLY_SUFFIX,
+            max_tokens=_BULLETS_MAX_TOKENS,
+            temperature=temperature
+        )
+        body_result = groq_client.generate_text(
+            prompt=prompt + _BODY_ONLY_SUFFIX,
+            max_tokens=max_tokens - _BULLETS_MAX_TOKENS,
+            temperature=temperature
+        )
+        if bullets_future.cancel():
+            bullets_result = groq_client.generate_text(
+                prompt=prompt + _BULLETS_ONLY_SUFFIX,
+                max_tokens=_BULLETS_MAX_TOKENS,
+                temperature=temperature
+            )
+        else:
+            bullets_result = bullets_future.result()
+        return body_result, bullets_result
+    
+    def _narrative_response(
+        self,
+        bullets: str,
+        narrative: str,
+        prompt: str,
+        model: str,
+        topic_data: TopicData,
+        tone: str,
+        temperature: float,
+        expertise_level: str,
+        start_time: float
+    ) -> Dict[str, Any]:
+        """
+        Turn generated bullets and narrative text into a narrative result.
+        
+        Args:
+            bullets: Bullet-point summary returned by the model
+            narrative: Narrative text returned by the model
+            prompt: Prompt the text was generated from
+            model: Model that generated the text
+            topic_data: Normalized topic data
+            tone: Narrative tone
+            temperature: Sampling temperature used
+            expertise_level: Target audience expertise level
+            start_time: Time the request started
+            
+        Returns:
+            Dictionary with the narrative and processing time
+        """
         # Enhance and format the narrative with expertise level
         enhanced_narrative = enhance_narrative(narrative, topic_data.topic, tone, temperature, expertise_level)
         
@@ -106,249 +967,145 @@ class NarrativeGenerator:
             bullets=formatted_bullets,
             narrative=enhanced_narrative,
             prompt=prompt,
-            model=result.get("model", ""),
+            model=model,
             expertise_level=expertise_level  # Store expertise level in the narrative model
         )
         
-        # Return the result
-        elapsed_time = time.time() - start_time
-        return {
-            "success": True,
-            "narrative": narrative_model.to_dict(),
-            "processing_time": format_time_elapsed(elapsed_time)
-        }
+        # Return the result
+        elapsed_time = time.time() - start_time
+        return {
+            "success": True,
+            "narrative": narrative_model.to_dict(),
+            "processing_time": format_time_elapsed(elapsed_time)
+        }
+    
+    def _build_prompt(
+        self,
+        topic_data: TopicData,
+        tone: str,
+        expertise_level: str = "intermediate",
+        formatted_topic: Optional[str] = None
+    ) -> str:
+        """
+        Build a prompt for the LLaMA model that includes context from all data sources.
+        Adjusts language complexity based on expertise level.
+        
+        The fixed guidelines and output instructions come first, then the topic's
+        context and last the request line, so requests with the same tone and
+        expertise level share a prompt prefix the LLM provider can cache, and
+        repeat requests for a topic also share its context.
+        
+        Args:
+            topic_data: Normalized topic data
+            tone: Narrative tone
+            expertise_level: Target audience expertise level (beginner, intermediate, advanced)
+            formatted_topic: Title-cased topic, if the caller already computed it
+            
+        Returns:
+            Formatted prompt string
+        """
+        return (
+            self._prompt_instructions(tone, expertise_level) + "\n"
+            + self._topic_section(topic_data, tone, expertise_level, formatted_topic)
+        )
+    
+    def _prompt_instructions(self, tone: str, expertise_level: str) -> str:
+        """
+        Build the fixed part of a narrative prompt: the tone and expertise
+        guidelines followed by the output format instructions.
+        
+        Args:
+            tone: Narrative tone
+            expertise_level: Target audience expertise level (beginner, intermediate, advanced)
+            
+        Returns:
+            Instruction text shared by all prompts with this tone and expertise level
+        """
+        # Tone and expertise guidelines; unknown tones get the informative guidelines
+        tone_key = tone.lower()
+        if tone_key not in ContentConfig.VALID_TONES:
+            tone_key = "informative"
+        guidelines = (
+            _INSTRUCTION_BLOCKS.get((tone_key, expertise_level))
+            or _instruction_block(tone_key, expertise_level)
+        )
+        
+        # Output format instructions with more guidance for engaging, user-friendly content
+        return guidelines + "\n" + _NARRATIVE_TASK_FOOTER
     
-    def _build_prompt(self, topic_data: TopicData, tone: str, expertise_level: str = "intermediate") -> str:
+    def _topic_section(
+        self,
+        topic_data: TopicData,
+        tone: str,
+        expertise_level: str,
+        formatted_topic: Optional[str] = None
+    ) -> str:
         """
-        Build a prompt for the LLaMA model that includes context from all data sources.
-        Adjusts language complexity based on expertise level.
+        Build the topic-specific part of a narrative prompt: the context gathered
+        from all data sources followed by the request line.
+        
+        The context is placed before the request line, so only the last line
+        differs between requests for the same topic data.
         
         Args:
             topic_data: Normalized topic data
             tone: Narrative tone
             expertise_level: Target audience expertise level (beginner, intermediate, advanced)
+            formatted_topic: Title-cased topic, if the caller already computed it
             
         Returns:
-            Formatted prompt string
+            Topic context and request text
         """
-        parts = []
-        
         # Format topic with proper title case
-        formatted_topic = format_title(topic_data.topic)
+        if formatted_topic is None:
+            formatted_topic = format_title(topic_data.topic)
         
         # Instructions with tone, expertise level, and formatted topic
-        parts.append(f"Write a {tone} narrative about '{formatted_topic}' for a {expertise_level}-level audience.")
-        
-        # Common instructions for all narratives with expertise level considerations
-        parts.append("IMPORTANT GUIDELINES FOR ALL NARRATIVES:")
+        return (
+            self._topic_context(topic_data, formatted_topic)
+            + f"\n\nWrite a {tone} narrative about '{formatted_topic}' for a {expertise_level}-level audience, "
+            "using the context above."
+        )
+    
+    def _topic_context(self, topic_data: TopicData, formatted_topic: str) -> str:
+        """
+        Build the context block for a topic from all data sources.
         
-        # Expertise level specific instructions
-        if expertise_level == "beginner":
-            parts.append("BEGINNER LEVEL AUDIENCE GUIDELINES:")
-            parts.append("- Use extremely simple, everyday language that young students can understand")
-            parts.append("- Avoid technical jargon completely, or explain it immediately in very basic terms")
-            parts.append("- Use short, simple sentences and short paragraphs")
-            parts.append("- Include many concrete examples to illustrate abstract concepts")
-            parts.append("- Focus on basic fundamental concepts only")
-            parts.append("- Define all terms, even relatively common ones")
-            parts.append("- Write at approximately a 5th-6th grade reading level")
-            parts.append("- Use simple analogies to familiar everyday experiences")
-        elif expertise_level == "intermediate":
-            parts.append("INTERMEDIATE LEVEL AUDIENCE GUIDELINES:")
-            parts.append("- Use clear language accessible to high school or undergraduate students")
-            parts.append("- Explain necessary technical terms when first used")
-            parts.append("- Balance depth with accessibility")
-            parts.append("- Include some nuance and context, but maintain clarity")
-            parts.append("- Write at approximately a high school reading level")
-            parts.append("- Use moderately complex examples and applications")
-        elif expertise_level == "advanced":
-            parts.append("ADVANCED LEVEL AUDIENCE GUIDELINES:")
-            parts.append("- Use precise, field-appropriate language for an educated audience")
-            parts.append("- Technical terms can be used without extensive explanation")
-            parts.append("- Include depth, nuance and complexity where appropriate")
-            parts.append("- Discuss advanced concepts and their implications")
-            parts.append("- Write at a college or professional reading level")
-            parts.append("- Include sophisticated examples and applications")
-            parts.append("- Still avoid unnecessarily obscure vocabulary or jargon")
-        
-        # General instructions for all levels
-        parts.append("- Structure content with a clear introduction, main points, and conclusion")
-        parts.append("- Explain ideas as if talking to someone at the appropriate level of familiarity with the topic")
-        
-        # Add tone-specific instructions with much more detail
-        if tone.lower() == 'dramatic':
-            parts.append("DRAMATIC TONE SPECIFIC GUIDELINES:")
-            parts.append("- Create a narrative arc with rising tension and emotional resonance")
-            parts.append("- Use vivid descriptive language to create scenes readers can visualize")
-            parts.append("- Include emotional stakes and human elements that create connection")
-            parts.append("- Structure content like a story with a beginning, middle, and climactic end")
-            parts.append("- Use powerful, evocative words that create strong imagery and feelings")
-            if expertise_level == "beginner":
-                parts.append("- Keep dramatic language extremely simple and accessible while still being emotionally impactful")
-            elif expertise_level == "intermediate":
-                parts.append("- Balance dramatic elements with moderately sophisticated language and concepts")
-            else:
-                parts.append("- Create literary-quality dramatic narrative with sophisticated language and complex emotional themes")
-        
-        elif tone.lower() == 'poetic':
-            parts.append("POETIC TONE SPECIFIC GUIDELINES:")
-            parts.append("- Write in a genuine poetic style with rhythm, imagery, and metaphor")
-            parts.append("- Use beautiful, lyrical language that focuses on sensory details")
-            parts.append("- Include metaphors and similes that illuminate the topic in unexpected ways")
-            parts.append("- Create a flow of ideas that follows poetic rather than purely logical structure")
-            parts.append("- Incorporate literary techniques like alliteration, assonance, and consonance")
-            parts.append("- Use line breaks and stanza-like paragraph structures for rhythmic effect")
-            
-            if expertise_level == "beginner":
-                parts.append("- Create simple but beautiful poems with clear imagery children can understand")
-                parts.append("- Use rhyming patterns and familiar metaphors to maintain engagement")
-                parts.append("- Keep vocabulary simple while still being lyrical and beautiful")
-            elif expertise_level == "intermediate":
-                parts.append("- Create moderately complex poetry with accessible but rich imagery")
-                parts.append("- Balance poetic expression with clarity of educational content")
-                parts.append("- Use a mix of free verse and structured elements that engage young adults")
-            else:
-                parts.append("- Create sophisticated poetry that could appear in literary publications")
-                parts.append("- Use complex poetic devices, extended metaphors, and rich symbolism")
-                parts.append("- Incorporate poetic techniques from various traditions as appropriate")
-        
-        elif tone.lower() == 'humorous':
-            parts.append("HUMOROUS TONE SPECIFIC GUIDELINES:")
-            parts.append("- Make the content genuinely funny and entertaining while still being informative")
-            parts.append("- Include clever jokes, wordplay, and humorous observations throughout")
-            parts.append("- Reference recognizable current cultural trends and topics for relatable humor")
-            parts.append("- Use comedic devices like exaggeration, ironic contrasts, and surprising comparisons")
-            parts.append("- Include funny analogies that help explain complex concepts in an entertaining way")
-            parts.append("- Maintain a light, conversational tone that feels like witty banter")
-            parts.append("- Incorporate funny hypothetical scenarios to illustrate points")
-            parts.append("- Make references to current events, popular culture, or universal experiences that most people would find relatable")
-            
-            if expertise_level == "beginner":
-                parts.append("- Use simple, playful humor with puns and silly examples kids would enjoy")
-                parts.append("- Include funny imagery that helps visualize concepts (like talking animals or familiar characters)")
-                parts.append("- Use humor appropriate for younger audiences while avoiding purely adult references")
-            elif expertise_level == "intermediate":
-                parts.append("- Create moderately sophisticated humor with some cleverer wordplay and references")
-                parts.append("- Balance humor with clear educational content that teens and young adults would appreciate")
-                parts.append("- Include light satire and gentle parody to illuminate the topic")
-            else:
-                parts.append("- Use sophisticated wit, satire, and clever references for an educated audience")
-                parts.append("- Create multi-layered humor that works on different levels of understanding")
-                parts.append("- Include subtle jokes and references that reward the knowledgeable reader")
-        
-        elif tone.lower() == 'technical':
-            parts.append("TECHNICAL TONE SPECIFIC GUIDELINES:")
-            parts.append("- Use precise, accurate terminology and clear explanations of processes")
-            parts.append("- Structure content in a logical progression that builds on previous concepts")
-            parts.append("- Include specific details, measurable quantities, and technical specifications")
-            parts.append("- Maintain objectivity and precision in descriptions and explanations")
-            parts.append("- Use industry-standard formatting for technical concepts")
-            
-            if expertise_level == "beginner":
-                parts.append("- Use technical structure but explain every term in extremely simple language")
-                parts.append("- Include 'in other words' explanations after any necessary technical terms")
-                parts.append("- Use simple diagrams and step-by-step explanations as if teaching a technical concept for the first time")
-            elif expertise_level == "intermediate":
-                parts.append("- Balance technical accuracy with accessibility for someone learning the field")
-                parts.append("- Include brief definitions or context for moderately advanced terms")
-                parts.append("- Use examples that connect technical concepts to practical applications")
-            else:
-                parts.append("- Use field-appropriate technical language assuming domain knowledge")
-                parts.append("- Include advanced technical details, specifications, and sophisticated analysis")
-                parts.append("- Reference related technical concepts and their interactions in the field")
-        
-        elif tone.lower() == 'simple':
-            parts.append("SIMPLE TONE SPECIFIC GUIDELINES:")
-            parts.append("- Use extremely clear, straightforward language with minimal complexity")
-            parts.append("- Focus on core ideas without unnecessary details or tangents")
-            parts.append("- Use short sentences and paragraphs with one main idea per paragraph")
-            parts.append("- Explain concepts as if speaking to someone completely unfamiliar with the topic")
-            parts.append("- Use concrete examples from everyday life to illustrate abstract ideas")
-            
-            if expertise_level == "beginner":
-                parts.append("- Write as if explaining to very young students with no background knowledge")
-                parts.append("- Use extremely basic vocabulary and sentence structure")
-                parts.append("- Include fun, simple examples that children would understand and enjoy")
-            elif expertise_level == "intermediate":
-                parts.append("- Write clearly for a general audience with basic education but no specialized knowledge")
-                parts.append("- Use approachable language while covering moderately complex ideas")
-                parts.append("- Include relatable examples that teenagers and young adults would connect with")
-            else:
-                parts.append("- Explain sophisticated concepts in plain language without oversimplifying")
-                parts.append("- Maintain depth of insight while using accessible explanations")
-                parts.append("- Use the principle of 'explain like I'm five' but for complex topics")
-        
-        else:  # informative (default)
-            parts.append("INFORMATIVE TONE SPECIFIC GUIDELINES:")
-            parts.append("- Present balanced, objective information with well-structured arguments")
-            parts.append("- Include key facts, statistics, and evidence to support main points")
-            parts.append("- Organize content with clear sections covering different aspects of the topic")
-            parts.append("- Maintain a neutral, educational tone that prioritizes accuracy")
-            parts.append("- Include historical context and current understanding of the topic")
-            
-            if expertise_level == "beginner":
-                parts.append("- Present information at an elementary school level with simple explanations")
-                parts.append("- Include basic facts with extremely clear cause-and-effect relationships")
-                parts.append("- Focus only on the most fundamental aspects of the topic")
-            elif expertise_level == "intermediate":
-                parts.append("- Present information at a high school level with some nuance and context")
-                parts.append("- Balance breadth and depth appropriate for someone with general education")
-                parts.append("- Include some analysis beyond just facts while maintaining clarity")
-            else:
-                parts.append("- Present information at a college level with substantial depth and analysis")
-                parts.append("- Include nuanced perspectives, scholarly context, and sophisticated analysis")
-                parts.append("- Cover specialized aspects of the topic that would interest a knowledgeable audience")
-        
-        # Add instructions for creating bullet points
-        parts.append("\nCREATE A STRUCTURED NARRATIVE FOLLOWING THESE STEPS:")
-        parts.append("1. Start with 3-5 bullet points that highlight the key aspects of the topic")
-        parts.append("2. Follow with several paragraphs of narrative text that elaborate on these points")
-        parts.append("3. Ensure the content is appropriate for the specified expertise level and tone")
-        parts.append("4. Make the content engaging, accurate, and tailored to the unique requirements of the chosen tone")
-        
-        parts.append("Use the following context:")
+        Args:
+            topic_data: Normalized topic data
+            formatted_topic: Title-cased topic
+            
+        Returns:
+            Context text from all data sources
+        """
+        wikipedia = topic_data.wikipedia
+        dbpedia = topic_data.dbpedia
+        parts = [f"\nCONTEXT ABOUT '{formatted_topic}':"]
         
         # Wikipedia content
-        if topic_data.wikipedia.summary:
-            parts.append("\nWIKIPEDIA SUMMARY:")
-            parts.append(textwrap.fill(topic_data.wikipedia.summary, width=80))
-            if topic_data.wikipedia.url:
-                parts.append(f"URL: {topic_data.wikipedia.url}")
+        if wikipedia.summary:
+            parts.append(
+                f"\nWIKIPEDIA SUMMARY:\n{wikipedia.summary}\nURL: {wikipedia.url}" if wikipedia.url
+                else f"\nWIKIPEDIA SUMMARY:\n{wikipedia.summary}"
+            )
         
         # DBpedia content
-        if topic_data.dbpedia.abstract:
-            parts.append("\nDBPEDIA ABSTRACT:")
-            parts.append(textwrap.fill(topic_data.dbpedia.abstract, width=80))
+        if dbpedia.abstract:
+            parts.append(f"\nDBPEDIA ABSTRACT:\n{dbpedia.abstract}")
         
-        if topic_data.dbpedia.categories:
-            parts.append("\nDBPEDIA CATEGORIES: " + ", ".join(topic_data.dbpedia.categories[:10]))
+        if dbpedia.categories:
+            parts.append("\nDBPEDIA CATEGORIES: " + ", ".join(dbpedia.categories[:10]))
         
-        # News headlines
+        # News headlines, with descriptions for the top 3 articles
         if topic_data.news:
-            parts.append("\nRECENT NEWS HEADLINES:")
-            for i, article in enumerate(topic_data.news[:5], 1):
-                if article.title:
-                    parts.append(f"{i}. {article.title}")
-                if article.description and i <= 3:  # Include descriptions for top 3 articles
-                    parts.append(f"   {truncate_text(article.description, 100)}")
-        
-        # Output format instructions with more guidance for engaging, user-friendly content
-        parts.append(
-            "\nYOUR TASK:\n"
-            "1. A concise bullet-point summary (3–5 points) using simple words that anyone could understand.\n"
-            "2. A detailed narrative in 2–4 paragraphs that is accessible to all readers regardless of education level.\n"
-            "3. Ensure all vocabulary is at approximately 5th-grade reading level."
-        )
-        
-        # Add additional instructions for compelling yet simple narrative
-        parts.append(
-            "Make the narrative both compelling and easy to understand by:\n"
-            "- Starting with a simple, clear introduction of what the topic is\n"
-            "- Using concrete examples and comparisons to everyday things\n"
-            "- Explaining one idea at a time in a logical order\n"
-            "- Avoiding complicated sentences with multiple clauses\n"
-            "- Concluding with a straightforward summary of why this matters to everyday people"
-        )
+            parts.append("\nRECENT NEWS HEADLINES:" + "".join(
+                line
+                for i, article in enumerate(topic_data.news[:5], 1)
+                for line in (
+                    f"\n{i}. {article.title}" if article.title else "",
+                    f"\n   {truncate_text(article.description, 100)}" if article.description and i <= 3 else ""
+                )
+            ))
         
         return "\n".join(parts)
     
@@ -418,6 +1175,14 @@ class NarrativeGenerator:
         # Log the temperature being used
         logger.info(f"Generating creative story for '{formatted_topic}' with temperature={temperature}")
         
+        # Only low-temperature stories are deterministic enough to reuse
+        cache_key = None
+        if CacheConfig.ENABLE_CACHE and temperature < _CACHE_MAX_TEMPERATURE:
+            cache_key = _response_cache_key("story", prompt, max_tokens, temperature)
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return dict(copy.deepcopy(cached), processing_time=format_time_elapsed(time.time() - start_time), cache_hit=True)
+        
         # Call the LLaMA API
         result = groq_client.generate_text(
             prompt=prompt,
@@ -434,7 +1199,7 @@ class NarrativeGenerator:
             }
         
         elapsed_time = time.time() - start_time
-        return {
+        response = {
             "success": True,
             "story": result.get("text", ""),
             "style": style,
@@ -442,6 +1207,9 @@ class NarrativeGenerator:
             "model": result.get("model", ""),
             "processing_time": format_time_elapsed(elapsed_time)
         }
+        if cache_key is not None:
+            _response_cache.set(cache_key, copy.deepcopy(response))
+        return response
     
     def analyze_sentiment(self, topic_data: TopicData) -> Dict[str, Any]:
         """
@@ -469,9 +1237,7 @@ class NarrativeGenerator:
         
         # Add news headlines
         if topic_data.news:
-            prompt += "NEWS HEADLINES:\n"
-            for article in topic_data.news[:5]:
-                prompt += f"- {article.title}\n"
+            prompt += "NEWS HEADLINES:\n" + "".join(f"- {article.title}\n" for article in topic_data.news[:5])
         
         # Add Wikipedia context if available
         if topic_data.wikipedia.summary:
@@ -481,6 +1247,13 @@ class NarrativeGenerator:
         prompt += "\nBased on this information, analyze the overall sentiment around this topic. " \
                  "Is it mostly positive, negative, or neutral? Provide a brief explanation and key points."
         
+        # Sentiment output is low-temperature and classifier-like, so it is always reusable
+        cache_key = _response_cache_key("sentiment", prompt)
+        if CacheConfig.ENABLE_CACHE:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return dict(copy.deepcopy(cached), cache_hit=True)
+        
         # Get structured output
         result = groq_client.parse_structured_output(prompt, output_format)
         
@@ -490,10 +1263,87 @@ class NarrativeGenerator:
                 "error": result.get("error", "Unknown error analyzing sentiment")
             }
         
-        return {
+        response = {
             "success": True,
             "sentiment_analysis": result.get("data", {})
         }
+        if CacheConfig.ENABLE_CACHE:
+            _response_cache.set(cache_key, copy.deepcopy(response))
+        return response
+
+    async def agenerate_narrative(self, topic_data: TopicData, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Async variant of generate_narrative.
+        
+        The Groq client is blocking, so the call runs on a worker thread.
+        
+        Args:
+            topic_data: Normalized topic data from various sources
+            **kwargs: Keyword arguments for generate_narrative
+            
+        Returns:
+            Dictionary with generated narrative and metadata
+        """
+        return await asyncio.to_thread(self.generate_narrative, topic_data, **kwargs)
+    
+    async def aanalyze_sentiment(self, topic_data: TopicData) -> Dict[str, Any]:
+        """
+        Async variant of analyze_sentiment.
+        
+        The Groq client is blocking, so the call runs on a worker thread.
+        
+        Args:
+            topic_data: Normalized topic data
+            
+        Returns:
+            Dictionary with sentiment analysis
+        """
+        return await asyncio.to_thread(self.analyze_sentiment, topic_data)
+    
+    def generate_narrative_and_sentiment(
+        self,
+        topic_data: TopicData,
+        **kwargs: Any
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Generate a narrative and analyze sentiment for a topic concurrently.
+        
+        Args:
+            topic_data: Normalized topic data from various sources
+            **kwargs: Keyword arguments for generate_narrative
+            
+        Returns:
+            Tuple of (narrative result, sentiment result)
+        """
+        return asyncio.run(self.agenerate_narrative_and_sentiment(topic_data, **kwargs))
+    
+    async def agenerate_narrative_and_sentiment(
+        self,
+        topic_data: TopicData,
+        **kwargs: Any
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Async variant of generate_narrative_and_sentiment.
+        
+        The two Groq calls are independent, so the total latency is that of the
+        slower one.
+        
+        Args:
+            topic_data: Normalized topic data from various sources
+            **kwargs: Keyword arguments for generate_narrative
+            
+        Returns:
+            Tuple of (narrative result, sentiment result)
+        """
+        # generate_narrative corrects the topic in place; do it up front so the
+        # sentiment prompt sees the same topic
+        topic_data.topic = correct_spelling(topic_data.topic)
+        
+        narrative_result, sentiment_result = await asyncio.gather(
+            self.agenerate_narrative(topic_data, **kwargs),
+            self.aanalyze_sentiment(topic_data)
+        )
+        return narrative_result, sentiment_result
 
     def generate_conversation_response(
         self,
@@ -525,45 +1375,21 @@ class NarrativeGenerator:
             temperature = ContentConfig.CONVERSATION_TEMPERATURE
             
         # Ensure temperature is within valid range
-        temperature = max(0.1, min(1.0, temperature))
+        temperature = clamp_temperature(temperature)
         
         # Validate tone
         if tone not in ContentConfig.VALID_TONES:
             tone = ContentConfig.DEFAULT_TONE
         
         try:
-            # Format the conversation history for the LLM prompt
-            formatted_history = ""
-            if conversation_history:
-                for msg in conversation_history[-5:]:  # Limit to last 5 messages
-                    role = msg.get('role', 'user')
-                    content = msg.get('content', '')
-                    if role == 'user':
-                        formatted_history += f"User: {content}\n"
-                    elif role == 'ai':
-                        formatted_history += f"Assistant: {content}\n"
-                    elif role == 'system':
-                        formatted_history += f"# {content}\n"
+            # Quote recent messages up to the token budget and summarize the rest
+            history_summary, recent_history = self._trim_history(
+                self._dedup_history(conversation_history or [])
+            )
+            formatted_history = _format_history(recent_history)
             
             # Prepare context information
-            context_text = ""
-            if topic_data:
-                # Add Wikipedia summary if available
-                if hasattr(topic_data, 'wikipedia') and topic_data.wikipedia.summary:
-                    context_text += f"Wikipedia: {topic_data.wikipedia.summary}\n\n"
-                
-                # Add DBpedia data if available
-                if hasattr(topic_data, 'dbpedia') and topic_data.dbpedia.abstract:
-                    context_text += f"DBpedia: {topic_data.dbpedia.abstract}\n\n"
-                
-                # Add relevant news headlines if available
-                if hasattr(topic_data, 'news') and topic_data.news:
-                    news_items = []
-                    for article in topic_data.news[:3]:
-                        if article.title:
-                            news_items.append(f"- {article.title}")
-                    if news_items:
-                        context_text += "Recent news headlines:\n" + "\n".join(news_items) + "\n\n"
+            context_text = self._build_conversation_context(topic_data)
             
             # Craft the prompt for the LLM
             prompt = self._create_conversation_prompt(
@@ -571,7 +1397,8 @@ class NarrativeGenerator:
                 question=question,
                 conversation_history=formatted_history,
                 context_text=context_text,
-                tone=tone
+                tone=tone,
+                conversation_summary=history_summary
             )
             
             # Select the LLM to use
@@ -630,6 +1457,154 @@ class NarrativeGenerator:
                 "error": f"Failed to generate conversation response: {str(e)}"
             }
 
+    def _dedup_history(self, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Drop history messages that repeat an earlier message from the same speaker.
+        
+        Repeats are found by normalized text, and also by embedding similarity
+        when HISTORY_DEDUP_MODEL is configured and sentence-transformers is installed.
+        
+        Args:
+            history: Conversation messages, oldest first
+            
+        Returns:
+            Messages without repeats, oldest first
+        """
+        seen = set()
+        unique = []
+        for msg in history:
+            key = _message_key(msg)
+            if key not in seen:
+                seen.add(key)
+                unique.append(msg)
+        
+        embedder = self._get_embedder()
+        if embedder is None or len(unique) < 2:
+            return unique
+        
+        try:
+            embeddings = self._embed([msg.get('content', '') for msg in unique], embedder)
+        except Exception as e:
+            logger.warning(f"Could not embed conversation history: {e}")
+            return unique
+        
+        kept = []
+        for i, msg in enumerate(unique):
+            role = msg.get('role', 'user')
+            if all(
+                unique[j].get('role', 'user') != role
+                or float(embeddings[i] @ embeddings[j]) < _HISTORY_DUPLICATE_SIMILARITY
+                for j in kept
+            ):
+                kept.append(i)
+        return [unique[i] for i in kept]
+    
+    def _get_embedder(self):
+        """
+        Get the sentence embedder for history dedup, loading it on first use.
+        
+        sentence-transformers (and torch) are only imported once a model is configured.
+        
+        Returns:
+            SentenceTransformer instance, or None if not configured or unavailable
+        """
+        if not ContentConfig.HISTORY_DEDUP_MODEL:
+            return None
+        with self._embedder_lock:
+            if self._embedder is None and not self._embedder_failed:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    self._embedder = SentenceTransformer(ContentConfig.HISTORY_DEDUP_MODEL)
+                except Exception as e:
+                    logger.warning(f"Could not load history dedup model {ContentConfig.HISTORY_DEDUP_MODEL}: {e}")
+                    self._embedder_failed = True
+            return self._embedder
+    
+    def _embed(self, texts: List[str], embedder) -> List[Any]:
+        """
+        Embed texts as unit vectors, reusing cached embeddings.
+        
+        Args:
+            texts: Texts to embed
+            embedder: SentenceTransformer instance
+            
+        Returns:
+            One normalized embedding per text
+        """
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        embeddings = [_embedding_cache.get(key) for key in keys]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if missing:
+            encoded = embedder.encode([texts[i] for i in missing], normalize_embeddings=True)
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+                _embedding_cache.set(keys[i], embedding)
+        return embeddings
+    
+    def _trim_history(
+        self,
+        history: List[Dict[str, str]],
+        budget: int = None
+    ) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Split conversation history into a summary of older messages and the
+        most recent messages that fit in the token budget.
+        
+        The newest message is always kept, even if it alone exceeds the budget.
+        
+        Args:
+            history: Conversation messages, oldest first
+            budget: Approximate token budget for the recent messages
+                (defaults to ContentConfig.CONVERSATION_HISTORY_TOKEN_BUDGET)
+            
+        Returns:
+            Tuple of (summary of the older messages or "", recent messages oldest first)
+        """
+        budget = budget or ContentConfig.CONVERSATION_HISTORY_TOKEN_BUDGET
+        
+        used = 0
+        start = len(history)
+        while start > 0:
+            used += _estimate_tokens(history[start - 1].get('content', ''))
+            if used > budget and start < len(history):
+                break
+            start -= 1
+        
+        older, recent = history[:start], history[start:]
+        return (self._summarize_history(older) if older else ""), recent
+    
+    def _summarize_history(self, messages: List[Dict[str, str]]) -> str:
+        """
+        Summarize older conversation messages in a few sentences.
+        
+        Args:
+            messages: Conversation messages, oldest first
+            
+        Returns:
+            Summary text, or "" if the summary could not be generated
+        """
+        prompt = "Summarize this conversation in 3 sentences:\n" + _format_history(messages)
+        
+        cache_key = _response_cache_key("history_summary", prompt)
+        if CacheConfig.ENABLE_CACHE:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        result = groq_client.generate_text(
+            prompt=prompt,
+            max_tokens=_HISTORY_SUMMARY_MAX_TOKENS,
+            temperature=0.2
+        )
+        if not result.get("success", False):
+            logger.warning(f"Could not summarize conversation history: {result.get('error')}")
+            return ""
+        
+        summary = result.get("text", "").strip()
+        if CacheConfig.ENABLE_CACHE:
+            _response_cache.set(cache_key, summary)
+        return summary
+
     def _get_llm_client(self):
         """
         Get the LLM client for conversation.
@@ -646,129 +1621,136 @@ class NarrativeGenerator:
         question: str,
         conversation_history: str,
         context_text: str,
-        tone: str
+        tone: str,
+        conversation_summary: str = ""
     ) -> str:
         """
         Create a prompt for the conversation response.
         
+        The prompt is ordered from most to least shared (fixed instructions, tone,
+        topic context, history, question) so the LLM provider can reuse the cached
+        prefix across requests. The summary of older messages only changes when
+        messages fall out of the recent window.
+        
         Args:
             topic: The main topic
             question: User's question
-            conversation_history: Formatted conversation history
+            conversation_history: Formatted recent conversation history
             context_text: Background information about the topic
             tone: Desired response tone
+            conversation_summary: Summary of messages older than the recent history
             
         Returns:
             Formatted prompt string
         """
-        # Base system instruction
-        system_instruction = f"""You are CONTRA AI, a friendly and helpful assistant specializing in educational content about "{topic}".
+        full_prompt = self._conversation_prompt_prefix(topic, context_text, tone) + "\n\n"
         
-Your goal is to provide accurate, helpful responses that ANYONE can easily understand, regardless of their education level.
-
+        if conversation_summary:
+            full_prompt += "Conversation so far (summary):\n" + conversation_summary + "\n\n"
+        
+        # Add the conversation history and current question
+        if conversation_history:
+            full_prompt += "Previous conversation:\n" + conversation_history + "\n\n"
+        
+        full_prompt += f"User's new question: {question}\n\nYour response (use simple language a 10-11 year old would understand):"
+        
+        return full_prompt
+    
+    def _conversation_prompt_prefix(self, topic: str, context_text: str, tone: str) -> str:
+        """
+        Build the part of the conversation prompt shared by every question about a topic.
+        
+        Args:
+            topic: The main topic
+            context_text: Background information about the topic
+            tone: Desired response tone
+            
+        Returns:
+            Prompt prefix string
+        """
+        tone_instruction = _CONVERSATION_TONE_INSTRUCTIONS.get(
+            tone, _CONVERSATION_TONE_INSTRUCTIONS["informative"]
+        )
+        return (
+            _CONVERSATION_INSTRUCTIONS
+            + f"\nTONE: {tone.capitalize()}\n"
+            + tone_instruction
+            + f"""
 TOPIC: {topic}
 
-TONE: {tone.capitalize()}
-
-LANGUAGE REQUIREMENTS:
-1. Use simple, everyday words instead of complex vocabulary
-2. Use short sentences and paragraphs
-3. Explain all technical terms or jargon in plain language
-4. Use examples from daily life to illustrate complex concepts
-5. Keep your explanations straightforward and direct
-6. Aim for a 5th-grade reading level (10-11 year old child)
-7. Use active voice rather than passive voice
-8. Break down complex ideas into simpler parts
-"""
-
-        # Add tone-specific instructions
-        if tone == "dramatic":
-            system_instruction += """
-For dramatic tone:
-- Use simple words to create emotional impact
-- Tell a story with everyday language
-- Focus on relatable human elements
-- Keep dramatic moments easy to understand
-- Use clear cause and effect relationships
-"""
-        elif tone == "poetic":
-            system_instruction += """
-For poetic tone:
-- Use simple but beautiful words
-- Use imagery based on everyday experiences
-- Create rhythm with short phrases
-- Use familiar metaphors everyone would understand
-- Express complex feelings with simple language
-"""
-        elif tone == "humorous":
-            system_instruction += """
-For humorous tone:
-- Use simple jokes and humor
-- Make comparisons to everyday situations
-- Keep humor friendly and easy to understand
-- Avoid complex wordplay or references
-- Use light, conversational language
-"""
-        elif tone == "technical":
-            system_instruction += """
-For technical tone:
-- Explain technical concepts using everyday language
-- Define all specialized terms immediately
-- Use simple step-by-step explanations
-- Compare technical concepts to familiar objects or situations
-- Avoid unnecessary jargon completely
-"""
-        elif tone == "simple":
-            system_instruction += """
-For simple tone:
-- Use the simplest words possible
-- Keep sentences very short and direct
-- Focus only on the most important information
-- Repeat key points using different simple words
-- Use very concrete examples
-"""
-        else:  # informative (default)
-            system_instruction += """
-For informative tone:
-- Present facts using common, everyday language
-- Explain complex ideas with simple cause and effect
-- Use real-life examples that anyone would understand
-- Break information into small, digestible chunks
-- Connect new information to things people already know
-"""
-
-        # Add contextual knowledge instructions
-        system_instruction += f"""
 BACKGROUND CONTEXT:
 {context_text}
 
-IMPORTANT GUIDELINES:
-1. Stay on topic about "{topic}"
-2. Admit when you don't know something
-3. When citing facts, add a REFERENCES section with simple explanations of sources
-4. Keep responses brief (2-3 paragraphs) and easy to read
-5. Match your writing style to the {tone} tone while keeping language simple
-6. Use everyday examples to make your points clear
-
-READABILITY CHECKS:
-- Would a 10-11 year old child understand your response?
-- Have you avoided all specialized terminology?
-- Are your sentences short and direct?
-- Have you used concrete examples from everyday life?
-- Have you removed unnecessary words and phrases?
-
 You're chatting with a user who wants to learn more about {topic} in a way that's easy to understand.
 """
-
-        # Add the conversation history and current question
-        full_prompt = system_instruction + "\n\n"
+        )
+    
+    def _build_conversation_context(self, topic_data: Optional[TopicData]) -> str:
+        """
+        Build the background context block for conversation prompts.
         
-        if conversation_history:
-            full_prompt += "Previous conversation:\n" + conversation_history + "\n\n"
+        Args:
+            topic_data: Optional topic data for additional context
+            
+        Returns:
+            Context text (empty when no topic data is available)
+        """
+        context_text = ""
+        if topic_data:
+            # Add Wikipedia summary if available
+            if hasattr(topic_data, 'wikipedia') and topic_data.wikipedia.summary:
+                context_text += f"Wikipedia: {topic_data.wikipedia.summary}\n\n"
+            
+            # Add DBpedia data if available
+            if hasattr(topic_data, 'dbpedia') and topic_data.dbpedia.abstract:
+                context_text += f"DBpedia: {topic_data.dbpedia.abstract}\n\n"
+            
+            # Add relevant news headlines if available
+            if hasattr(topic_data, 'news') and topic_data.news:
+                news_items = []
+                for article in topic_data.news[:3]:
+                    if article.title:
+                        news_items.append(f"- {article.title}")
+                if news_items:
+                    context_text += "Recent news headlines:\n" + "\n".join(news_items) + "\n\n"
+        return context_text
+    
+    def warm_conversation_prefix(
+        self,
+        topic: str,
+        topic_data: Optional[TopicData] = None,
+        tone: str = "informative"
+    ) -> bool:
+        """
+        Send a 1-token request with the conversation prompt prefix to prime the provider's prompt cache.
         
-        full_prompt += f"User's new question: {question}\n\nYour response (use simple language a 10-11 year old would understand):"
+        Each (topic, tone) pair is only warmed once while it stays in the recent set.
         
-        return full_prompt
+        Args:
+            topic: The main topic
+            topic_data: Optional topic data for additional context
+            tone: Tone that conversation responses will use
+            
+        Returns:
+            True if a warm-up request was sent
+        """
+        if tone not in ContentConfig.VALID_TONES:
+            tone = ContentConfig.DEFAULT_TONE
+        
+        key = hashlib.blake2b(f"{topic}|{tone}".encode('utf-8'), digest_size=16).digest()
+        with self._warmed_lock:
+            if key in self._warmed_prefixes:
+                self._warmed_prefixes.move_to_end(key)
+                return False
+            self._warmed_prefixes[key] = None
+            if len(self._warmed_prefixes) > _MAX_WARMED_PREFIXES:
+                self._warmed_prefixes.popitem(last=False)
+        
+        prefix = self._conversation_prompt_prefix(topic, self._build_conversation_context(topic_data), tone)
+        result = self._get_llm_client().generate_text(prompt=prefix, max_tokens=1, temperature=0.1)
+        if not result.get("success", False):
+            logger.warning(f"Conversation prefix warm-up failed for '{topic}': {result.get('error')}")
+        return True
 
 
 # Create a singleton instance
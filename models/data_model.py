@@ -4,13 +4,13 @@ Uses dataclasses for typed, structured data representation.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import json
 from datetime import datetime
 
 from utils.helpers import iso_now, create_wikipedia_url
 
-@dataclass
+@dataclass(slots=True)
 class WikipediaData:
     """Wikipedia data model."""
     summary: str
@@ -26,7 +26,7 @@ class WikipediaData:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DBpediaData:
     """DBpedia data model."""
     abstract: Optional[str] = None
@@ -44,7 +44,11 @@ class DBpediaData:
         )
 
 
-@dataclass
+# Shared placeholder for topics without DBpedia data
+EMPTY_DBPEDIA = DBpediaData()
+
+
+@dataclass(slots=True)
 class NewsArticle:
     """News article model."""
     title: str
@@ -55,8 +59,11 @@ class NewsArticle:
     source: str = "gnews"
     
     @classmethod
-    def from_raw(cls, article: Dict[str, Any]) -> 'NewsArticle':
-        """Create from raw news article data."""
+    def from_raw(cls, article: Any) -> Optional['NewsArticle']:
+        """Create from raw news article data, or return None if it is not an article dict."""
+        if not article or not isinstance(article, dict):
+            return None
+        
         publisher = article.get("publisher", "")
         if isinstance(publisher, dict):
             publisher = publisher.get("name", "")
@@ -65,12 +72,16 @@ class NewsArticle:
             title=article.get("title", ""),
             url=article.get("url", ""),
             publisher=publisher,
-            published_at=article.get("published_date") or article.get("publishedAt") or "",
+            published_at=article.get("published_at") or article.get("published_date") or article.get("publishedAt") or "",
             description=article.get("description", "")
         )
 
 
-@dataclass
+# Shared empty news list for topics without articles
+EMPTY_NEWS: Tuple[NewsArticle, ...] = ()
+
+
+@dataclass(slots=True)
 class TopicData:
     """Combined topic data model."""
     topic: str
@@ -113,7 +124,7 @@ class TopicData:
         return json.dumps(self.to_dict(), indent=2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Narrative:
     """Narrative model."""
     bullets: str
@@ -135,7 +146,7 @@ class Narrative:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Image:
     """Image model."""
     file_path: str
@@ -163,7 +174,7 @@ class Image:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Visualization:
     """Visualization model."""
     timeline: Optional[Dict[str, Any]] = None
@@ -179,7 +190,7 @@ class Visualization:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Complete generation result."""
     topic: str
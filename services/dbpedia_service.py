@@ -4,21 +4,31 @@ DBpedia service for accessing structured knowledge via SPARQL queries.
 
 import logging
 from typing import Dict, List, Any, Optional
-from SPARQLWrapper import SPARQLWrapper, JSON, SPARQLExceptions
+from SPARQLWrapper import SPARQLExceptions
 
-from utils.cache import disk_cache
+from config import APIConfig
+from utils.cache import disk_cache, is_available_result
 from utils.helpers import clean_text
+from utils.http_session import HTTP_ERRORS, create_http2_client, create_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# SPARQL endpoint status codes mapped to the exceptions SPARQLWrapper raises for them
+_SPARQL_HTTP_ERRORS = {
+    400: SPARQLExceptions.QueryBadFormed,
+    401: SPARQLExceptions.Unauthorized,
+    404: SPARQLExceptions.EndPointNotFound,
+    500: SPARQLExceptions.EndPointInternalError,
+}
+
 class DBpediaService:
     """
     Service for accessing DBpedia knowledge via SPARQL queries.
     DBpedia (https://wiki.dbpedia.org/) provides structured data extracted from Wikipedia.
     """
     
-    def __init__(self, endpoint: str = "http://dbpedia.org/sparql"):
+    def __init__(self, endpoint: str = "https://dbpedia.org/sparql"):
         """
         Initialize the DBpedia service.
         
@@ -26,12 +36,46 @@ class DBpediaService:
             endpoint: SPARQL endpoint URL
         """
         self.endpoint = endpoint
-        self.sparql = SPARQLWrapper(endpoint)
-        self.sparql.setReturnFormat(JSON)
-        # Add timeout to prevent hanging on slow connections
-        self.sparql.setTimeout(10)  # 10 seconds timeout
+        # Add (connect, read) timeouts to prevent hanging on slow connections
+        self.timeout = (APIConfig.SOURCE_CONNECT_TIMEOUT, APIConfig.SOURCE_READ_TIMEOUT)
+        # Keep-alive session so consecutive queries reuse the endpoint connection
+        self._session = create_session(pool_connections=10, pool_maxsize=20)
+        headers = {
+            "Accept": "application/sparql-results+json",
+            "User-Agent": "CONTRA-Backend/1.0 (contact@example.com)"
+        }
+        self._session.headers.update(headers)
+        # HTTP/2 client multiplexing concurrent queries, used when available
+        self._http2 = create_http2_client(self.timeout, headers=headers)
     
-    @disk_cache(subdir='dbpedia')
+    def close(self) -> None:
+        """Close the HTTP connections held by the service."""
+        if self._http2 is not None:
+            self._http2.close()
+        self._session.close()
+    
+    def _query(self, query: str) -> Dict[str, Any]:
+        """
+        Run a SPARQL SELECT query against the endpoint.
+        
+        Args:
+            query: SPARQL query string
+            
+        Returns:
+            Parsed SPARQL JSON results
+        """
+        params = {"query": query, "format": "json"}
+        if self._http2 is not None:
+            response = self._http2.get(self.endpoint, params=params)
+        else:
+            response = self._session.get(self.endpoint, params=params, timeout=self.timeout)
+        error_class = _SPARQL_HTTP_ERRORS.get(response.status_code)
+        if error_class is not None:
+            raise error_class(response.content)
+        response.raise_for_status()
+        return response.json()
+    
+    @disk_cache(subdir='dbpedia', should_cache=is_available_result)
     def get_data(self, topic: str) -> Dict[str, Any]:
         """
         Query DBpedia for structured data about a topic.
@@ -65,7 +109,8 @@ class DBpediaService:
             return {
                 "success": False,
                 "error": f"DBpedia service is experiencing issues.",
-                "details": str(e)
+                "details": str(e),
+                "unavailable": True
             }
         except SPARQLExceptions.QueryBadFormed as e:
             logger.error(f"DBpedia query syntax error: {str(e)}")
@@ -79,7 +124,8 @@ class DBpediaService:
             return {
                 "success": False,
                 "error": f"DBpedia service is currently unavailable.",
-                "details": str(e)
+                "details": str(e),
+                "unavailable": True
             }
         except SPARQLExceptions.Unauthorized as e:
             logger.error(f"DBpedia unauthorized: {str(e)}")
@@ -93,7 +139,8 @@ class DBpediaService:
             return {
                 "success": False,
                 "error": f"DBpedia query failed.",
-                "details": str(e)
+                "details": str(e),
+                "unavailable": True
             }
     
     def _find_resource_uri(self, topic: str) -> Optional[str]:
@@ -118,9 +165,8 @@ class DBpediaService:
         """
         
         # Try exact match first
-        self.sparql.setQuery(query)
         try:
-            results = self.sparql.query().convert()
+            results = self._query(query)
             bindings = results.get("results", {}).get("bindings", [])
             
             if bindings:
@@ -136,13 +182,15 @@ class DBpediaService:
             }} LIMIT 5
             """
             
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
+            results = self._query(query)
             bindings = results.get("results", {}).get("bindings", [])
             
             if bindings:
                 return bindings[0]['resource']['value']
                 
+        except (*HTTP_ERRORS, SPARQLExceptions.EndPointInternalError, SPARQLExceptions.EndPointNotFound):
+            # Let get_data report the endpoint as unavailable rather than the topic as missing
+            raise
         except Exception as e:
             logger.error(f"Error finding DBpedia resource: {str(e)}")
         
@@ -188,8 +236,7 @@ class DBpediaService:
         }}
         """
         
-        self.sparql.setQuery(query)
-        results = self.sparql.query().convert()
+        results = self._query(query)
         bindings = results.get("results", {}).get("bindings", [])
         
         if not bindings:
@@ -250,8 +297,7 @@ class DBpediaService:
         """
         
         try:
-            self.sparql.setQuery(query)
-            results = self.sparql.query().convert()
+            results = self._query(query)
             bindings = results.get("results", {}).get("bindings", [])
             
             entities = []
@@ -6,7 +6,7 @@ import os
 import logging
 import requests
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 try:
     from config import APIConfig
@@ -25,6 +25,12 @@ except ImportError:
             return func
         return decorator
 
+try:
+    from utils.http_session import http_session
+except ImportError:
+    # Fall back to unpooled module-level requests calls
+    http_session = requests
+
 try:
     from utils.helpers import format_time_elapsed
 except ImportError:
@@ -113,7 +119,7 @@ class GroqClient:
             payload["stop"] = stop
         
         try:
-            response = requests.post(
+            response = http_session.post(
                 self.api_url,
                 headers=headers,
                 json=payload,
@@ -160,6 +166,83 @@ class GroqClient:
                 "text": ""
             }
     
+    def generate_text_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        top_p: float = 0.9,
+        stop: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Generate text using the Groq LLaMA API, yielding tokens as they arrive.
+        
+        Streamed responses are not cached.
+        
+        Args:
+            prompt: The text prompt to generate from
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature (0.0-1.0, higher = more creative)
+            top_p: Nucleus sampling parameter (0.0-1.0)
+            stop: Optional list of strings that stop generation when encountered
+            
+        Yields:
+            Generated text fragments, in order
+            
+        Raises:
+            requests.exceptions.RequestException: If the request fails
+            ValueError: If no API key is configured
+        """
+        logger.info(f"Streaming text with Groq LLaMA (model={self.model})")
+        
+        if not self.api_key:
+            raise ValueError("No Groq API key provided.")
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        payload = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": "You are a helpful, accurate, and creative assistant."},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p,
+            "stream": True
+        }
+        
+        if stop:
+            payload["stop"] = stop
+        
+        with http_session.post(
+            self.api_url,
+            headers=headers,
+            json=payload,
+            timeout=60,  # 60-second timeout between bytes
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            # Server-sent events are always UTF-8, but requests assumes ISO-8859-1
+            # for text/* responses without a charset
+            response.encoding = "utf-8"
+            
+            # Server-sent events: one "data: {json}" line per chunk, ending with "data: [DONE]"
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+                choices = json.loads(data).get("choices") or []
+                if choices:
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+    
     def parse_structured_output(self, prompt: str, output_format: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate structured output by instructing the model to output in a specific format.
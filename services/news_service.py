@@ -10,8 +10,8 @@ import time
 import random
 from datetime import datetime, timedelta
 
-from config import ContentConfig
-from utils.cache import disk_cache
+from config import CacheConfig, ContentConfig
+from utils.cache import disk_cache, is_available_result
 from utils.helpers import iso_now
 
 # Configure logging
@@ -35,7 +35,7 @@ class NewsService:
         # Set default period to last 7 days
         self.gnews.period = '7d'
     
-    @disk_cache(subdir='news')
+    @disk_cache(subdir='news', should_cache=is_available_result, timeout=CacheConfig.NEWS_CACHE_TTL)
     def get_news(self, topic: str, max_results: int = None) -> Dict[str, Any]:
         """
         Retrieve news articles related to a topic.
@@ -76,7 +76,9 @@ class NewsService:
             
         except Exception as e:
             logger.error(f"News API error: {str(e)}")
-            return self._get_dummy_articles(topic)
+            result = self._get_dummy_articles(topic)
+            result["unavailable"] = True
+            return result
     
     def _get_dummy_articles(self, topic: str) -> Dict[str, Any]:
         """
@@ -156,7 +158,7 @@ class NewsService:
         
         return processed
     
-    @disk_cache(subdir='news')
+    @disk_cache(subdir='news', timeout=CacheConfig.NEWS_CACHE_TTL)
     def search_by_dates(self, topic: str, start_date: str = None, end_date: str = None) -> List[Dict[str, Any]]:
         """
         Search for news within a specific date range.
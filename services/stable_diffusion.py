@@ -12,17 +12,37 @@ import io
 import textwrap
 import shutil
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from config import APIConfig, IMAGE_CACHE_DIR
 from utils.cache import disk_cache
-from utils.helpers import sanitize_filename, iso_now
+from utils.helpers import sanitize_filename, iso_now, topic_file_prefix
+from utils.http_session import http_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Artistic styles offered for image generation
+_STYLES: Tuple[Dict[str, str], ...] = (
+    {"name": "photorealistic", "description": "Highly detailed, lifelike images"},
+    {"name": "oil painting", "description": "Rich, textured style reminiscent of traditional oil paintings"},
+    {"name": "watercolor", "description": "Soft, flowing style with transparent colors"},
+    {"name": "sketch", "description": "Black and white or colored sketch/drawing style"},
+    {"name": "digital art", "description": "Clean, polished digital illustration style"},
+    {"name": "comic book", "description": "Bold outlines and vibrant colors in comic style"},
+    {"name": "pop art", "description": "Bright colors, bold patterns, popular culture inspired"},
+    {"name": "impressionist", "description": "Emphasis on light, movement, and color over detail"},
+    {"name": "surrealist", "description": "Dreamlike, fantastical imagery with unexpected elements"},
+    {"name": "minimalist", "description": "Simple, clean style with limited elements"},
+    {"name": "anime", "description": "Japanese animation inspired style"},
+    {"name": "pixel art", "description": "Retro-style imagery composed of visible pixels"},
+    {"name": "3D render", "description": "Photorealistic 3D rendered scene with realistic lighting and textures"},
+    {"name": "cinematic", "description": "Movie-like composition with dramatic lighting and atmosphere"}
+)
+
+
 class StableDiffusionClient:
     """
     Client for Stability AI's API for Stable Diffusion 3.5.
@@ -193,22 +213,24 @@ class StableDiffusionClient:
         # Create a SHA-256 hash
         return hashlib.sha256(hashable.encode('utf-8')).hexdigest()
     
-    def _cache_path(self, prompt_hash: str, variant: int = 1) -> Path:
+    def _cache_path(self, prompt_hash: str, variant: int = 1, topic_id: Optional[str] = None) -> Path:
         """
         Compute file path for a given prompt hash and variant number.
         
         Args:
             prompt_hash: Hash of the prompt and parameters
             variant: Image variant number
+            topic_id: Identifier for the current topic, encoded as a filename prefix
             
         Returns:
             Path to the cached image file
         """
-        # Create the path using the hash and variant
-        cache_path = IMAGE_CACHE_DIR / f"{prompt_hash}_v{variant}.png"
+        # Create the path using the topic prefix, hash and variant
+        prefix = topic_file_prefix(topic_id) if topic_id else ""
+        cache_path = IMAGE_CACHE_DIR / f"{prefix}{prompt_hash}_v{variant}.png"
         
         # Log the cache path being generated
-        logger.info(f"Generated cache path: {cache_path}")
+        logger.debug(f"Generated cache path: {cache_path}")
         
         return cache_path
     
@@ -300,6 +322,9 @@ class StableDiffusionClient:
     ) -> List[Dict[str, Any]]:
         """
         Generate one or more image variants for the given prompt using Stability AI API.
+        Variants missing from the cache are requested together in a single API call.
+        If the call fails partway, variants already saved are kept and only the
+        rest fall back.
         
         Args:
             prompt: Text prompt for image generation
@@ -314,8 +339,6 @@ class StableDiffusionClient:
         Returns:
             List of dictionaries with image metadata
         """
-        results = []
-        
         # Check if API key is available and valid
         if not self.api_key or self.api_key.strip() == "" or len(self.api_key) < 10:
             logger.warning("No valid Stability AI API key provided. Using fallback image.")
@@ -376,19 +399,21 @@ class StableDiffusionClient:
         # Check for existing cached images
         has_any_cached = False
         for i in range(1, num_variants + 1):
-            cache_file = self._cache_path(prompt_hash, i)
+            cache_file = self._cache_path(prompt_hash, i, topic_id)
             if cache_file.exists():
                 has_any_cached = True
                 break
         
-        # Generate each variant
+        # Serve cached variants directly and collect the ones that still need generating
+        results_by_variant: Dict[int, Dict[str, Any]] = {}
+        pending_variants: List[int] = []
         for i in range(1, num_variants + 1):
-            cache_file = self._cache_path(prompt_hash, i)
+            cache_file = self._cache_path(prompt_hash, i, topic_id)
             
             # Check if cached version exists
             if cache_file.exists() and not overwrite_cache:
-                logger.info(f"Loading cached image for variant {i}")
-                results.append({
+                logger.debug(f"Loading cached image for variant {i}")
+                results_by_variant[i] = {
                     "success": True,
                     "file_path": str(cache_file),
                     "prompt": prompt,
@@ -399,69 +424,78 @@ class StableDiffusionClient:
                     "model_version": self.model_version,
                     "source": "cache",
                     "topic_id": topic_id  # Store topic ID in metadata
+                }
+            else:
+                pending_variants.append(i)
+        
+        if not pending_variants:
+            return [results_by_variant[i] for i in sorted(results_by_variant)]
+        
+        # Generate all missing variants in a single batched request
+        try:
+            logger.info(f"Generating {len(pending_variants)} image variant(s) with Stability AI for prompt: {prompt[:50]}...")
+            
+            # Setup headers for Stability API
+            headers = {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+            
+            # Create payload for the request
+            payload = {
+                "text_prompts": [
+                    {"text": prompt, "weight": 1.0}
+                ],
+                "height": height,
+                "width": width,
+                "samples": len(pending_variants),
+                "cfg_scale": 7.0,
+                "steps": 30
+            }
+            
+            # Add negative prompts if provided
+            if negative_prompt:
+                payload["text_prompts"].append({
+                    "text": negative_prompt,
+                    "weight": -1.0
                 })
-                continue
             
-            try:
-                logger.info(f"Generating image variant {i} with Stability AI for prompt: {prompt[:50]}...")
-                
-                # Setup headers for Stability API
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                    "Accept": "application/json"
-                }
-                
-                # Create payload for the request
-                payload = {
-                    "text_prompts": [
-                        {"text": prompt, "weight": 1.0}
-                    ],
-                    "height": height,
-                    "width": width,
-                    "samples": 1,
-                    "cfg_scale": 7.0,
-                    "steps": 30
-                }
-                
-                # Add negative prompts if provided
-                if negative_prompt:
-                    payload["text_prompts"].append({
-                        "text": negative_prompt,
-                        "weight": -1.0
-                    })
-                
-                # Add seed if provided
-                if seed is not None:
-                    payload["seed"] = seed
-                
-                # Make the API request
-                response = requests.post(
-                    self.api_url,
-                    headers=headers,
-                    json=payload,
-                    timeout=120  # 2 minute timeout
-                )
-                
-                # Check for API error
-                response.raise_for_status()
-                
-                # Parse the response
-                data = response.json()
-                
-                # Check if the response contains artifacts
-                if "artifacts" not in data or len(data["artifacts"]) == 0:
-                    error_msg = data.get("message", "Unknown error from Stability API")
-                    logger.error(f"Stability API error: {error_msg}")
-                    results.append({
+            # Add seed if provided
+            if seed is not None:
+                payload["seed"] = seed
+            
+            # Make the API request
+            response = http_session.post(
+                self.api_url,
+                headers=headers,
+                json=payload,
+                timeout=120  # 2 minute timeout
+            )
+            
+            # Check for API error
+            response.raise_for_status()
+            
+            # Parse the response
+            data = response.json()
+            artifacts = data.get("artifacts") or []
+            
+            # Check if the response contains artifacts
+            if not artifacts:
+                error_msg = data.get("message", "Unknown error from Stability API")
+                logger.error(f"Stability API error: {error_msg}")
+                for i in pending_variants:
+                    results_by_variant[i] = {
                         "success": False,
                         "error": f"Stability API error: {error_msg}",
                         "variant": i
-                    })
-                    continue
+                    }
+                return [results_by_variant[i] for i in sorted(results_by_variant)]
+            
+            for i, image_data in zip(pending_variants, artifacts):
+                cache_file = self._cache_path(prompt_hash, i, topic_id)
                 
                 # Get the generated image
-                image_data = data["artifacts"][0]
                 image_bytes = base64.b64decode(image_data["base64"])
                 
                 # Load image to validate and get dimensions
@@ -472,10 +506,10 @@ class StableDiffusionClient:
                 with open(cache_file, 'wb') as f:
                     f.write(image_bytes)
                 
-                logger.info(f"Saved image variant {i} to {cache_file}")
+                logger.debug(f"Saved image variant {i} to {cache_file}")
                 
                 # Add to results
-                results.append({
+                results_by_variant[i] = {
                     "success": True,
                     "file_path": str(cache_file),
                     "prompt": prompt,
@@ -487,7 +521,7 @@ class StableDiffusionClient:
                     "source": "api",
                     "topic_id": topic_id,  # Store topic ID in metadata
                     "url": f"/images/{cache_file.name}"  # Add direct URL to make it easier to access
-                })
+                }
                 
                 # Also save metadata to a separate JSON file for easier retrieval
                 try:
@@ -501,97 +535,85 @@ class StableDiffusionClient:
                             "model_version": self.model_version,
                             "topic_id": topic_id
                         }, f, indent=2)
-                    logger.info(f"Saved metadata to {metadata_file}")
+                    logger.debug(f"Saved metadata to {metadata_file}")
                 except Exception as e:
                     logger.error(f"Error saving metadata: {e}")
+            
+            # The API may return fewer samples than requested
+            for i in pending_variants[len(artifacts):]:
+                results_by_variant[i] = {
+                    "success": False,
+                    "error": "Stability API returned fewer images than requested",
+                    "variant": i
+                }
+            
+        except requests.exceptions.HTTPError as e:
+            # Variants saved before the failure keep their images
+            missing_variants = [i for i in pending_variants if i not in results_by_variant]
+            logger.error(f"Stability AI API HTTP error: {str(e)}")
+            
+            # Check for insufficient balance error (status code 429)
+            insufficient_balance = False
+            if hasattr(e, 'response') and e.response.status_code == 429:
+                try:
+                    error_data = e.response.json()
+                    insufficient_balance = error_data.get('name') == 'insufficient_balance'
+                except Exception:
+                    pass
+            
+            if insufficient_balance:
+                logger.warning("Insufficient balance in Stability AI account")
                 
-            except requests.exceptions.HTTPError as e:
-                logger.error(f"Stability AI API HTTP error: {str(e)}")
-                
-                # Check for insufficient balance error (status code 429)
-                if hasattr(e, 'response') and e.response.status_code == 429:
-                    try:
-                        error_data = e.response.json()
-                        if 'name' in error_data and error_data['name'] == 'insufficient_balance':
-                            logger.warning("Insufficient balance in Stability AI account")
-                            
-                            # Create a special fallback for insufficient balance
-                            results.append({
-                                "success": True,
-                                "file_path": "fallback.jpg",
-                                "url": "/images/fallback.jpg",
-                                "prompt": prompt,
-                                "error_details": "Insufficient balance in Stability AI account. Please add credits to generate images.",
-                                "width": width,
-                                "height": height,
-                                "timestamp": iso_now(),
-                                "model_version": "fallback",
-                                "source": "fallback_insufficient_balance",
-                                "topic_id": topic_id  # Store topic ID in metadata
-                            })
-                            continue
-                    except Exception:
-                        pass
-                
-                # If we have cached images, use as fallback
-                if has_any_cached:
-                    for alt_i in range(1, num_variants + 1):
-                        alt_cache = self._cache_path(prompt_hash, alt_i)
-                        if alt_cache.exists():
-                            logger.info(f"Using cached image variant {alt_i} as fallback")
-                            results.append({
-                                "success": True,
-                                "file_path": str(alt_cache),
-                                "prompt": prompt,
-                                "note": "Fallback from cache due to API error",
-                                "error_details": str(e),
-                                "source": "cache_fallback",
-                                "topic_id": topic_id  # Store topic ID in metadata
-                            })
-                            break
-                else:
-                    results.append({
-                        "success": False,
-                        "error": f"Stability AI API error: {str(e)}",
-                        "variant": i
-                    })
-                
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Stability AI API request error: {str(e)}")
-                
-                # If we have cached images, use as fallback
-                if has_any_cached:
-                    for alt_i in range(1, num_variants + 1):
-                        alt_cache = self._cache_path(prompt_hash, alt_i)
-                        if alt_cache.exists():
-                            logger.info(f"Using cached image variant {alt_i} as fallback")
-                            results.append({
-                                "success": True,
-                                "file_path": str(alt_cache),
-                                "prompt": prompt,
-                                "note": "Fallback from cache due to API error",
-                                "error_details": str(e),
-                                "source": "cache_fallback",
-                                "topic_id": topic_id  # Store topic ID in metadata
-                            })
-                            break
-                else:
-                    results.append({
+                # Create a special fallback for insufficient balance
+                for i in missing_variants:
+                    results_by_variant[i] = {
                         "success": True,
                         "file_path": "fallback.jpg",
                         "url": "/images/fallback.jpg",
                         "prompt": prompt,
-                        "error_details": str(e),
+                        "error_details": "Insufficient balance in Stability AI account. Please add credits to generate images.",
                         "width": width,
                         "height": height,
                         "timestamp": iso_now(),
                         "model_version": "fallback",
-                        "source": "fallback_request_error",
+                        "source": "fallback_insufficient_balance",
                         "topic_id": topic_id  # Store topic ID in metadata
-                    })
-            except Exception as e:
-                logger.error(f"Unexpected error during image generation: {str(e)}")
-                results.append({
+                    }
+            else:
+                # If we have cached images, use as fallback
+                cache_fallback = self._cache_fallback_result(prompt, prompt_hash, num_variants, e, topic_id) if has_any_cached else None
+                for i in missing_variants:
+                    results_by_variant[i] = dict(cache_fallback) if cache_fallback else {
+                        "success": False,
+                        "error": f"Stability AI API error: {str(e)}",
+                        "variant": i
+                    }
+            
+        except requests.exceptions.RequestException as e:
+            missing_variants = [i for i in pending_variants if i not in results_by_variant]
+            logger.error(f"Stability AI API request error: {str(e)}")
+            
+            # If we have cached images, use as fallback
+            cache_fallback = self._cache_fallback_result(prompt, prompt_hash, num_variants, e, topic_id) if has_any_cached else None
+            for i in missing_variants:
+                results_by_variant[i] = dict(cache_fallback) if cache_fallback else {
+                    "success": True,
+                    "file_path": "fallback.jpg",
+                    "url": "/images/fallback.jpg",
+                    "prompt": prompt,
+                    "error_details": str(e),
+                    "width": width,
+                    "height": height,
+                    "timestamp": iso_now(),
+                    "model_version": "fallback",
+                    "source": "fallback_request_error",
+                    "topic_id": topic_id  # Store topic ID in metadata
+                }
+        except Exception as e:
+            missing_variants = [i for i in pending_variants if i not in results_by_variant]
+            logger.error(f"Unexpected error during image generation: {str(e)}")
+            for i in missing_variants:
+                results_by_variant[i] = {
                     "success": True,
                     "file_path": "fallback.jpg",
                     "url": "/images/fallback.jpg",
@@ -603,33 +625,55 @@ class StableDiffusionClient:
                     "model_version": "fallback",
                     "source": "fallback_unexpected_error",
                     "topic_id": topic_id  # Store topic ID in metadata
-                })
+                }
         
-        return results
+        return [results_by_variant[i] for i in sorted(results_by_variant)]
     
-    def get_styles(self) -> List[Dict[str, str]]:
+    def _cache_fallback_result(
+        self,
+        prompt: str,
+        prompt_hash: str,
+        num_variants: int,
+        error: Exception,
+        topic_id: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a result pointing at the first cached variant, used when the API call fails.
+        
+        Args:
+            prompt: Text prompt for image generation
+            prompt_hash: Hash of the prompt and parameters
+            num_variants: Number of variants that may be cached
+            error: The API error that triggered the fallback
+            topic_id: Identifier for the current topic
+            
+        Returns:
+            Result dictionary, or None if no cached variant exists
+        """
+        for alt_i in range(1, num_variants + 1):
+            alt_cache = self._cache_path(prompt_hash, alt_i, topic_id)
+            if alt_cache.exists():
+                logger.info(f"Using cached image variant {alt_i} as fallback")
+                return {
+                    "success": True,
+                    "file_path": str(alt_cache),
+                    "prompt": prompt,
+                    "note": "Fallback from cache due to API error",
+                    "error_details": str(error),
+                    "source": "cache_fallback",
+                    "topic_id": topic_id  # Store topic ID in metadata
+                }
+        return None
+    
+    def get_styles(self) -> Tuple[Dict[str, str], ...]:
         """
         Get available artistic styles for image generation.
         
         Returns:
-            List of style dictionaries with name and description
+            Shared tuple of style dictionaries with name and description;
+            callers must not modify it
         """
-        return [
-            {"name": "photorealistic", "description": "Highly detailed, lifelike images"},
-            {"name": "oil painting", "description": "Rich, textured style reminiscent of traditional oil paintings"},
-            {"name": "watercolor", "description": "Soft, flowing style with transparent colors"},
-            {"name": "sketch", "description": "Black and white or colored sketch/drawing style"},
-            {"name": "digital art", "description": "Clean, polished digital illustration style"},
-            {"name": "comic book", "description": "Bold outlines and vibrant colors in comic style"},
-            {"name": "pop art", "description": "Bright colors, bold patterns, popular culture inspired"},
-            {"name": "impressionist", "description": "Emphasis on light, movement, and color over detail"},
-            {"name": "surrealist", "description": "Dreamlike, fantastical imagery with unexpected elements"},
-            {"name": "minimalist", "description": "Simple, clean style with limited elements"},
-            {"name": "anime", "description": "Japanese animation inspired style"},
-            {"name": "pixel art", "description": "Retro-style imagery composed of visible pixels"},
-            {"name": "3D render", "description": "Photorealistic 3D rendered scene with realistic lighting and textures"},
-            {"name": "cinematic", "description": "Movie-like composition with dramatic lighting and atmosphere"}
-        ]
+        return _STYLES
 
 
 # Create a singleton instance
@@ -3,17 +3,26 @@ Wikipedia API service for fetching article summaries.
 Uses wikipediaapi library for clean access to Wikipedia content.
 """
 
+import itertools
 import logging
 import wikipediaapi
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 
-from config import ContentConfig
-from utils.cache import disk_cache
+from config import APIConfig, ContentConfig
+from utils.cache import disk_cache, is_available_result
 from utils.helpers import truncate_text
+from utils.http_session import create_http2_client, create_session
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'CONTRA-Backend/1.0 (contact@example.com)'
+REQUEST_TIMEOUT = (APIConfig.SOURCE_CONNECT_TIMEOUT, APIConfig.SOURCE_READ_TIMEOUT)
+API_URL = 'https://en.wikipedia.org/w/api.php'
+
+# Number of page links sampled for related topics
+RELATED_LINKS_LIMIT = 10
+
 class WikipediaService:
     """
     Service for accessing Wikipedia content.
@@ -23,11 +32,38 @@ class WikipediaService:
     def __init__(self):
         """Initialize the Wikipedia service with a custom user agent."""
         self.wiki = wikipediaapi.Wikipedia(
-            user_agent='CONTRA-Backend/1.0 (contact@example.com)',
-            language='en'
+            user_agent=USER_AGENT,
+            language='en',
+            timeout=REQUEST_TIMEOUT
         )
+        # Session for direct MediaWiki API queries
+        self._session = create_session(pool_connections=4, pool_maxsize=20)
+        self._session.headers.update({'User-Agent': USER_AGENT})
+        # HTTP/2 client used instead of the session when available
+        self._http2 = create_http2_client(REQUEST_TIMEOUT, headers={'User-Agent': USER_AGENT})
     
-    @disk_cache(subdir='wikipedia')
+    def _get(self, url: str, params: Dict[str, Any]):
+        """
+        Send a GET request over HTTP/2 if available, else the pooled session.
+        
+        Args:
+            url: Request URL
+            params: Query parameters
+            
+        Returns:
+            Response object
+        """
+        if self._http2 is not None:
+            return self._http2.get(url, params=params)
+        return self._session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+    
+    def close(self) -> None:
+        """Close the HTTP connections held by the service."""
+        if self._http2 is not None:
+            self._http2.close()
+        self._session.close()
+    
+    @disk_cache(subdir='wikipedia', should_cache=is_available_result)
     def get_summary(self, topic: str) -> Dict[str, Any]:
         """
         Retrieve the summary of a Wikipedia page for the given topic.
@@ -115,6 +151,74 @@ class WikipediaService:
                 "fallback_summary": f"Information about {topic} is currently unavailable."
             }
     
+    @disk_cache(subdir='wikipedia', should_cache=is_available_result)
+    def get_summary_and_links(self, topic: str) -> Dict[str, Any]:
+        """
+        Retrieve a page's summary, categories and links with one MediaWiki API request.
+        
+        Pages that do not exist are looked up through get_summary, which also
+        tries similar titles.
+        
+        Args:
+            topic: Title or search term for the Wikipedia page
+            
+        Returns:
+            get_summary-style result with added "links" and "related_topics"
+        """
+        logger.info(f"Fetching Wikipedia summary and links for: {topic}")
+        
+        if not topic or len(topic.strip()) == 0:
+            return {
+                "success": False,
+                "error": "Empty search topic"
+            }
+        
+        try:
+            response = self._get(
+                API_URL,
+                params={
+                    "action": "query",
+                    "format": "json",
+                    "formatversion": 2,
+                    "titles": topic,
+                    "redirects": 1,
+                    "prop": "extracts|links|categories|info",
+                    "exintro": 1,
+                    "explaintext": 1,
+                    "pllimit": RELATED_LINKS_LIMIT,
+                    "cllimit": "max",
+                    "inprop": "url"
+                }
+            )
+            response.raise_for_status()
+            pages = response.json().get("query", {}).get("pages", [])
+        except Exception as e:
+            logger.error(f"Wikipedia API error: {str(e)}")
+            return {
+                "success": False,
+                "error": f"Wikipedia API error: {str(e)}",
+                "fallback_summary": f"Information about {topic} is currently unavailable.",
+                "unavailable": True
+            }
+        
+        page = pages[0] if pages else {}
+        if not page or page.get("missing") or page.get("invalid"):
+            return self.get_summary(topic)
+        
+        summary = page.get("extract") or f"Wikipedia page for '{topic}' exists but contains no summary."
+        categories = [cat["title"] for cat in page.get("categories", [])]
+        links = [link["title"] for link in page.get("links", [])]
+        
+        return {
+            "success": True,
+            "summary": truncate_text(summary, max_length=ContentConfig.WIKIPEDIA_SUMMARY_LENGTH),
+            "title": page.get("title", topic),
+            "url": page.get("fullurl", ""),
+            "categories": categories,
+            "links": links,
+            "related_topics": self._related_from(categories, links)
+        }
+    
     @disk_cache(subdir='wikipedia')
     def search(self, query: str, limit: int = 5) -> List[Dict[str, str]]:
         """
@@ -158,25 +262,38 @@ class WikipediaService:
         if not page.exists():
             return []
         
+        # Get a sample of links
+        links = list(page.links.keys())[:RELATED_LINKS_LIMIT]
+        
+        return self._related_from(page.categories.keys(), links)
+    
+    def _related_from(self, categories: Iterable[str], links: List[str]) -> List[str]:
+        """
+        Pick related topics from a page's categories and links.
+        
+        Args:
+            categories: Category titles, with or without the 'Category:' prefix
+            links: Sampled link titles
+            
+        Returns:
+            Up to 5 related topic strings
+        """
         # Extract category names (remove 'Category:' prefix)
         categories = [
             cat.split(':', 1)[1] if ':' in cat else cat 
-            for cat in page.categories.keys()
+            for cat in categories
         ]
         
-        # Get a sample of links
-        links = list(page.links.keys())[:10]
-        
-        # Combine unique results
-        related = list(set(categories + links))
+        # Combine unique results, keeping page order
+        related = dict.fromkeys(categories + links)
         
         # Filter out non-content categories
-        filtered = [
+        filtered = (
             rel for rel in related 
             if not any(x in rel.lower() for x in ['stub', 'wikify', 'articles', 'pages'])
-        ]
+        )
         
-        return filtered[:5]  # Return up to 5 related topics
+        return list(itertools.islice(filtered, 5))  # Return up to 5 related topics
 
     def _find_similar_pages(self, topic: str, limit: int = 3) -> List[str]:
         """
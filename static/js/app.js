@@ -437,7 +437,7 @@ async function setupGenerateForm() {
         const advancedOptions = document.getElementById('advanced-options');
         if (advancedOptions && !advancedOptions.classList.contains('hidden')) {
             // Use default values if parsing fails
-            const maxLength = parseInt(formData.get('max_length')) || 1024;
+            const maxLength = parseInt(formData.get('max_length')) || 600;
             const tempValue = parseFloat(formData.get('temperature')) || 0.7;
             
             payload.max_length = maxLength;
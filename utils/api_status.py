@@ -4,15 +4,22 @@ used in the CONTRA application.
 """
 
 import os
-import requests
 from typing import Dict, List, Any
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from config import APIConfig
+from config import APIConfig, CacheConfig
 from services.groq_client import GroqClient
+from utils.http_session import http_session
 
 logger = logging.getLogger(__name__)
 
+# Last probe result shared by /health, /api/status and the status page
+_status_cache: Dict[str, Any] = {"value": None, "expires": 0.0}
+_status_lock = threading.Lock()
+
 def check_groq_api() -> Dict[str, Any]:
     """Check if Groq API key is configured and working."""
     result = {
@@ -42,7 +49,7 @@ def check_groq_api() -> Dict[str, Any]:
             "max_tokens": 10
         }
         
-        response = requests.post(
+        response = http_session.post(
             "https://api.groq.com/openai/v1/chat/completions",
             headers=headers,
             json=payload,
@@ -86,7 +93,7 @@ def check_stable_diffusion() -> Dict[str, Any]:
         }
         
         # Test connection to API
-        response = requests.get(
+        response = http_session.get(
             api_url,
             headers=headers,
             timeout=10
@@ -142,13 +149,36 @@ def check_news_api() -> Dict[str, Any]:
     
     return result
 
-def get_all_api_statuses() -> Dict[str, Any]:
-    """Get the status of all external APIs."""
-    services = [
-        check_groq_api(),
-        check_stable_diffusion(),
-        check_news_api()
-    ]
+def get_all_api_statuses(force: bool = False) -> Dict[str, Any]:
+    """
+    Get the status of all external APIs.
+    
+    Results are reused for CacheConfig.API_STATUS_TTL seconds so frequent
+    health polling does not re-probe the APIs on every request.
+    
+    Args:
+        force: Probe the APIs even if a cached result is still fresh
+        
+    Returns:
+        Dictionary with overall status, per-service results and a summary
+    """
+    with _status_lock:
+        if not force and _status_cache["value"] is not None and time.monotonic() < _status_cache["expires"]:
+            return _status_cache["value"]
+        
+        statuses = _probe_all_api_statuses()
+        _status_cache["value"] = statuses
+        _status_cache["expires"] = time.monotonic() + CacheConfig.API_STATUS_TTL
+        return statuses
+
+
+def _probe_all_api_statuses() -> Dict[str, Any]:
+    """Probe all external APIs and summarize their status."""
+    checks = [check_groq_api, check_stable_diffusion, check_news_api]
+    
+    # Probe the APIs concurrently so the total wait is the slowest check, not the sum
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        services = list(executor.map(lambda check: check(), checks))
     
     # Count services by status
     status_counts = {"ok": 0, "error": 0, "missing": 0, "unknown": 0}
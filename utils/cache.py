@@ -9,8 +9,9 @@ import pickle
 import hashlib
 import functools
 import time
+import threading
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, TypeVar, cast, Union
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast, Union
 from collections import OrderedDict
 import logging
 
@@ -42,6 +43,7 @@ class LRUCache:
         self.maxsize = maxsize
         self.timeout = timeout
         self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._lock = threading.RLock()
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -53,18 +55,19 @@ class LRUCache:
         Returns:
             The cached value or None if key not found or expired
         """
-        if key not in self._cache:
-            return None
-        
-        # Check if item has expired
-        item = self._cache[key]
-        if self.timeout is not None and time.time() - item['timestamp'] > self.timeout:
-            del self._cache[key]
-            return None
-        
-        # Move to end (most recently used)
-        self._cache.move_to_end(key)
-        return item['value']
+        with self._lock:
+            if key not in self._cache:
+                return None
+            
+            # Check if item has expired
+            item = self._cache[key]
+            if self.timeout is not None and time.time() - item['timestamp'] > self.timeout:
+                del self._cache[key]
+                return None
+            
+            # Move to end (most recently used)
+            self._cache.move_to_end(key)
+            return item['value']
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -74,23 +77,25 @@ class LRUCache:
             key: The cache key
             value: The value to cache
         """
-        # If key exists, update and move to end
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        
-        # Add new item
-        self._cache[key] = {
-            'value': value,
-            'timestamp': time.time()
-        }
-        
-        # Enforce size limit (remove oldest item)
-        if len(self._cache) > self.maxsize:
-            self._cache.popitem(last=False)
+        with self._lock:
+            # If key exists, update and move to end
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            
+            # Add new item
+            self._cache[key] = {
+                'value': value,
+                'timestamp': time.time()
+            }
+            
+            # Enforce size limit (remove oldest item)
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
     
     def clear(self) -> None:
         """Clear all items from the cache."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
     
     def __len__(self) -> int:
         """Return the number of items in the cache."""
@@ -138,8 +143,8 @@ def _compute_hash(args: Any) -> str:
             args_dict = args
             args_str = json.dumps(args_dict, sort_keys=True, cls=CustomJSONEncoder)
             
-        # Compute SHA-256 hash
-        hash_obj = hashlib.sha256(args_str.encode('utf-8'))
+        # Compute a 128-bit BLAKE2b hash
+        hash_obj = hashlib.blake2b(args_str.encode('utf-8'), digest_size=16)
         return hash_obj.hexdigest()
     except Exception as e:
         logger.warning(f"Failed to compute hash for cache: {e}")
@@ -184,12 +189,48 @@ def memory_cache(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
-def disk_cache(subdir: Optional[str] = None) -> Callable[[Callable[..., T]], Callable[..., T]]:
+# Per-thread counts of disk cache replays and real calls, see disk_cache_counts()
+_disk_cache_stats = threading.local()
+
+
+def disk_cache_counts() -> Tuple[int, int]:
+    """
+    Count the disk-cached calls made so far on the current thread.
+    
+    Comparing counts before and after a call tells whether it was answered
+    entirely from the disk cache.
+    
+    Returns:
+        Tuple of (cache replays, calls that ran the wrapped function)
+    """
+    return getattr(_disk_cache_stats, 'hits', 0), getattr(_disk_cache_stats, 'misses', 0)
+
+
+def is_available_result(result: Any) -> bool:
+    """
+    Check that a service result is not an upstream-unavailable error.
+    
+    Args:
+        result: Service call result
+        
+    Returns:
+        False for dict results flagged "unavailable", True otherwise
+    """
+    return not (isinstance(result, dict) and result.get("unavailable"))
+
+
+def disk_cache(
+    subdir: Optional[str] = None,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+    timeout: Optional[int] = None
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator factory for persistent disk-based caching.
     
     Args:
         subdir: Optional subdirectory within the data cache directory
+        should_cache: Optional predicate; results it rejects are returned but not stored
+        timeout: Lifetime of cached results in seconds (defaults to CacheConfig.CACHE_TIMEOUT)
     
     Example:
         @disk_cache('wikipedia')
@@ -199,13 +240,14 @@ def disk_cache(subdir: Optional[str] = None) -> Callable[[Callable[..., T]], Cal
     cache_dir = DATA_CACHE_DIR
     if subdir:
         cache_dir = cache_dir / subdir
-        cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir.mkdir(parents=True, exist_ok=True)
     
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
             # Skip cache if disabled
             if not CacheConfig.ENABLE_CACHE:
+                _disk_cache_stats.misses = getattr(_disk_cache_stats, 'misses', 0) + 1
                 return func(*args, **kwargs)
             
             # Create cache key from function name and arguments
@@ -220,16 +262,22 @@ def disk_cache(subdir: Optional[str] = None) -> Callable[[Callable[..., T]], Cal
             # Check if cached file exists and is not expired
             if cache_file.exists():
                 cache_age = time.time() - cache_file.stat().st_mtime
-                if CacheConfig.CACHE_TIMEOUT is None or cache_age < CacheConfig.CACHE_TIMEOUT:
+                lifetime = CacheConfig.CACHE_TIMEOUT if timeout is None else timeout
+                if lifetime is None or cache_age < lifetime:
                     try:
                         with open(cache_file, 'rb') as f:
-                            return cast(T, pickle.load(f))
+                            result = pickle.load(f)
+                        _disk_cache_stats.hits = getattr(_disk_cache_stats, 'hits', 0) + 1
+                        return cast(T, result)
                     except (pickle.PickleError, EOFError):
                         # Ignore corrupted cache files
                         pass
             
             # Call function and cache result
+            _disk_cache_stats.misses = getattr(_disk_cache_stats, 'misses', 0) + 1
             result = func(*args, **kwargs)
+            if should_cache is not None and not should_cache(result):
+                return result
             
             try:
                 with open(cache_file, 'wb') as f:
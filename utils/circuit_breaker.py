@@ -0,0 +1,82 @@
+"""
+Circuit breaker for upstream data sources.
+
+After a run of consecutive failures the breaker opens and callers skip the
+upstream entirely until the reset timeout passes; a single trial call is then
+let through to decide whether to close the breaker again.
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe consecutive-failure circuit breaker.
+    """
+
+    def __init__(self, name: str, fail_max: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name used in log messages
+            fail_max: Consecutive failures that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial call
+        """
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half-open"."""
+        return self._state
+
+    def allow(self) -> bool:
+        """
+        Check whether a call to the upstream may be made.
+
+        Returns:
+            True if the call should proceed
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Let one trial call through
+                self._state = HALF_OPEN
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the breaker."""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the limit is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.fail_max:
+                if self._state != OPEN:
+                    logger.warning(
+                        f"Circuit for {self.name} opened after {self._failures} failures; "
+                        f"skipping it for {self.reset_timeout}s"
+                    )
+                self._state = OPEN
+                self._opened_at = time.monotonic()
@@ -3,7 +3,9 @@ Helper utility functions for the CONTRA application.
 """
 
 import datetime
+import functools
 import re
+import time
 import unicodedata
 import string
 from typing import Dict, Any, List, Optional, Union
@@ -16,7 +18,14 @@ def iso_now() -> str:
     Returns:
         ISO 8601 formatted timestamp string
     """
-    return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return _iso_from_epoch(int(time.time()))
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_from_epoch(seconds: int) -> str:
+    """Format a whole-second Unix timestamp as UTC ISO 8601; calls within the same second share one string."""
+    utc = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc)
+    return utc.replace(tzinfo=None).isoformat() + "Z"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -40,6 +49,23 @@ def sanitize_filename(filename: str) -> str:
     return sanitized.strip('. ')
 
 
+def topic_file_prefix(topic_id: str) -> str:
+    """
+    Return the filename prefix that tags generated images with their topic.
+    
+    Only the first two components of the topic ID are used, so IDs that differ
+    just in their timestamp suffix share a prefix
+    (e.g. 'topic_paris_1700000000' -> 'topic_paris__').
+    
+    Args:
+        topic_id: Topic identifier
+    
+    Returns:
+        Filename prefix ending in a double underscore
+    """
+    return '_'.join(topic_id.split('_', 2)[:2]) + '__'
+
+
 def clean_text(text: str) -> str:
     """
     Clean text by removing extra whitespace, normalizing Unicode, etc.
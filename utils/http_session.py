@@ -0,0 +1,91 @@
+"""
+Shared HTTP session for outbound API requests.
+
+A single pooled requests.Session is reused by the service clients so that
+connections (and their TLS handshakes) to Groq, Stability AI and other
+upstream APIs are kept alive across requests.
+
+When httpx is installed with HTTP/2 support, the knowledge-source services
+use an HTTP/2 client instead so concurrent queries to the same host are
+multiplexed over one connection.
+"""
+
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+    import h2  # noqa: F401 -- required by httpx for http2=True
+except ImportError:
+    httpx = None
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+
+def create_session(
+    pool_connections: int = POOL_CONNECTIONS,
+    pool_maxsize: int = POOL_MAXSIZE,
+    retries: int = 2,
+    backoff_factor: float = 0.1
+) -> requests.Session:
+    """
+    Create a requests session with a pooled, retrying HTTP adapter.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum number of connections kept per host
+        retries: Number of retries for connection errors and idempotent requests
+        backoff_factor: Backoff factor between retries
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=backoff_factor)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def create_http2_client(
+    timeout: Tuple[float, float],
+    headers: Optional[Dict[str, str]] = None,
+    max_keepalive_connections: int = 20
+) -> Optional["httpx.Client"]:
+    """
+    Create an HTTP/2 client, if httpx with HTTP/2 support is installed.
+
+    Args:
+        timeout: (connect, read) timeouts in seconds
+        headers: Default headers sent with every request
+        max_keepalive_connections: Maximum number of idle connections kept open
+
+    Returns:
+        Configured httpx.Client, or None if httpx[http2] is not available
+    """
+    if httpx is None:
+        return None
+    connect_timeout, read_timeout = timeout
+    return httpx.Client(
+        http2=True,
+        headers=headers,
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        limits=httpx.Limits(max_keepalive_connections=max_keepalive_connections),
+        follow_redirects=True
+    )
+
+
+# Transport errors raised by either kind of client
+HTTP_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+# Process-wide session shared by the service clients
+http_session = create_session()
@@ -0,0 +1,101 @@
+"""
+In-process latency metrics for upstream calls.
+
+Timings are kept per source and outcome as a bounded window of recent samples,
+so percentiles reflect current upstream behavior. When prometheus_client is
+installed the same observations are also exported as a histogram.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Tuple
+
+try:
+    from prometheus_client import Histogram
+except ImportError:
+    Histogram = None
+
+# Recent samples kept per (source, outcome) for percentile estimates
+WINDOW_SIZE = 512
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile of sorted samples.
+
+    Args:
+        samples: Non-empty, sorted samples
+        q: Percentile as a fraction between 0 and 1
+
+    Returns:
+        Sample at the requested percentile
+    """
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+
+class LatencyMetrics:
+    """
+    Thread-safe latency recorder labelled by source and outcome.
+    """
+
+    def __init__(self, name: str, description: str, window_size: int = WINDOW_SIZE):
+        """
+        Initialize the recorder.
+
+        Args:
+            name: Metric name, used for the Prometheus histogram
+            description: Metric description, used for the Prometheus histogram
+            window_size: Recent samples kept per (source, outcome)
+        """
+        self._window_size = window_size
+        self._samples: Dict[Tuple[str, str], Deque[float]] = {}
+        self._counts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._histogram = Histogram(name, description, ["source", "outcome"]) if Histogram is not None else None
+
+    def observe(self, source: str, outcome: str, seconds: float) -> None:
+        """
+        Record one call.
+
+        Args:
+            source: Upstream name
+            outcome: "success", "error" or "timeout"
+            seconds: Call duration in seconds
+        """
+        key = (source, outcome)
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self._window_size)
+            samples.append(seconds)
+            self._counts[key] = self._counts.get(key, 0) + 1
+        if self._histogram is not None:
+            self._histogram.labels(source=source, outcome=outcome).observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Summarize the recorded calls.
+
+        Returns:
+            {source: {outcome: {"count", "p50_ms", "p95_ms", "max_ms"}}}, with
+            percentiles over the recent sample window
+        """
+        with self._lock:
+            items = [(key, self._counts[key], sorted(samples)) for key, samples in self._samples.items()]
+
+        summary: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for (source, outcome), count, samples in items:
+            summary.setdefault(source, {})[outcome] = {
+                "count": count,
+                "p50_ms": round(_percentile(samples, 0.50) * 1000, 2),
+                "p95_ms": round(_percentile(samples, 0.95) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2)
+            }
+        return summary
+
+
+# Upstream fetch timings recorded by the data fetcher
+fetch_latency = LatencyMetrics("datafetch_seconds", "Upstream data source fetch duration in seconds")
+
+# Narrative generation timings by backend ("groq" or "local"), recorded by the narrative generator
+generation_latency = LatencyMetrics("narrative_generation_seconds", "Narrative generation duration in seconds")
@@ -4,8 +4,43 @@ Text formatting utilities for enhancing narrative presentation.
 
 import re
 import string
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 
+# Distinct topics remembered by the memoized title and spelling helpers
+_TOPIC_MEMO_SIZE = 10_000
+
+# Sentence and clause boundaries used to restructure paragraphs
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+_CLAUSE_SPLIT = re.compile(r'(?<=[,;:])\s+')
+_COMMA_SPLIT = re.compile(r'(?<=,)\s+')
+
+# Words emphasized in dramatic narratives
+_EMPHASIS_WORDS = ["critical", "dramatic", "revolutionary", "extraordinary", "profound", "devastating", "remarkable"]
+_EMPHASIS_PATTERNS = [(word, re.compile(r'(?i)\b' + re.escape(word) + r'\b')) for word in _EMPHASIS_WORDS]
+
+# Bullet and numbered list markers
+_BULLET_MARKER = re.compile(r'^\s*[•\*\-]\s+', re.MULTILINE)
+_NUMBER_MARKER = re.compile(r'^\s*(\d+)[\.\)]\s+', re.MULTILINE)
+
+# Spelling cleanup patterns
+_WHITESPACE_RUN = re.compile(r'\s+')
+_TRIPLED_LETTER = re.compile(r'([a-zA-Z])\1{2,}')
+
+
+def _compile_replacements(replacements: Dict[str, str]) -> List[Tuple[re.Pattern, str]]:
+    """
+    Compile a table of case-insensitive regex replacements once, at import time.
+    
+    Args:
+        replacements: Mapping of regex pattern to replacement text
+        
+    Returns:
+        List of (compiled pattern, replacement) pairs in table order
+    """
+    return [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in replacements.items()]
+
+@lru_cache(maxsize=_TOPIC_MEMO_SIZE)
 def format_title(text: str) -> str:
     """
     Format text in proper title case with smart capitalization rules.
@@ -126,22 +161,21 @@ def enhance_narrative(narrative: str, topic: str, tone: str, temperature: float
                     para += f" The impact of {capitalized_topic} continues to resonate today, changing how we understand our world."
             
             # Add dramatic emphasis to important phrases
-            emphasis_words = ["critical", "dramatic", "revolutionary", "extraordinary", "profound", "devastating", "remarkable"]
-            for word in emphasis_words:
+            for word, pattern in _EMPHASIS_PATTERNS:
                 if word in para.lower():
-                    para = re.sub(r'(?i)\b' + re.escape(word) + r'\b', f"*{word}*", para)
+                    para = pattern.sub(f"*{word}*", para)
         
         elif tone.lower() == 'poetic':
             # Transform into more poetic structure based on temperature
             if temperature > 0.8:
                 # High creativity - create a more lyrical structure
-                sentences = re.split(r'(?<=[.!?])\s+', para)
+                sentences = _SENTENCE_SPLIT.split(para)
                 
                 # Add line breaks for poetic rhythm
                 poetic_lines = []
                 for j, sentence in enumerate(sentences):
                     # Break longer sentences at commas and other natural pauses
-                    parts = re.split(r'(?<=[,;:])\s+', sentence)
+                    parts = _CLAUSE_SPLIT.split(sentence)
                     
                     # Add poetic line breaks
                     if len(parts) > 1:
@@ -163,7 +197,7 @@ def enhance_narrative(narrative: str, topic: str, tone: str, temperature: float
             
             elif temperature > 0.6:
                 # Moderate creativity - add some poetic elements
-                sentences = re.split(r'(?<=[.!?])\s+', para)
+                sentences = _SENTENCE_SPLIT.split(para)
                 
                 # Format with selective line breaks
                 formatted = []
@@ -244,13 +278,13 @@ def enhance_narrative(narrative: str, topic: str, tone: str, temperature: float
             # For simple tone, focus on clarity and directness
             # Break up long sentences
             if len(para) > 200:
-                sentences = re.split(r'(?<=[.!?])\s+', para)
+                sentences = _SENTENCE_SPLIT.split(para)
                 shorter_sentences = []
                 
                 for sentence in sentences:
                     if len(sentence) > 80:
                         # Try to split at commas
-                        parts = re.split(r'(?<=,)\s+', sentence)
+                        parts = _COMMA_SPLIT.split(sentence)
                         shorter_sentences.extend(parts)
                     else:
                         shorter_sentences.append(sentence)
@@ -285,6 +319,147 @@ def enhance_narrative(narrative: str, topic: str, tone: str, temperature: float
         # For other tones, use double line breaks
         return '\n\n'.join(enhanced_paragraphs)
 
+# Complex words and phrases and their simpler alternatives
+_SIMPLIFICATIONS = {
+    # Academic/complex terms
+    r'\butilize\b': 'use',
+    r'\bfacilitate\b': 'help',
+    r'\bameliorate\b': 'improve',
+    r'\bprocure\b': 'get',
+    r'\bpurchase\b': 'buy',
+    r'\bsubsequent\b': 'later',
+    r'\bprior\b': 'before',
+    r'\bcommence\b': 'begin',
+    r'\bterminate\b': 'end',
+    r'\bconclude\b': 'end',
+    r'\binitiate\b': 'start',
+    r'\bcontemplate\b': 'think about',
+    r'\bconceive\b': 'think of',
+    r'\bperceive\b': 'see',
+    r'\butilization\b': 'use',
+    r'\bimplementation\b': 'use',
+    r'\bmodification\b': 'change',
+    r'\bcognizant\b': 'aware',
+    r'\bexacerbate\b': 'worsen',
+    r'\balleviate\b': 'ease',
+    r'\bconsequently\b': 'so',
+    r'\bthus\b': 'so',
+    r'\bhence\b': 'so',
+    r'\bnevertheless\b': 'still',
+    r'\bnotwithstanding\b': 'still',
+    r'\bprocrastinate\b': 'delay',
+    r'\bexpedite\b': 'speed up',
+    r'\bsufficient\b': 'enough',
+    r'\badequate\b': 'enough',
+    r'\bsubstantial\b': 'large',
+    r'\bnumerous\b': 'many',
+    r'\bplethora\b': 'many',
+    r'\bmyriad\b': 'many',
+    r'\butilized\b': 'used',
+    r'\bfacilitated\b': 'helped',
+    r'\bimplemented\b': 'used',
+    # Phrasal simplifications
+    r'in order to': 'to',
+    r'due to the fact that': 'because',
+    r'with regard to': 'about',
+    r'for the purpose of': 'for',
+    r'in the event that': 'if',
+    r'at this point in time': 'now',
+    r'in spite of the fact that': 'although',
+    r'in the vicinity of': 'near',
+    r'it is often the case that': 'often',
+    r'a significant number of': 'many',
+    r'the vast majority of': 'most',
+    r'on the grounds that': 'because',
+    r'in view of the fact that': 'because',
+}
+
+# Additional simplifications for beginners
+_HIGH_SIMPLIFICATIONS = {
+    r'\bobserve\b': 'see',
+    r'\bpursue\b': 'follow',
+    r'\bdevelop\b': 'grow',
+    r'\bconstruct\b': 'build',
+    r'\bmodify\b': 'change',
+    r'\binitial\b': 'first',
+    r'\bconcurrent\b': 'happening at the same time',
+    r'\bcoordinate\b': 'organize',
+    r'\bdelineate\b': 'describe',
+    r'\bdetermine\b': 'decide',
+    r'\bdisplay\b': 'show',
+    r'\bpresent\b': 'show',
+    r'\bdocument\b': 'record',
+    r'\bexecute\b': 'do',
+    r'\belaborate\b': 'explain more',
+    r'\benhance\b': 'improve',
+    r'\bevaluate\b': 'check',
+    r'\bidentify\b': 'find',
+    r'\billustrate\b': 'show',
+    r'\binclude\b': 'have',
+    r'\bmaintain\b': 'keep',
+    r'\bprovide\b': 'give',
+    r'\brequire\b': 'need',
+    r'\bselect\b': 'choose',
+    r'\btransform\b': 'change',
+    r'\btransmit\b': 'send',
+    r'\butilize\b': 'use',
+    r'\bvariable\b': 'changing',
+    r'\bsignificant\b': 'important',
+    r'\bprimary\b': 'main',
+    r'\bsecondary\b': 'less important',
+    r'\bcorrelation\b': 'connection',
+    r'\bcomplex\b': 'complicated',
+    r'\bsimplify\b': 'make easier',
+    r'\binteractive\b': 'works both ways',
+    r'\bintegrate\b': 'combine',
+    r'\boptimize\b': 'make better',
+    r'\bgenerate\b': 'create',
+    r'\bpopulate\b': 'fill',
+    r'\bcalculate\b': 'figure out',
+    r'\bperform\b': 'do',
+    r'\bexamine\b': 'look at',
+    r'\banalyze\b': 'study',
+    r'\bdemonstrate\b': 'show',
+    r'\bpreference\b': 'choice',
+    r'\bmechanism\b': 'method',
+    r'\binformation\b': 'details',
+    r'\butilization\b': 'use',
+    # More phrase substitutions
+    r'as a consequence of': 'because of',
+    r'for the most part': 'mostly',
+    r'in the absence of': 'without',
+    r'in conjunction with': 'with',
+    r'take into consideration': 'consider',
+    r'as a means of': 'to',
+    r'in accordance with': 'following',
+    r'within the realm of possibility': 'possible',
+    r'on a regular basis': 'regularly',
+    r'in a timely manner': 'quickly',
+    r'in close proximity to': 'near',
+}
+
+# Only the most complex terms, for advanced readers
+_LOW_SIMPLIFICATIONS = {
+    r'\bameliorate\b': 'improve',
+    r'\bnotwithstanding\b': 'still',
+    r'\bexacerbate\b': 'worsen',
+    r'\balleviate\b': 'ease',
+    r'\bplethora\b': 'many',
+    r'\bmyriad\b': 'many',
+    # Only replace the most complex phrases
+    r'due to the fact that': 'because',
+    r'in spite of the fact that': 'although',
+    r'for the purpose of': 'for',
+    r'at this point in time': 'now',
+}
+
+# Compiled replacements for each simplification level
+_SIMPLIFICATION_PATTERNS = {
+    "high": _compile_replacements({**_SIMPLIFICATIONS, **_HIGH_SIMPLIFICATIONS}),
+    "medium": _compile_replacements(_SIMPLIFICATIONS),
+    "low": _compile_replacements(_LOW_SIMPLIFICATIONS),
+}
+
 def simplify_vocabulary(text: str, simplification_level: str = "medium") -> str:
     """
     Replace complex words with simpler alternatives to improve readability.
@@ -296,161 +471,116 @@ def simplify_vocabulary(text: str, simplification_level: str = "medium") -> str:
     Returns:
         Text with simplified vocabulary
     """
-    # Dictionary of complex words and their simpler alternatives
-    simplifications = {
-        # Academic/complex terms
-        r'\butilize\b': 'use',
-        r'\bfacilitate\b': 'help',
-        r'\bameliorate\b': 'improve',
-        r'\bprocure\b': 'get',
-        r'\bpurchase\b': 'buy',
-        r'\bsubsequent\b': 'later',
-        r'\bprior\b': 'before',
-        r'\bcommence\b': 'begin',
-        r'\bterminate\b': 'end',
-        r'\bconclude\b': 'end',
-        r'\binitiate\b': 'start',
-        r'\bcontemplate\b': 'think about',
-        r'\bconceive\b': 'think of',
-        r'\bperceive\b': 'see',
-        r'\butilization\b': 'use',
-        r'\bimplementation\b': 'use',
-        r'\bmodification\b': 'change',
-        r'\bcognizant\b': 'aware',
-        r'\bexacerbate\b': 'worsen',
-        r'\balleviate\b': 'ease',
-        r'\bconsequently\b': 'so',
-        r'\bthus\b': 'so',
-        r'\bhence\b': 'so',
-        r'\bnevertheless\b': 'still',
-        r'\bnotwithstanding\b': 'still',
-        r'\bprocrastinate\b': 'delay',
-        r'\bexpedite\b': 'speed up',
-        r'\bsufficient\b': 'enough',
-        r'\badequate\b': 'enough',
-        r'\bsubstantial\b': 'large',
-        r'\bnumerous\b': 'many',
-        r'\bplethora\b': 'many',
-        r'\bmyriad\b': 'many',
-        r'\butilized\b': 'used',
-        r'\bfacilitated\b': 'helped',
-        r'\bimplemented\b': 'used',
-        # Phrasal simplifications
-        r'in order to': 'to',
-        r'due to the fact that': 'because',
-        r'with regard to': 'about',
-        r'for the purpose of': 'for',
-        r'in the event that': 'if',
-        r'at this point in time': 'now',
-        r'in spite of the fact that': 'although',
-        r'in the vicinity of': 'near',
-        r'it is often the case that': 'often',
-        r'a significant number of': 'many',
-        r'the vast majority of': 'most',
-        r'on the grounds that': 'because',
-        r'in view of the fact that': 'because',
-    }
-    
-    # Additional complex terms for high simplification (beginners)
-    high_simplifications = {
-        r'\bobserve\b': 'see',
-        r'\bpursue\b': 'follow',
-        r'\bdevelop\b': 'grow',
-        r'\bconstruct\b': 'build',
-        r'\bmodify\b': 'change',
-        r'\binitial\b': 'first',
-        r'\bconcurrent\b': 'happening at the same time',
-        r'\bcoordinate\b': 'organize',
-        r'\bdelineate\b': 'describe',
-        r'\bdetermine\b': 'decide',
-        r'\bdisplay\b': 'show',
-        r'\bpresent\b': 'show',
-        r'\bdocument\b': 'record',
-        r'\bexecute\b': 'do',
-        r'\belaborate\b': 'explain more',
-        r'\benhance\b': 'improve',
-        r'\bevaluate\b': 'check',
-        r'\bidentify\b': 'find',
-        r'\billustrate\b': 'show',
-        r'\binclude\b': 'have',
-        r'\bmaintain\b': 'keep',
-        r'\bprovide\b': 'give',
-        r'\brequire\b': 'need',
-        r'\bselect\b': 'choose',
-        r'\btransform\b': 'change',
-        r'\btransmit\b': 'send',
-        r'\butilize\b': 'use',
-        r'\bvariable\b': 'changing',
-        r'\bsignificant\b': 'important',
-        r'\bprimary\b': 'main',
-        r'\bsecondary\b': 'less important',
-        r'\bcorrelation\b': 'connection',
-        r'\bcomplex\b': 'complicated',
-        r'\bsimplify\b': 'make easier',
-        r'\binteractive\b': 'works both ways',
-        r'\bintegrate\b': 'combine',
-        r'\boptimize\b': 'make better',
-        r'\bgenerate\b': 'create',
-        r'\bpopulate\b': 'fill',
-        r'\bcalculate\b': 'figure out',
-        r'\bperform\b': 'do',
-        r'\bexamine\b': 'look at',
-        r'\banalyze\b': 'study',
-        r'\bdemonstrate\b': 'show',
-        r'\bpreference\b': 'choice',
-        r'\bmechanism\b': 'method',
-        r'\binformation\b': 'details',
-        r'\butilization\b': 'use',
-        # More phrase substitutions
-        r'as a consequence of': 'because of',
-        r'for the most part': 'mostly',
-        r'in the absence of': 'without',
-        r'in conjunction with': 'with',
-        r'take into consideration': 'consider',
-        r'as a means of': 'to',
-        r'in accordance with': 'following',
-        r'within the realm of possibility': 'possible',
-        r'on a regular basis': 'regularly',
-        r'in a timely manner': 'quickly',
-        r'in close proximity to': 'near',
-    }
-    
-    # Medium-level simplifications are used by default (already defined in simplifications)
-    
-    # Only retain some simplifications for low level (advanced users)
-    low_simplifications = {
-        r'\bameliorate\b': 'improve',
-        r'\bnotwithstanding\b': 'still',
-        r'\bexacerbate\b': 'worsen',
-        r'\balleviate\b': 'ease',
-        r'\bplethora\b': 'many',
-        r'\bmyriad\b': 'many',
-        # Only replace the most complex phrases
-        r'due to the fact that': 'because',
-        r'in spite of the fact that': 'although',
-        r'for the purpose of': 'for',
-        r'at this point in time': 'now',
-    }
-    
-    # Choose which simplifications to apply based on level
-    replacements = {}
-    if simplification_level == "high":
-        # For beginners: apply both standard and additional simplifications
-        replacements = {**simplifications, **high_simplifications}
-    elif simplification_level == "medium":
-        # For intermediate: apply standard simplifications
-        replacements = simplifications
-    elif simplification_level == "low":
-        # For advanced: apply only minimal simplifications
-        replacements = low_simplifications
+    # Choose which simplifications to apply based on level: beginners ("high") get
+    # the standard and additional ones, intermediate ("medium") the standard ones
+    # and advanced ("low") only the minimal ones
+    replacements = _SIMPLIFICATION_PATTERNS.get(simplification_level, [])
     
     # Apply selected simplifications
     simplified_text = text
-    for complex_pattern, simple_word in replacements.items():
-        simplified_text = re.sub(complex_pattern, simple_word, simplified_text, flags=re.IGNORECASE)
+    for complex_pattern, simple_word in replacements:
+        simplified_text = complex_pattern.sub(simple_word, simplified_text)
     
     return simplified_text
 
+# Technical terms and their simple definitions
+_TECH_DEFINITIONS = {
+    # Technology
+    r'\b(artificial intelligence|AI)\b': 'computers that can learn and think',
+    r'\bmachine learning\b': 'technology that lets computers learn from examples',
+    r'\bdeep learning\b': 'advanced computer learning using brain-like networks',
+    r'\balgorithm\b': 'step-by-step instructions for computers',
+    r'\bblockchain\b': 'a secure digital record system',
+    r'\bcryptocurrency\b': 'digital money',
+    r'\bquantum computing\b': 'super-powerful computing using physics',
+    r'\bbig data\b': 'very large amounts of information',
+    r'\bcloud computing\b': 'using computers on the internet instead of locally',
+    r'\bvirtual reality\b': 'computer-created worlds you can see and interact with',
+    r'\baugmented reality\b': 'adding computer images to what you see in real life',
+    r'\binternet of things\b': 'everyday objects connected to the internet',
+    r'\bcybersecurity\b': 'keeping computer systems safe from attacks',
+    r'\bneural network\b': 'computer system inspired by the human brain',
+    r'\bmicroprocessor\b': 'tiny computer brain that processes information',
+    r'\bserver\b': 'powerful computer that provides services to other computers',
+    r'\bencryption\b': 'code that keeps information secret and safe',
+    r'\bprogramming language\b': 'special language used to give instructions to computers',
+    
+    # Science
+    r'\bphoton\b': 'tiny particle of light',
+    r'\bquantum physics\b': 'science of very tiny particles and how they behave',
+    r'\bmolecule\b': 'tiny group of atoms joined together',
+    r'\batom\b': 'tiny building block that makes up everything',
+    r'\bgene\b': 'part of your DNA that determines your traits',
+    r'\bDNA\b': 'molecule that contains instructions for how living things grow and function',
+    r'\bgenome\b': 'complete set of genetic instructions in a living thing',
+    r'\bprotein\b': 'important substance your body needs to work properly',
+    r'\bcell\b': 'tiny building block of all living things',
+    r'\bvirus\b': 'tiny germ that can make you sick',
+    r'\bbacteria\b': 'very small living things, some cause illness, some are helpful',
+    r'\becosystem\b': 'community of living things and their environment',
+    r'\bclimate change\b': 'long-term changes in Earth\'s weather patterns',
+    r'\brenewable energy\b': 'energy from sources that won\'t run out like sun and wind',
+    r'\bfossil fuel\b': 'fuel made from ancient plants and animals, like oil and coal',
+    
+    # Medicine
+    r'\bantibiotics\b': 'medicine that fights bacterial infections',
+    r'\bvaccine\b': 'medicine that helps prevent diseases',
+    r'\bimmune system\b': 'body\'s defense system against illness',
+    r'\bpandemic\b': 'disease outbreak that spreads across many countries',
+    r'\bviral\b': 'caused by a virus',
+    r'\bchronic\b': 'lasting a long time or recurring often',
+    
+    # Business/Economics
+    r'\binflation\b': 'rising prices and falling money value',
+    r'\bgross domestic product\b': 'total value of goods and services a country produces',
+    r'\bGDP\b': 'total value of goods and services a country produces',
+    r'\bstock market\b': 'where people buy and sell shares in companies',
+    r'\brecession\b': 'period when the economy slows down',
+    r'\bunemployment\b': 'when people don\'t have jobs but are looking for work',
+    r'\bsupply and demand\b': 'how available products and customer interest affect prices',
+    r'\bcapitalism\b': 'economic system where private businesses and individuals own things',
+    r'\bsocialism\b': 'economic system where the government owns or controls businesses',
+    
+    # History/Politics
+    r'\bdemocracy\b': 'system where citizens vote to elect leaders',
+    r'\bdictatorship\b': 'government ruled by one person with total power',
+    r'\bconstitution\b': 'basic set of laws that defines how a country works',
+    r'\blegislature\b': 'group of people who make laws',
+    r'\bjudiciary\b': 'court system that interprets laws',
+    r'\bexecutive branch\b': 'part of government that carries out laws',
+    r'\bcolonialism\b': 'when one country takes control of another',
+    r'\bimpact\b': 'strong effect or influence',
+    r'\bconsequence\b': 'result of an action',
+    
+    # Arts/Humanities
+    r'\brenaissance\b': 'period of new ideas and art in Europe from 14th to 17th century',
+    r'\bmodernism\b': 'new and experimental ideas in art, music, and literature',
+    r'\bpostmodernism\b': 'style that questions traditional ideas about art and culture',
+    r'\bimperial\b': 'relating to an empire or emperor',
+    r'\bmetaphor\b': 'describing something by comparing it to something else',
+    
+    # Mental concepts
+    r'\bparadigm\b': 'way of thinking or pattern',
+    r'\bcognitive\b': 'related to thinking and understanding',
+    r'\bintrinsic\b': 'belonging naturally',
+    r'\bextrinsic\b': 'coming from outside',
+    r'\bphilosophy\b': 'study of ideas about knowledge, truth, and the meaning of life',
+    r'\btheory\b': 'idea that explains something',
+    r'\bhypothesis\b': 'idea or explanation that can be tested',
+    
+    # General academic terms
+    r'\banalysis\b': 'careful study of something',
+    r'\bframework\b': 'basic structure of ideas or facts',
+    r'\bsynthesis\b': 'combining different ideas or things',
+    r'\bmethodology\b': 'way of doing something',
+    r'\bphenomenon\b': 'fact or event that can be observed',
+    r'\bparadigm shift\b': 'major change in thinking or practice',
+    r'\bconcept\b': 'idea or principle',
+    r'\bcontext\b': 'circumstances or setting'
+}
+
+_TECH_DEFINITION_PATTERNS = _compile_replacements(_TECH_DEFINITIONS)
+
 def add_simple_definitions(text: str) -> str:
     """
     Add simple definitions after technical terms to make them more understandable.
@@ -461,109 +591,13 @@ def add_simple_definitions(text: str) -> str:
     Returns:
         Text with simple definitions added for technical terms
     """
-    # Dictionary of technical terms and their simple definitions
-    tech_definitions = {
-        # Technology
-        r'\b(artificial intelligence|AI)\b': 'computers that can learn and think',
-        r'\bmachine learning\b': 'technology that lets computers learn from examples',
-        r'\bdeep learning\b': 'advanced computer learning using brain-like networks',
-        r'\balgorithm\b': 'step-by-step instructions for computers',
-        r'\bblockchain\b': 'a secure digital record system',
-        r'\bcryptocurrency\b': 'digital money',
-        r'\bquantum computing\b': 'super-powerful computing using physics',
-        r'\bbig data\b': 'very large amounts of information',
-        r'\bcloud computing\b': 'using computers on the internet instead of locally',
-        r'\bvirtual reality\b': 'computer-created worlds you can see and interact with',
-        r'\baugmented reality\b': 'adding computer images to what you see in real life',
-        r'\binternet of things\b': 'everyday objects connected to the internet',
-        r'\bcybersecurity\b': 'keeping computer systems safe from attacks',
-        r'\bneural network\b': 'computer system inspired by the human brain',
-        r'\bmicroprocessor\b': 'tiny computer brain that processes information',
-        r'\bserver\b': 'powerful computer that provides services to other computers',
-        r'\bencryption\b': 'code that keeps information secret and safe',
-        r'\bprogramming language\b': 'special language used to give instructions to computers',
-        
-        # Science
-        r'\bphoton\b': 'tiny particle of light',
-        r'\bquantum physics\b': 'science of very tiny particles and how they behave',
-        r'\bmolecule\b': 'tiny group of atoms joined together',
-        r'\batom\b': 'tiny building block that makes up everything',
-        r'\bgene\b': 'part of your DNA that determines your traits',
-        r'\bDNA\b': 'molecule that contains instructions for how living things grow and function',
-        r'\bgenome\b': 'complete set of genetic instructions in a living thing',
-        r'\bprotein\b': 'important substance your body needs to work properly',
-        r'\bcell\b': 'tiny building block of all living things',
-        r'\bvirus\b': 'tiny germ that can make you sick',
-        r'\bbacteria\b': 'very small living things, some cause illness, some are helpful',
-        r'\becosystem\b': 'community of living things and their environment',
-        r'\bclimate change\b': 'long-term changes in Earth\'s weather patterns',
-        r'\brenewable energy\b': 'energy from sources that won\'t run out like sun and wind',
-        r'\bfossil fuel\b': 'fuel made from ancient plants and animals, like oil and coal',
-        
-        # Medicine
-        r'\bantibiotics\b': 'medicine that fights bacterial infections',
-        r'\bvaccine\b': 'medicine that helps prevent diseases',
-        r'\bimmune system\b': 'body\'s defense system against illness',
-        r'\bpandemic\b': 'disease outbreak that spreads across many countries',
-        r'\bviral\b': 'caused by a virus',
-        r'\bchronic\b': 'lasting a long time or recurring often',
-        
-        # Business/Economics
-        r'\binflation\b': 'rising prices and falling money value',
-        r'\bgross domestic product\b': 'total value of goods and services a country produces',
-        r'\bGDP\b': 'total value of goods and services a country produces',
-        r'\bstock market\b': 'where people buy and sell shares in companies',
-        r'\brecession\b': 'period when the economy slows down',
-        r'\bunemployment\b': 'when people don\'t have jobs but are looking for work',
-        r'\bsupply and demand\b': 'how available products and customer interest affect prices',
-        r'\bcapitalism\b': 'economic system where private businesses and individuals own things',
-        r'\bsocialism\b': 'economic system where the government owns or controls businesses',
-        
-        # History/Politics
-        r'\bdemocracy\b': 'system where citizens vote to elect leaders',
-        r'\bdictatorship\b': 'government ruled by one person with total power',
-        r'\bconstitution\b': 'basic set of laws that defines how a country works',
-        r'\blegislature\b': 'group of people who make laws',
-        r'\bjudiciary\b': 'court system that interprets laws',
-        r'\bexecutive branch\b': 'part of government that carries out laws',
-        r'\bcolonialism\b': 'when one country takes control of another',
-        r'\bimpact\b': 'strong effect or influence',
-        r'\bconsequence\b': 'result of an action',
-        
-        # Arts/Humanities
-        r'\brenaissance\b': 'period of new ideas and art in Europe from 14th to 17th century',
-        r'\bmodernism\b': 'new and experimental ideas in art, music, and literature',
-        r'\bpostmodernism\b': 'style that questions traditional ideas about art and culture',
-        r'\bimperial\b': 'relating to an empire or emperor',
-        r'\bmetaphor\b': 'describing something by comparing it to something else',
-        
-        # Mental concepts
-        r'\bparadigm\b': 'way of thinking or pattern',
-        r'\bcognitive\b': 'related to thinking and understanding',
-        r'\bintrinsic\b': 'belonging naturally',
-        r'\bextrinsic\b': 'coming from outside',
-        r'\bphilosophy\b': 'study of ideas about knowledge, truth, and the meaning of life',
-        r'\btheory\b': 'idea that explains something',
-        r'\bhypothesis\b': 'idea or explanation that can be tested',
-        
-        # General academic terms
-        r'\banalysis\b': 'careful study of something',
-        r'\bframework\b': 'basic structure of ideas or facts',
-        r'\bsynthesis\b': 'combining different ideas or things',
-        r'\bmethodology\b': 'way of doing something',
-        r'\bphenomenon\b': 'fact or event that can be observed',
-        r'\bparadigm shift\b': 'major change in thinking or practice',
-        r'\bconcept\b': 'idea or principle',
-        r'\bcontext\b': 'circumstances or setting'
-    }
-    
     # Apply definitions but avoid repetition
     enhanced_text = text
     terms_added = set()
     
-    for term_pattern, definition in tech_definitions.items():
+    for term_pattern, definition in _TECH_DEFINITION_PATTERNS:
         # Check if the term exists in the text (case insensitive)
-        matches = re.finditer(term_pattern, enhanced_text, re.IGNORECASE)
+        matches = term_pattern.finditer(enhanced_text)
         for match in matches:
             exact_match = match.group(0)
             if exact_match not in terms_added:
@@ -591,8 +625,8 @@ def format_bullet_points(bullets: str) -> str:
         return ""
     
     # Normalize bullet markers
-    normalized = re.sub(r'^\s*[•\*\-]\s+', '• ', bullets, flags=re.MULTILINE)
-    normalized = re.sub(r'^\s*(\d+)[\.\)]\s+', '• ', normalized, flags=re.MULTILINE)
+    normalized = _BULLET_MARKER.sub('• ', bullets)
+    normalized = _NUMBER_MARKER.sub('• ', normalized)
     
     # Ensure each bullet point starts with a capital letter and ends with a period
     lines = normalized.strip().split('\n')
@@ -619,13 +653,17 @@ def format_bullet_points(bullets: str) -> str:
     
     return '\n'.join(formatted_lines)
 
-def correct_spelling(text: str, known_words: List[str] = None) -> str:
+@lru_cache(maxsize=_TOPIC_MEMO_SIZE)
+def correct_spelling(text: str, known_words: Optional[Tuple[str, ...]] = None) -> str:
     """
     Enhanced spelling correction for topics.
     
+    Results are memoized, since the same topic is corrected by several steps
+    of each request.
+    
     Args:
         text: Text to correct
-        known_words: List of known correct words to check against
+        known_words: Tuple of known correct words to check against
         
     Returns:
         Corrected text
@@ -679,7 +717,7 @@ def correct_spelling(text: str, known_words: List[str] = None) -> str:
         return corrections[lower_text]
         
     # Clean up text: remove multiple spaces, handle hyphenation
-    cleaned_text = re.sub(r'\s+', ' ', text).strip()
+    cleaned_text = _WHITESPACE_RUN.sub(' ', text).strip()
     
     # Fix common capitalization issues in multi-word topics
     if ' ' in cleaned_text:
@@ -701,20 +739,7 @@ def correct_spelling(text: str, known_words: List[str] = None) -> str:
     # For advanced spelling correction, we would use a library like pyspellchecker,
     # but for simplicity we're implementing some basic corrections
     # 1. Fix simple doubled letters: e.g., "appple" -> "apple"
-    doubled_letter_pattern = re.compile(r'([a-zA-Z])\1{2,}')
-    corrected = doubled_letter_pattern.sub(r'\1\1', cleaned_text)
-    
-    # 2. Fix simple missing vowels if it looks like they're missing
-    vowel_pattern = re.compile(r'([bcdfghjklmnpqrstvwxyz]{3,})')
-    
-    def add_vowel(match):
-        consonant_cluster = match.group(1)
-        # Only do this for reasonable clusters that are likely missing a vowel
-        if len(consonant_cluster) >= 3:
-            # Insert 'e' as a default vowel
-            middle = len(consonant_cluster) // 2
-            return consonant_cluster[:middle] + 'e' + consonant_cluster[middle:]
-        return consonant_cluster
+    corrected = _TRIPLED_LETTER.sub(r'\1\1', cleaned_text)
     
     # Only apply advanced corrections if text doesn't match common patterns
     if corrected != cleaned_text:
@@ -723,6 +748,22 @@ def correct_spelling(text: str, known_words: List[str] = None) -> str:
     # If no other corrections applied, return the cleaned text
     return cleaned_text 
 
+# Common phrases and their more poetic alternatives
+_POETIC_SUBSTITUTIONS = {
+    r'\bin addition\b': 'like whispers on wind',
+    r'\bfurthermore\b': 'as the story unfolds',
+    r'\btherefore\b': 'thus, like rivers to sea',
+    r'\bconsequently\b': 'and so, as fate would have it',
+    r'\bhowever\b': 'yet, in contrast',
+    r'\bfor example\b': 'imagine, if you will',
+    r'\bsuch as\b': 'like',
+    r'\bin conclusion\b': 'as our journey ends',
+    r'\bfinally\b': 'at last, like dawn after night',
+    r'\badditionally\b': 'dancing alongside this truth',
+}
+
+_POETIC_SUBSTITUTION_PATTERNS = _compile_replacements(_POETIC_SUBSTITUTIONS)
+
 def enhance_poetic_language(text: str, temperature: float = 0.7) -> str:
     """
     Enhances text with poetic devices like alliteration, metaphors, and rhythm.
@@ -738,30 +779,16 @@ def enhance_poetic_language(text: str, temperature: float = 0.7) -> str:
     if temperature < 0.6:
         return text
     
-    # Replace some common phrases with more poetic alternatives
-    poetic_substitutions = {
-        r'\bin addition\b': 'like whispers on wind',
-        r'\bfurthermore\b': 'as the story unfolds',
-        r'\btherefore\b': 'thus, like rivers to sea',
-        r'\bconsequently\b': 'and so, as fate would have it',
-        r'\bhowever\b': 'yet, in contrast',
-        r'\bfor example\b': 'imagine, if you will',
-        r'\bsuch as\b': 'like',
-        r'\bin conclusion\b': 'as our journey ends',
-        r'\bfinally\b': 'at last, like dawn after night',
-        r'\badditionally\b': 'dancing alongside this truth',
-    }
-    
     # Apply substitutions based on temperature
     substitution_count = 0
     max_substitutions = int(5 * temperature)  # Limit based on temperature
     
-    for pattern, replacement in poetic_substitutions.items():
+    for pattern, replacement in _POETIC_SUBSTITUTION_PATTERNS:
         if substitution_count >= max_substitutions:
             break
             
-        if re.search(pattern, text, re.IGNORECASE):
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE, count=1)
+        if pattern.search(text):
+            text = pattern.sub(replacement, text, count=1)
             substitution_count += 1
     
     return text 
\ No newline at end of file
@@ -5,10 +5,28 @@ Input validation utilities for the CONTRA application.
 import re
 from typing import Dict, Any, List, Optional, Tuple, Union
 
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from config import ContentConfig
+
 # Regular expressions for validation
 TOPIC_PATTERN = r'^[\w\s\-\',.!?&:()]{3,100}$'
 COLOR_PATTERN = r'^#(?:[0-9a-fA-F]{3}){1,2}$|^[a-zA-Z]+$'  # Hex or named colors
 
+# Expertise levels accepted by the narrative endpoints
+EXPERTISE_LEVELS = frozenset({'beginner', 'intermediate', 'advanced'})
+
+# Conversation history limits
+CONVERSATION_ROLES = frozenset({'user', 'ai', 'system'})
+MAX_HISTORY_MESSAGE_LENGTH = 4096
+
+# Accepted sampling temperature range
+TEMP_LO, TEMP_HI = 0.1, 1.0
+
+def clamp_temperature(temperature: float) -> float:
+    """Clamp a sampling temperature to [TEMP_LO, TEMP_HI] (NaN maps to TEMP_LO)."""
+    return TEMP_LO if not temperature >= TEMP_LO else TEMP_HI if temperature > TEMP_HI else temperature
+
 def validate_topic(topic: str) -> Tuple[bool, Optional[str]]:
     """
     Validate a topic string.
@@ -80,9 +98,8 @@ def validate_input(data: Dict[str, Any]) -> Tuple[bool, Optional[str], Optional[
     # Validate optional fields
     
     # Tone
-    valid_tones = ['informative', 'dramatic', 'poetic', 'humorous', 'technical', 'simple']
     tone = data.get('tone', 'informative').lower()
-    if tone not in valid_tones:
+    if tone not in ContentConfig.VALID_TONES:
         tone = 'informative'  # Default to informative if invalid
     normalized['tone'] = tone
     
@@ -112,7 +129,7 @@ def validate_input(data: Dict[str, Any]) -> Tuple[bool, Optional[str], Optional[
         
         # Max length
         try:
-            max_length = int(adv_data.get('max_length', 1024))
+            max_length = int(adv_data.get('max_length', ContentConfig.DEFAULT_MAX_LENGTH))
             if 256 <= max_length <= 4096:
                 advanced['max_length'] = max_length
         except (ValueError, TypeError):
@@ -129,4 +146,85 @@ def validate_input(data: Dict[str, Any]) -> Tuple[bool, Optional[str], Optional[
         if advanced:
             normalized['advanced'] = advanced
     
-    return True, None, normalized 
\ No newline at end of file
+    return True, None, normalized
+
+
+def sanitize_conversation_history(history: Any, max_messages: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    Keep the most recent well-formed conversation messages.
+    
+    Entries that are not dicts with a known role and string content are dropped,
+    and each message's content is truncated to MAX_HISTORY_MESSAGE_LENGTH characters.
+    
+    Args:
+        history: Client-supplied conversation history
+        max_messages: Maximum number of messages to keep (defaults to ContentConfig.CONVERSATION_MAX_HISTORY)
+    
+    Returns:
+        List of {"role", "content"} message dicts
+    """
+    if not isinstance(history, list):
+        return []
+    
+    if max_messages is None:
+        max_messages = ContentConfig.CONVERSATION_MAX_HISTORY
+    
+    messages = [
+        {'role': msg['role'], 'content': msg['content'][:MAX_HISTORY_MESSAGE_LENGTH]}
+        for msg in history
+        if isinstance(msg, dict)
+        and isinstance(msg.get('role'), str)
+        and msg['role'] in CONVERSATION_ROLES
+        and isinstance(msg.get('content'), str)
+    ]
+    return messages[-max_messages:] if max_messages > 0 else []
+
+
+class GenerateRequest(BaseModel):
+    """
+    Request parameters for the /api/generate endpoint.
+    
+    Unknown tones and expertise levels and unparseable variant counts and
+    temperatures fall back to their defaults rather than failing. Variants are
+    clamped to [1, 5] and temperature to [0.1, 1.0].
+    """
+    model_config = ConfigDict(str_strip_whitespace=True)
+    
+    topic: str = Field(min_length=1)
+    tone: str = ContentConfig.DEFAULT_TONE
+    variants: int = Field(default=ContentConfig.DEFAULT_NUM_VARIANTS, ge=1, le=5)
+    max_length: int = Field(default=ContentConfig.DEFAULT_MAX_LENGTH, ge=256, le=4096)
+    temperature: float = ContentConfig.DEFAULT_TEMPERATURE
+    expertise_level: str = 'intermediate'
+    
+    @field_validator('tone', mode='before')
+    @classmethod
+    def _default_tone(cls, value: Any) -> Any:
+        if not isinstance(value, str) or value.strip().lower() not in ContentConfig.VALID_TONES:
+            return ContentConfig.DEFAULT_TONE
+        return value.strip().lower()
+    
+    @field_validator('variants', mode='before')
+    @classmethod
+    def _clamp_variants(cls, value: Any) -> int:
+        try:
+            variants = int(float(value))
+        except (ValueError, TypeError, OverflowError):
+            return ContentConfig.DEFAULT_NUM_VARIANTS
+        return max(1, min(variants, 5))
+    
+    @field_validator('expertise_level', mode='before')
+    @classmethod
+    def _default_expertise_level(cls, value: Any) -> Any:
+        if not isinstance(value, str) or value not in EXPERTISE_LEVELS:
+            return 'intermediate'
+        return value
+    
+    @field_validator('temperature', mode='before')
+    @classmethod
+    def _clamp_temperature(cls, value: Any) -> float:
+        try:
+            temperature = float(value) if value is not None else ContentConfig.DEFAULT_TEMPERATURE
+        except (ValueError, TypeError):
+            temperature = ContentConfig.DEFAULT_TEMPERATURE
+        return clamp_temperature(temperature)